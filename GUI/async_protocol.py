@@ -0,0 +1,431 @@
+# Import Required Modules
+import asyncio
+import time
+
+# Import shared protocol helpers
+from GUI.device_protocol import (
+    AdaptivePacer,
+    file_from_device_exit_status,
+)
+from GUI.protocol_log import PROTOCOL_LOG
+
+# Used for type hinting
+from typing import Any, Awaitable, Callable
+
+# pyserial-asyncio is optional, it is only required to open serial ports.
+# The protocol itself runs over any asyncio reader/writer pair.
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+# String Constants
+EMPTY_STRING = ""
+NEWLINE = "\n"
+
+# Sequence file constants
+BUFFER = "---"
+BAR_DIVIDER = ","
+FILE_END = ";"
+
+# File handling Modes
+WRITE_MODE = 'w'
+
+# Serial communication indicator characters
+SQ_TO_EEPROM_CHAR = 'E'
+TW_TO_EEPROM_CHAR = 'T'
+REQUEST_TIMING_WINDOWS_CODE = 'W'
+END_TRANSFER = 'X'
+
+# New comm protocol
+READY_CODE = "RDY"
+NULL_CHAR = '\x00'
+
+# Serial communication baud rate, and encoding type
+BAUD_RATE = 9600
+DATA_ENCODING_TYPE = "ascii"
+
+# Process Exit Codes
+STATUS_TIMEOUT = -1
+STATUS_SUCCESS = 0
+STATUS_UNKNOWN_ERROR = 8
+
+# Maximum time (in seconds) to wait
+# on process before exiting task
+MAX_WAIT_TIME = 5
+
+DECENT_WAIT = 0.1  # 100 ms
+
+
+class AsyncDeviceProtocol:
+    '''
+    A class implementing the serial communication protocol spoken by the
+    micro-controller (the S/E/B/T/R/N/W command codes, the ready handshake
+    and end of transfer marker), over an asyncio reader/writer pair.
+
+    Waiting on the device never blocks the event loop, so a single loop
+    can drive many devices at once. The loop may be run headless with
+    asyncio.run(), or integrated with the Qt event loop (e.g. by qasync).
+
+    Commands sent over the same connection are run one at a time.
+    '''
+    def __init__(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+    ) -> None:
+        ''' Initialises the protocol over an open reader/writer pair '''
+        self._reader = reader
+        self._writer = writer
+        self._lock = asyncio.Lock()
+        self._response_code = STATUS_SUCCESS
+
+        # Paces line uploads to RAM, see GUI/device_protocol.py
+        self._pacer = AdaptivePacer()
+
+    @classmethod
+    async def open(cls, port: str) -> "AsyncDeviceProtocol":
+        '''
+        Opens a serial connection on the given port at BAUD_RATE.
+        Requires the optional pyserial-asyncio package.
+
+        Parameters:
+            port (str): Serial port name (e.g. COM3)
+
+        Returns:
+            (AsyncDeviceProtocol): Protocol over the opened connection
+        '''
+        if (serial_asyncio is None):
+            raise ImportError(
+                "pyserial-asyncio is required to open serial ports "
+                "asynchronously"
+            )
+
+        reader, writer = await serial_asyncio.open_serial_connection(
+            url=port,
+            baudrate=BAUD_RATE,
+        )
+        return cls(reader, writer)
+
+    def get_response_code(self) -> int:
+        ''' Returns the most recent response code '''
+        return self._response_code
+
+    def get_pacer(self) -> AdaptivePacer:
+        ''' Returns the pacer used for line uploads to RAM '''
+        return self._pacer
+
+    def set_response_code(self, response: int) -> None:
+        ''' Set most recent response code '''
+        self._response_code = response
+
+    async def close(self) -> None:
+        ''' Closes the connection '''
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def write(self, data: str) -> None:
+        '''
+        Encodes and writes data to the connection, waiting until the
+        transport has room for more.
+        '''
+        self._writer.write(data.encode(DATA_ENCODING_TYPE))
+        await self._writer.drain()
+
+    async def readline_before(self, deadline: float) -> str:
+        '''
+        Reads a line from the connection, waiting until a full line
+        arrives or the deadline passes.
+
+        Parameters:
+            deadline (float): time.monotonic() value to stop waiting at
+
+        Returns:
+            (str): Line read, or an empty string if the deadline passed
+        '''
+        remaining = deadline - time.monotonic()
+        if (remaining <= 0):
+            return EMPTY_STRING
+
+        # Partial lines stay buffered by the reader if the wait times out
+        try:
+            data = await asyncio.wait_for(self._reader.readline(), remaining)
+        except asyncio.TimeoutError:
+            return EMPTY_STRING
+
+        if (data == b"") and self._reader.at_eof():
+            raise ConnectionResetError("Device connection closed")
+
+        line = (
+            data
+            .decode(DATA_ENCODING_TYPE, errors="ignore")
+            .strip()
+            .lstrip(NULL_CHAR)
+            .rstrip(NULL_CHAR)
+        )
+        return line
+
+    async def wait_for_response(
+            self,
+            code: str,
+            timeout: float = MAX_WAIT_TIME,
+    ) -> int:
+        '''
+        Wait for response code from device.
+
+        Parameters:
+            code (str): Code to wait for
+            timeout (float): Maximum time to wait for the code (in seconds)
+
+        Returns:
+            (int): Exit status of process
+        '''
+        deadline = time.monotonic() + timeout
+        while (time.monotonic() < deadline):
+            line = await self.readline_before(deadline)
+
+            # If no data read before the deadline
+            if (line == EMPTY_STRING):
+                continue
+
+            if (line == code):
+                self.set_response_code(STATUS_SUCCESS)
+                return STATUS_SUCCESS
+
+            PROTOCOL_LOG.debug(
+                "Waiting for response",
+                expected=code,
+                line=line,
+            )
+
+        self.set_response_code(STATUS_TIMEOUT)
+        return STATUS_TIMEOUT
+
+    async def transfer_sequence(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int:
+        '''
+        Transfers a sequence to the device, sending metadata and beats
+        line by line. EEPROM uploads wait for the ready code before
+        each beat, RAM uploads are paced by the device receive buffer.
+
+        Parameters:
+            code (str): Code indicating the memory location (S, E or B)
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process
+        '''
+        flow_control_active = (code == SQ_TO_EEPROM_CHAR)
+
+        async with self._lock:
+            await self.write(code)
+            start = time.monotonic()
+            if (await self.wait_for_response(READY_CODE) == STATUS_TIMEOUT):
+                return STATUS_TIMEOUT
+            handshake_time = time.monotonic() - start
+
+            # Transmit sequence metadata, each parameter newline terminated
+            await self.write(
+                EMPTY_STRING.join(f"{param}{NEWLINE}" for param in parameters)
+            )
+            await asyncio.sleep(DECENT_WAIT)
+
+            if (not flow_control_active):
+                return await self.send_paced_beats(beats, handshake_time)
+
+            # --- Transmit sequence beats ---
+            for line in beats:
+
+                # EEPROM mode, wait for ready signal
+                status = await self.wait_for_response(READY_CODE)
+                if (status == STATUS_TIMEOUT):
+                    return STATUS_TIMEOUT
+
+                await self.write(line)
+
+            return await self.wait_for_response(END_TRANSFER)
+
+    async def send_paced_beats(
+            self,
+            beats: list[str],
+            handshake_time: float,
+    ) -> int:
+        '''
+        Sends beats in chunks that fit the device receive buffer, waiting
+        between chunks for the device to handle them.
+
+        Parameters:
+            beats (list[str]): Newline terminated beat lines
+            handshake_time (float): Time the device took to answer the
+                upload code
+
+        Returns:
+            (int): Exit status of process
+        '''
+        pacer = self.get_pacer()
+        chunks = pacer.split(beats)
+        start = time.monotonic()
+        for index, chunk in enumerate(chunks):
+            if (index != 0):
+                await asyncio.sleep(pacer.get_delay(len(chunks[index - 1])))
+            await self.write(EMPTY_STRING.join(chunk))
+
+        status = await self.wait_for_response(END_TRANSFER)
+        if (status == STATUS_SUCCESS):
+            pacer.record_success(
+                time.monotonic() - start - handshake_time,
+                len(beats),
+            )
+        else:
+            pacer.record_failure()
+        return status
+
+    async def transfer_windows(self, windows: tuple) -> int:
+        '''
+        Transfers timing window values to the micro-controller.
+
+        Parameters:
+            windows (tuple): Timing window values in milliseconds
+
+        Returns:
+            (int): Exit status of process
+        '''
+        async with self._lock:
+            await self.write(TW_TO_EEPROM_CHAR)
+            if (await self.wait_for_response(READY_CODE) == STATUS_TIMEOUT):
+                return STATUS_TIMEOUT
+
+            # Transmit all timing window values, all are newline terminated
+            await self.write(
+                EMPTY_STRING.join(f"{param}{NEWLINE}" for param in windows)
+            )
+
+            return await self.wait_for_response(END_TRANSFER)
+
+    async def request_timing_windows(self) -> tuple[int, tuple | None]:
+        '''
+        Requests the current timing window settings from the micro-controller.
+
+        Returns:
+            (tuple): Exit status of process, and the timing windows read
+            (None if no windows were read)
+        '''
+        async with self._lock:
+            await self.write(REQUEST_TIMING_WINDOWS_CODE)
+
+            timing_windows = []
+            deadline = time.monotonic() + MAX_WAIT_TIME
+            while (time.monotonic() < deadline):
+                line = await self.readline_before(deadline)
+                if (line == EMPTY_STRING):
+                    continue
+
+                # Append each value to timing windows list
+                if (line != END_TRANSFER):
+                    timing_windows.append(int(line))
+
+                # End of Transfer reached
+                elif (len(timing_windows) != 0):
+                    return (STATUS_SUCCESS, tuple(timing_windows))
+
+                # Error with reading
+                else:
+                    return (STATUS_UNKNOWN_ERROR, None)
+
+            return (STATUS_TIMEOUT, None)
+
+    async def get_file_from_device(self, code: str, path: str) -> int:
+        '''
+        Retrieves a sequence file stored on the micro-controllers
+        RAM or EEPROM, and saves it locally in the .tsq sequence file format.
+
+        The file is only written once the whole transfer has been received,
+        so the event loop is never blocked on disk writes mid-transfer.
+
+        Parameters:
+            code (str): Code indicating the memory location (R or N)
+            path (str): Path to save the sequence file to
+
+        Returns:
+            (int): Exit status of process
+        '''
+        async with self._lock:
+            await self.write(code)
+
+            lines = []
+            beat_counter = 0
+            buffer_reached = False
+            deadline = time.monotonic() + MAX_WAIT_TIME
+            while (time.monotonic() < deadline):
+                line = await self.readline_before(deadline)
+                if (line == EMPTY_STRING):
+                    continue
+
+                # Data arrived, restart the idle timeout
+                deadline = time.monotonic() + MAX_WAIT_TIME
+
+                if (line == END_TRANSFER):
+                    lines.append(FILE_END)
+                    break
+
+                # Detect buffer has been reached,
+                # and initialise beat counter.
+                if (line == BUFFER):
+                    buffer_reached = True
+                    beat_counter = 0
+                    lines.append(BUFFER)
+                    continue
+
+                # Write a bar divider between every fourth beat
+                if (buffer_reached):
+                    if (beat_counter == 4):
+                        lines.append(BAR_DIVIDER)
+                        beat_counter = 0
+                    beat_counter += 1
+
+                lines.append(line)
+
+            else:
+                return STATUS_TIMEOUT
+
+        with open(path, WRITE_MODE) as file:
+            file.write(EMPTY_STRING.join(f"{line}\n" for line in lines))
+
+        return file_from_device_exit_status(code)
+
+
+async def run_on_ports(
+        ports: list[str],
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+) -> dict[str, Any]:
+    '''
+    Runs the same protocol command on several devices concurrently,
+    from a single event loop.
+
+    Parameters:
+        ports (list[str]): Serial port names
+        command (Callable): AsyncDeviceProtocol method to run, called
+            with the protocol as its first argument, followed by args
+
+    Returns:
+        (dict): Result of the command for each port, or the exception
+        raised if the command failed
+    '''
+    async def run_on_port(port: str) -> Any:
+        protocol = await AsyncDeviceProtocol.open(port)
+        try:
+            return await command(protocol, *args)
+        finally:
+            await protocol.close()
+
+    results = await asyncio.gather(
+        *(run_on_port(port) for port in ports),
+        return_exceptions=True,
+    )
+    return dict(zip(ports, results))
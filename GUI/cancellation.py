@@ -0,0 +1,72 @@
+'''
+Cooperative cancellation of device commands. The GUI cancels a token,
+and the command running on the serial service thread stops at its next
+check, or as soon as its blocking read is interrupted.
+'''
+# Import Required Modules
+import threading
+
+# Used for type hinting
+from typing import Callable
+
+
+class TransferCancelled(Exception):
+    ''' Raised within a device command once it has been cancelled '''
+
+
+class CancellationToken:
+    '''
+    Signals a device command running on another thread to stop.
+
+    Protocol loops check the token, and callbacks added to it (e.g. one
+    interrupting a blocking serial read) run once it is cancelled.
+    '''
+    def __init__(self) -> None:
+        ''' Initialises a token that has not been cancelled '''
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    def is_cancelled(self) -> bool:
+        ''' Returns True once the token has been cancelled '''
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        ''' Cancels the token, running every callback added to it '''
+        with self._lock:
+            if (self._event.is_set()):
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        '''
+        Adds a callback to run once the token is cancelled, from the
+        cancelling thread. Runs it immediately if already cancelled.
+        '''
+        with self._lock:
+            if (not self._event.is_set()):
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self) -> None:
+        '''
+        Raises:
+            TransferCancelled: If the token has been cancelled
+        '''
+        if (self._event.is_set()):
+            raise TransferCancelled()
+
+    def sleep(self, seconds: float) -> None:
+        '''
+        Sleeps for the given time, waking early if cancelled.
+
+        Raises:
+            TransferCancelled: If the token is cancelled
+        '''
+        if (self._event.wait(seconds)):
+            raise TransferCancelled()
@@ -0,0 +1,305 @@
+'''
+Runs device operations from the command line, without the GUI.
+
+Neither Qt nor pygame is imported, so provisioning scripts can drive many
+devices without paying for their startup. Commands taking ports run on
+every device found when no port is given, one worker per device.
+
+Run with:
+    python -m GUI.device_cli discover
+    python -m GUI.device_cli upload SEQUENCE [PORT ...] [--location L]
+    python -m GUI.device_cli download PORT {ram,eeprom} PATH
+    python -m GUI.device_cli read-windows [PORT ...]
+    python -m GUI.device_cli write-windows W W W W [PORT ...]
+
+Results are printed to stdout, one tab-separated line per device, and
+protocol debugging output to stderr. Exits with 1 if any device failed.
+With --dump-log, the protocol diagnostics kept in memory (at the level
+given by --log-level) are written to stderr once the command finishes.
+'''
+# Import Required Modules
+import argparse
+import contextlib
+import sys
+
+# Used for type hinting
+from typing import Any
+
+# Import device protocol, discovery, and multi-device commands
+from GUI.device_protocol import (
+    DeviceProtocol,
+    IDENTIFY_TIMEOUT,
+    timing_windows_in_order,
+)
+from GUI.device_discovery import discover_devices
+from GUI.fleet_upload import (
+    push_timing_windows,
+    run_on_ports,
+    upload_to_ports,
+)
+from GUI.sequence_class import Sequence
+from GUI.protocol_log import LEVEL_NAMES, PROTOCOL_LOG, parse_level
+
+# Serial communication indicator characters
+SQ_TO_RAM_CHAR = 'S'
+SQ_TO_EEPROM_CHAR = 'E'
+SQ_TO_BOTH_CHAR = 'B'
+LOAD_SQ_FROM_RAM_CODE = 'R'
+LOAD_SQ_FROM_EEPROM_CODE = 'N'
+
+# Memory locations, as given on the command line
+RAM = "ram"
+EEPROM = "eeprom"
+BOTH = "both"
+UPLOAD_CODES = {
+    RAM: SQ_TO_RAM_CHAR,
+    EEPROM: SQ_TO_EEPROM_CHAR,
+    BOTH: SQ_TO_BOTH_CHAR,
+}
+DOWNLOAD_CODES = {
+    RAM: LOAD_SQ_FROM_RAM_CODE,
+    EEPROM: LOAD_SQ_FROM_EEPROM_CODE,
+}
+
+# Timing window settings
+TIMING_WINDOW_LENGTH = 4
+
+# Audio length sent when no length is given, as the GUI does without audio
+DEFAULT_AUDIO_LENGTH_TEXT = "00:00"
+
+# Process Exit Codes
+STATUS_TIMEOUT = -1
+STATUS_SUCCESS = 0
+STATUS_RECEIVED_EEPROM_TSQ = 4
+STATUS_RECEIVED_RAM_TSQ = 5
+STATUS_UNKNOWN_ERROR = 8
+STATUS_VERIFICATION_FAILED = 16
+
+# Text printed for each exit status
+STATUS_TEXT = {
+    STATUS_TIMEOUT: "timeout",
+    STATUS_SUCCESS: "ok",
+    STATUS_RECEIVED_EEPROM_TSQ: "ok",
+    STATUS_RECEIVED_RAM_TSQ: "ok",
+    STATUS_UNKNOWN_ERROR: "error",
+    STATUS_VERIFICATION_FAILED: "diverged",
+}
+SUCCESS_STATUSES = (
+    STATUS_SUCCESS,
+    STATUS_RECEIVED_EEPROM_TSQ,
+    STATUS_RECEIVED_RAM_TSQ,
+)
+
+# Command Exit Codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+FIELD_SEPARATOR = "\t"
+VALUE_SEPARATOR = ","
+
+
+def resolve_ports(ports: list[str], timeout: float) -> list[str]:
+    '''
+    Returns the ports given, or those of every device found if none were.
+
+    Parameters:
+        ports (list[str]): Serial port names given on the command line
+        timeout (float): Maximum time to wait for each probe (in seconds)
+    '''
+    if (ports):
+        return ports
+    return [device.get_port() for device in discover_devices(None, timeout)]
+
+
+def print_result(port: str, result: Any) -> bool:
+    '''
+    Prints the result of a command on a device, as its port, status, and
+    any timing windows read.
+
+    Parameters:
+        port (str): Serial port name
+        result (Any): Exit status, exit status and timing windows read, or
+            the exception raised
+
+    Returns:
+        (bool): True if the command succeeded
+    '''
+    windows = None
+    if (isinstance(result, tuple)):
+        result, windows = result
+
+    if (isinstance(result, Exception)):
+        fields = [port, "failed", f"{type(result).__name__}: {result}"]
+        succeeded = False
+    else:
+        fields = [port, STATUS_TEXT.get(result, f"status {result}")]
+        succeeded = (result in SUCCESS_STATUSES)
+
+    if (windows is not None):
+        fields.append(VALUE_SEPARATOR.join(str(value) for value in windows))
+
+    print(FIELD_SEPARATOR.join(fields), file=sys.__stdout__, flush=True)
+    return succeeded
+
+
+def print_results(results: dict[str, Any]) -> int:
+    '''
+    Prints the result of a command on each device.
+
+    Returns:
+        (int): EXIT_SUCCESS if every command succeeded, else EXIT_FAILURE
+    '''
+    succeeded = [
+        print_result(port, result) for port, result in results.items()
+    ]
+    if (succeeded) and (all(succeeded)):
+        return EXIT_SUCCESS
+    return EXIT_FAILURE
+
+
+def discover(args: argparse.Namespace) -> int:
+    ''' Prints each device found, with its firmware version '''
+    devices = discover_devices(None, args.timeout)
+    for device in devices:
+        print(
+            FIELD_SEPARATOR.join((
+                device.get_port(),
+                device.get_firmware_version(),
+                device.get_description(),
+            )),
+            file=sys.__stdout__,
+            flush=True,
+        )
+    return EXIT_SUCCESS
+
+
+def upload(args: argparse.Namespace) -> int:
+    ''' Uploads a sequence file to each device '''
+    sequence = Sequence()
+    sequence.set_sequence_path(args.sequence)
+    sequence.parse_sequence()
+
+    results = upload_to_ports(
+        resolve_ports(args.ports, args.timeout),
+        UPLOAD_CODES[args.location],
+        sequence.get_transfer_parameters(args.length),
+        sequence.get_transfer_beats(),
+    )
+    return print_results(results)
+
+
+def download(args: argparse.Namespace) -> int:
+    ''' Saves the sequence stored on a device to a file '''
+    def get_file(protocol: DeviceProtocol) -> int:
+        return protocol.get_file_from_device(
+            DOWNLOAD_CODES[args.location],
+            args.path,
+        )
+
+    return print_results(run_on_ports([args.port], get_file))
+
+
+def read_windows(args: argparse.Namespace) -> int:
+    ''' Prints the timing windows of each device '''
+    results = run_on_ports(
+        resolve_ports(args.ports, args.timeout),
+        DeviceProtocol.request_timing_windows,
+    )
+    return print_results(results)
+
+
+def write_windows(args: argparse.Namespace) -> int:
+    ''' Saves timing windows to each device, verifying them by readback '''
+    windows = tuple(args.windows)
+    results = push_timing_windows(
+        resolve_ports(args.ports, args.timeout),
+        windows,
+    )
+    return print_results(results)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ''' Builds the parser of each command, and its arguments '''
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=IDENTIFY_TIMEOUT,
+        help="Time to wait for each device to answer discovery (seconds)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=[name.lower() for name in LEVEL_NAMES.values()],
+        default=LEVEL_NAMES[PROTOCOL_LOG.get_level()].lower(),
+        help="Level of protocol diagnostics kept",
+    )
+    parser.add_argument(
+        "--dump-log",
+        action="store_true",
+        help="Write protocol diagnostics to stderr when finished",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("discover", help="List devices found")
+    command.set_defaults(run=discover)
+
+    command = commands.add_parser("upload", help="Save a sequence file")
+    command.add_argument("sequence", help="Path of the .tsq file")
+    command.add_argument("ports", nargs="*")
+    command.add_argument(
+        "--location",
+        choices=UPLOAD_CODES,
+        default=RAM,
+    )
+    command.add_argument(
+        "--length",
+        default=DEFAULT_AUDIO_LENGTH_TEXT,
+        help="Audio length shown on the device, as MM:SS",
+    )
+    command.set_defaults(run=upload)
+
+    command = commands.add_parser("download", help="Save a device sequence")
+    command.add_argument("port")
+    command.add_argument("location", choices=DOWNLOAD_CODES)
+    command.add_argument("path", help="Path to save the .tsq file to")
+    command.set_defaults(run=download)
+
+    command = commands.add_parser("read-windows", help="Print timing windows")
+    command.add_argument("ports", nargs="*")
+    command.set_defaults(run=read_windows)
+
+    command = commands.add_parser("write-windows", help="Save timing windows")
+    command.add_argument(
+        "windows",
+        type=int,
+        nargs=TIMING_WINDOW_LENGTH,
+        help="Timing windows in milliseconds, in increasing order",
+    )
+    command.add_argument("ports", nargs="*")
+    command.set_defaults(run=write_windows)
+
+    return parser
+
+
+def main() -> None:
+    ''' Parses command line arguments, and runs the command '''
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if (args.command == "write-windows") and (
+            not timing_windows_in_order(args.windows)):
+        parser.error("timing windows must be in increasing order")
+
+    PROTOCOL_LOG.set_level(parse_level(args.log_level))
+
+    # Protocol debugging prints go to stderr, keeping stdout machine-readable
+    with contextlib.redirect_stdout(sys.stderr):
+        status = args.run(args)
+
+    if (args.dump_log):
+        PROTOCOL_LOG.dump(sys.stderr)
+    sys.exit(status)
+
+
+if (__name__ == "__main__"):
+    main()
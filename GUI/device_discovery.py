@@ -0,0 +1,182 @@
+'''
+Finds tpmania cabinets connected to this computer, on Windows, Linux and
+macOS. Every serial port is probed at once, and only ports answering as
+a tpmania device are reported, alongside their firmware version.
+
+Run standalone with:
+    python -m GUI.device_discovery [--timeout S] [ports ...]
+'''
+# Import Required Modules
+import argparse
+import concurrent.futures
+import serial
+import serial.tools.list_ports
+
+# Import device protocol
+from GUI.device_protocol import (
+    DeviceProtocol,
+    BAUD_RATE,
+    IDENTIFY_TIMEOUT,
+    READ_TIMEOUT,
+    WRITE_TIMEOUT,
+)
+
+# String Constants
+EMPTY_STRING = ""
+
+
+class DiscoveredDevice:
+    '''
+    A tpmania device found on a serial port.
+
+    Parameters:
+        port (str): Serial port name (e.g. COM3)
+        description (str): Description of the port, given by the system
+        firmware_version (str): Firmware version reported by the device
+    '''
+    def __init__(
+            self,
+            port: str,
+            description: str,
+            firmware_version: str,
+    ) -> None:
+        ''' Initialises the device found '''
+        self._port = port
+        self._description = description
+        self._firmware_version = firmware_version
+
+    def __repr__(self) -> str:
+        return (
+            f"DiscoveredDevice({self._port!r}, {self._description!r}, "
+            f"{self._firmware_version!r})"
+        )
+
+    def get_port(self) -> str:
+        ''' Returns the serial port the device is connected to '''
+        return self._port
+
+    def get_description(self) -> str:
+        ''' Returns the description of the port '''
+        return self._description
+
+    def get_firmware_version(self) -> str:
+        ''' Returns the firmware version reported by the device '''
+        return self._firmware_version
+
+
+def list_serial_ports() -> list[tuple[str, str]]:
+    '''
+    Lists the serial ports existing on this computer.
+
+    Returns:
+        (list): Port name and description of each port
+    '''
+    return [
+        (port.device, port.description)
+        for port in serial.tools.list_ports.comports()
+    ]
+
+
+def get_serial_number(port: str) -> str | None:
+    '''
+    Returns the serial number of the USB adapter on a port, which tells
+    devices of the same firmware version apart, or None if the adapter
+    has none (e.g. emulated devices).
+    '''
+    for info in serial.tools.list_ports.comports():
+        if (info.device == port):
+            return info.serial_number
+    return None
+
+
+def probe_port(
+        port: str,
+        description: str = EMPTY_STRING,
+        timeout: float = IDENTIFY_TIMEOUT,
+) -> DiscoveredDevice | None:
+    '''
+    Asks the device on a serial port to identify itself.
+
+    Parameters:
+        port (str): Serial port name (e.g. COM3)
+        description (str): Description of the port
+        timeout (float): Maximum time to wait for each answer (in seconds)
+
+    Returns:
+        (DiscoveredDevice): Device found, or None if the port could not be
+        opened, or is not connected to a tpmania device
+    '''
+    try:
+        connection = serial.Serial(
+            port,
+            BAUD_RATE,
+            timeout=READ_TIMEOUT,
+            write_timeout=WRITE_TIMEOUT,
+        )
+    except (OSError, serial.SerialException):
+        return None
+
+    protocol = DeviceProtocol(connection)
+    try:
+        version = protocol.identify(timeout)
+    except (OSError, serial.SerialException):
+        version = None
+    finally:
+        protocol.close()
+
+    if (version is None):
+        return None
+    return DiscoveredDevice(port, description, version)
+
+
+def discover_devices(
+        ports: list[tuple[str, str]] | None = None,
+        timeout: float = IDENTIFY_TIMEOUT,
+) -> list[DiscoveredDevice]:
+    '''
+    Probes serial ports concurrently, one thread per port, so finding
+    devices takes a single probe round however many ports exist.
+
+    Parameters:
+        ports (list): Port name and description of each port to probe,
+            or None to probe every serial port on this computer
+        timeout (float): Maximum time to wait for each answer (in seconds)
+
+    Returns:
+        (list[DiscoveredDevice]): Devices found, in port order
+    '''
+    if (ports is None):
+        ports = list_serial_ports()
+    if (len(ports) == 0):
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(len(ports)) as executor:
+        probes = [
+            executor.submit(probe_port, port, description, timeout)
+            for port, description in ports
+        ]
+        devices = [probe.result() for probe in probes]
+
+    return [device for device in devices if (device is not None)]
+
+
+def main() -> None:
+    ''' Prints each device found '''
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("ports", nargs="*")
+    parser.add_argument("--timeout", type=float, default=IDENTIFY_TIMEOUT)
+    args = parser.parse_args()
+
+    ports = None
+    if (args.ports):
+        ports = [(port, EMPTY_STRING) for port in args.ports]
+
+    for device in discover_devices(ports, args.timeout):
+        print(
+            f"{device.get_port()}\t{device.get_firmware_version()}\t"
+            f"{device.get_description()}"
+        )
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,1072 @@
+'''
+Software stand-in for the cabinet firmware, exposing a pseudo-terminal
+that speaks the same serial protocol as the device. Used to benchmark
+and regression-test transfers without hardware (Linux/macOS only).
+
+Run standalone with:
+    python -m GUI.device_emulator [--latency S] [--baud-rate N] ...
+'''
+# Import Required Modules
+import argparse
+import binascii
+import os
+import random
+import select
+import struct
+import threading
+import time
+import tty
+
+# String Constants
+EMPTY_STRING = ""
+NEWLINE = "\n"
+
+# Sequence file constants
+BUFFER = "---"
+NAME_FLAG = "Name: "
+ARTIST_FLAG = "Artist: "
+BPM_FLAG = "BPM: "
+DIFFICULTY_FLAG = "Difficulty: "
+OFFSET_FLAG = "Offset: "
+LENGTH_FLAG = "Length: "
+
+# Serial communication indicator characters
+SQ_TO_RAM_CHAR = 'S'
+SQ_TO_EEPROM_CHAR = 'E'
+SQ_TO_BOTH_CHAR = 'B'
+TW_TO_EEPROM_CHAR = 'T'
+LOAD_SQ_FROM_RAM_CODE = 'R'
+LOAD_SQ_FROM_EEPROM_CODE = 'N'
+REQUEST_TIMING_WINDOWS_CODE = 'W'
+END_TRANSFER = 'X'
+FRAMED_TRANSFER_CHAR = 'F'
+BLOCK_TRANSFER_CHAR = 'K'
+WINDOWED_EEPROM_CHAR = 'V'
+QUERY_BAUD_RATES_CODE = 'Q'
+SET_BAUD_RATE_CODE = 'U'
+PING_CODE = 'P'
+RESUME_EEPROM_CODE = 'Y'
+REQUEST_HASHES_CODE = 'H'
+DELTA_TRANSFER_CHAR = 'D'
+QUERY_RECEIVE_BUFFER_CODE = 'C'
+IDENTIFY_CODE = 'I'
+TRANSACTION_CODE = 'G'
+IDENTIFY_PREFIX = "TPMANIA "
+READY_CODE = "RDY"
+ACKNOWLEDGE_PREFIX = "A"
+NAK_PREFIX = "NAK"
+NAK_SEPARATOR = ","
+DATA_ENCODING_TYPE = "ascii"
+
+# Framed transfer header, see GUI/device_protocol.py
+FRAME_START = 0x02
+FRAME_HEADER_FORMAT = ">BcH"
+
+# Transaction operations, see GUI/device_protocol.py
+TRANSACTION_OPERATIONS = (
+    SQ_TO_RAM_CHAR,
+    SQ_TO_EEPROM_CHAR,
+    SQ_TO_BOTH_CHAR,
+    TW_TO_EEPROM_CHAR,
+    REQUEST_TIMING_WINDOWS_CODE,
+)
+
+# Block transfer layout, see GUI/device_protocol.py
+BLOCK_HEADER_FORMAT = ">cBBH"
+BLOCK_CHECKSUM_FORMAT = ">H"
+BLOCK_PAYLOAD_SIZE = 64
+CRC_INITIAL_VALUE = 0xFFFF
+
+# Time without receiving a block before requesting a resend,
+# and how many resends are requested before giving up.
+BLOCK_IDLE_TIMEOUT = 0.1
+MAX_NAKS = 8
+
+# Time without receiving beats before a windowed EEPROM upload is
+# abandoned. Committed pages are kept, so the host can resume it.
+SESSION_IDLE_TIMEOUT = 1
+
+# Delta uploads, see GUI/device_protocol.py
+BAR_BEATS = 4
+DELTA_PARAMETER_PREFIX = "P"
+DELTA_PARAMETER_SEPARATOR = ":"
+DELTA_BAR_PREFIX = "B"
+HASH_FORMAT = "08x"
+
+# Packed beats, see GUI/device_protocol.py
+LANE_STATES = "01"
+MAX_PACKED_LANES = 8
+BITS_PER_BYTE_PACKED = 8
+BINARY_BASE = 2
+PACKED_SEPARATOR = ":"
+
+# PackBits run-length compression, see GUI/device_protocol.py
+RLE_CODE = "R"
+RLE_MAX_LITERAL = 128
+RLE_MAX_REPEAT = 128
+RLE_MIN_REPEAT = 3
+RLE_REPEAT_BASE = 257
+
+# Memory locations
+RAM = "RAM"
+EEPROM = "EEPROM"
+
+# Memories written by each upload code
+UPLOAD_LOCATIONS = {
+    SQ_TO_RAM_CHAR: (RAM,),
+    SQ_TO_EEPROM_CHAR: (EEPROM,),
+    SQ_TO_BOTH_CHAR: (RAM, EEPROM),
+}
+
+# Sequence metadata, in the order it is transmitted by the host
+METADATA_LENGTH = 7
+METADATA_BEATS_INDEX = 5
+METADATA_FLAGS = (
+    (0, NAME_FLAG),
+    (1, ARTIST_FLAG),
+    (2, BPM_FLAG),
+    (3, DIFFICULTY_FLAG),
+    (4, OFFSET_FLAG),
+    (6, LENGTH_FLAG),
+)
+
+# Device defaults
+BAUD_RATE = 9600
+SUPPORTED_BAUD_RATES = (
+    9600,
+    19200,
+    38400,
+    57600,
+    115200,
+)
+TIMING_WINDOW_LENGTH = 4
+DEFAULT_TIMING_WINDOWS = (
+    200,
+    300,
+    400,
+    500,
+)
+FIRMWARE_VERSION = "2.0.0"
+DEFAULT_EEPROM_PAGE_BEATS = 16
+DEFAULT_EEPROM_WRITE_DELAY = 0.005  # 5ms per page
+DEFAULT_LATENCY = 0.0
+DEFAULT_ERROR_RATE = 0.0
+DEFAULT_LINE_DELAY = 0.0
+
+# Bytes arriving when the receive buffer is full are lost (an overrun)
+UNLIMITED_RECEIVE_BUFFER = None
+
+# Bits on the wire per byte (start bit, 8 data bits, stop bit), and how
+# many slices each second of received traffic is metered in.
+BITS_PER_BYTE = 10
+WIRE_SLICES_PER_SECOND = 100
+
+# Maximum time (in seconds) the device waits on the host mid-transfer
+# before abandoning it, and how often blocked threads check for shutdown.
+RECEIVE_TIMEOUT = 5
+POLL_INTERVAL = 0.05
+READ_CHUNK_SIZE = 4096
+
+
+class TransferAborted(Exception):
+    ''' Raised when the host stops sending mid-transfer '''
+
+
+class DeviceState:
+    '''
+    Memory contents of the emulated device. Sequences are stored as a
+    tuple of (metadata, beats), both lists of strings without newlines.
+    '''
+    def __init__(self) -> None:
+        ''' Initialises empty memory, with default timing windows '''
+        self._sequences = {
+            RAM: None,
+            EEPROM: None,
+        }
+        self._timing_windows = DEFAULT_TIMING_WINDOWS
+
+    def get_sequence(self, location: str) -> tuple[list, list] | None:
+        ''' Returns the sequence stored at location, or None if empty '''
+        return self._sequences[location]
+
+    def get_timing_windows(self) -> tuple:
+        ''' Returns the stored timing windows '''
+        return self._timing_windows
+
+    def set_sequence(
+            self,
+            location: str,
+            sequence: tuple[list, list],
+    ) -> None:
+        ''' Stores a sequence at location '''
+        self._sequences[location] = sequence
+
+    def set_timing_windows(self, windows: tuple) -> None:
+        ''' Stores the timing windows '''
+        self._timing_windows = windows
+
+
+class VirtualDevice:
+    '''
+    Emulates the micro-controller behind a pseudo-terminal. Hosts open
+    get_port() as they would a real serial port.
+
+    Received bytes arrive in the receive buffer at the emulated baud rate,
+    and are consumed by the emulated firmware as it handles them.
+
+    Parameters:
+        latency (float): Delay before each response is sent (in seconds)
+        baud_rate (int): Initial baud rate
+        emulate_baud (bool): Throttle traffic to the emulated baud rate
+        eeprom_write_delay (float): Time to commit an EEPROM page
+        eeprom_page_beats (int): Beats per EEPROM page
+        extensions (bool): Support block, framed, windowed and baud rate
+            negotiation commands. If False, behaves like legacy firmware.
+        error_rate (float): Probability each received byte is garbled,
+            emulating a noisy cable
+        receive_buffer (int): Size of the receive buffer (in bytes), or
+            UNLIMITED_RECEIVE_BUFFER if it never overruns
+        line_delay (float): Time the firmware takes to handle each line
+    '''
+    def __init__(
+            self,
+            latency: float = DEFAULT_LATENCY,
+            baud_rate: int = BAUD_RATE,
+            emulate_baud: bool = True,
+            eeprom_write_delay: float = DEFAULT_EEPROM_WRITE_DELAY,
+            eeprom_page_beats: int = DEFAULT_EEPROM_PAGE_BEATS,
+            extensions: bool = True,
+            error_rate: float = DEFAULT_ERROR_RATE,
+            receive_buffer: int | None = UNLIMITED_RECEIVE_BUFFER,
+            line_delay: float = DEFAULT_LINE_DELAY,
+    ) -> None:
+        ''' Initialises device configuration, the pty is opened by start '''
+        self._latency = latency
+        self._baud_rate = baud_rate
+        self._emulate_baud = emulate_baud
+        self._eeprom_write_delay = eeprom_write_delay
+        self._eeprom_page_beats = eeprom_page_beats
+        self._extensions = extensions
+        self._error_rate = error_rate
+        self._receive_buffer = receive_buffer
+        self._line_delay = line_delay
+        self._overruns = 0
+
+        self._state = DeviceState()
+
+        # Abandoned windowed EEPROM upload, as [metadata, committed beats]
+        self._eeprom_session = None
+        self._master = None
+        self._slave = None
+        self._port = EMPTY_STRING
+
+        self._received = bytearray()
+        self._condition = threading.Condition()
+        self._running = False
+        self._threads = []
+
+    def __enter__(self) -> "VirtualDevice":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def get_port(self) -> str:
+        ''' Returns the path of the pseudo-terminal hosts should open '''
+        return self._port
+
+    def get_state(self) -> DeviceState:
+        ''' Returns the emulated memory contents '''
+        return self._state
+
+    def get_baud_rate(self) -> int:
+        ''' Returns the baud rate currently emulated '''
+        return self._baud_rate
+
+    def get_overruns(self) -> int:
+        ''' Returns the number of bytes lost to receive buffer overruns '''
+        return self._overruns
+
+    def start(self) -> None:
+        ''' Opens the pseudo-terminal and starts the device threads '''
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self._port = os.ttyname(self._slave)
+        self._running = True
+
+        self._threads = [
+            threading.Thread(target=self._drain, daemon=True),
+            threading.Thread(target=self._run, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        ''' Stops the device threads, and closes the pseudo-terminal '''
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        os.close(self._master)
+        os.close(self._slave)
+
+    # ---- Wire emulation ----
+
+    def _drain(self) -> None:
+        '''
+        Moves bytes written by the host into the receive buffer, as fast
+        as they would arrive over the wire.
+        '''
+        while (self._running):
+            ready, _, _ = select.select([self._master], [], [], POLL_INTERVAL)
+            if (not ready):
+                continue
+
+            size = READ_CHUNK_SIZE
+            if (self._emulate_baud):
+                size = max(
+                    self._baud_rate
+                    // BITS_PER_BYTE
+                    // WIRE_SLICES_PER_SECOND,
+                    1,
+                )
+            try:
+                data = os.read(self._master, size)
+            except OSError:
+                continue
+            self._pace(len(data))
+
+            if (self._error_rate > 0):
+                data = self._garble(data)
+            with self._condition:
+                if (self._receive_buffer is not UNLIMITED_RECEIVE_BUFFER):
+                    space = max(self._receive_buffer - len(self._received), 0)
+                    self._overruns += max(len(data) - space, 0)
+                    data = data[:space]
+                self._received.extend(data)
+                self._condition.notify_all()
+
+    def _garble(self, data: bytes) -> bytes:
+        ''' Flips a random bit in bytes, at the configured error rate '''
+        data = bytearray(data)
+        for index in range(len(data)):
+            if (random.random() < self._error_rate):
+                data[index] ^= 1 << random.randrange(8)
+        return bytes(data)
+
+    def _pace(self, size: int) -> None:
+        ''' Sleeps for the time size bytes take on the wire '''
+        if (self._emulate_baud):
+            time.sleep(size * BITS_PER_BYTE / self._baud_rate)
+
+    def _read_bytes(
+            self,
+            size: int,
+            timeout: float = RECEIVE_TIMEOUT,
+    ) -> bytes:
+        '''
+        Reads exactly size bytes sent by the host.
+
+        Raises:
+            TransferAborted: If the bytes do not arrive within timeout
+        '''
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while (len(self._received) < size):
+                remaining = deadline - time.monotonic()
+                if (remaining <= 0) or (not self._running):
+                    raise TransferAborted()
+                self._condition.wait(min(remaining, POLL_INTERVAL))
+            data = bytes(self._received[:size])
+            del self._received[:size]
+
+        return data
+
+    def _read_line(self, timeout: float = RECEIVE_TIMEOUT) -> str:
+        '''
+        Reads a newline terminated line sent by the host.
+
+        Raises:
+            TransferAborted: If no full line arrives within timeout
+        '''
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while (b"\n" not in self._received):
+                remaining = deadline - time.monotonic()
+                if (remaining <= 0) or (not self._running):
+                    raise TransferAborted()
+                self._condition.wait(min(remaining, POLL_INTERVAL))
+            size = self._received.index(b"\n") + 1
+
+        line = self._read_bytes(size).decode(DATA_ENCODING_TYPE).strip()
+        time.sleep(self._line_delay)
+        return line
+
+    def _send(self, *lines: str) -> None:
+        ''' Sends newline terminated lines to the host '''
+        data = EMPTY_STRING.join(f"{line}{NEWLINE}" for line in lines)
+        self._send_bytes(data.encode(DATA_ENCODING_TYPE))
+
+    def _send_bytes(self, data: bytes) -> None:
+        ''' Sends raw bytes to the host '''
+        time.sleep(self._latency)
+        self._pace(len(data))
+        while (data):
+            written = os.write(self._master, data)
+            data = data[written:]
+
+    def _commit_eeprom_pages(self, beats: int) -> None:
+        ''' Sleeps for the time taken to write beats to EEPROM '''
+        pages = -(-beats // self._eeprom_page_beats)
+        time.sleep(pages * self._eeprom_write_delay)
+
+    # ---- Firmware ----
+
+    def _run(self) -> None:
+        ''' Waits for command codes from the host, and handles them '''
+        handlers = {
+            SQ_TO_RAM_CHAR: self._receive_sequence,
+            SQ_TO_EEPROM_CHAR: self._receive_sequence,
+            SQ_TO_BOTH_CHAR: self._receive_sequence,
+            TW_TO_EEPROM_CHAR: self._receive_timing_windows,
+            REQUEST_TIMING_WINDOWS_CODE: self._send_timing_windows,
+            LOAD_SQ_FROM_RAM_CODE: self._send_sequence,
+            LOAD_SQ_FROM_EEPROM_CODE: self._send_sequence,
+        }
+        if (self._extensions):
+            handlers.update({
+                FRAMED_TRANSFER_CHAR: self._receive_frame,
+                BLOCK_TRANSFER_CHAR: self._receive_blocks,
+                WINDOWED_EEPROM_CHAR: self._receive_windowed,
+                QUERY_BAUD_RATES_CODE: self._send_baud_rates,
+                SET_BAUD_RATE_CODE: self._set_baud_rate,
+                PING_CODE: self._ping,
+                QUERY_RECEIVE_BUFFER_CODE: self._send_receive_buffer,
+                IDENTIFY_CODE: self._identify,
+                TRANSACTION_CODE: self._run_transaction,
+                RESUME_EEPROM_CODE: self._resume_windowed,
+                REQUEST_HASHES_CODE: self._send_hashes,
+                DELTA_TRANSFER_CHAR: self._receive_delta,
+                LOAD_SQ_FROM_RAM_CODE.lower(): self._send_packed_sequence,
+                LOAD_SQ_FROM_EEPROM_CODE.lower(): self._send_packed_sequence,
+            })
+
+        while (self._running):
+            try:
+                code = self._read_bytes(1, POLL_INTERVAL)
+            except TransferAborted:
+                continue
+
+            code = code.decode(DATA_ENCODING_TYPE, errors="ignore")
+            handler = handlers.get(code)
+            if (handler is None):
+                continue
+
+            try:
+                handler(code)
+            except TransferAborted:
+                print(f"Transfer {code} abandoned by host")  # debugging
+
+    def _store_sequence(self, code: str, metadata: list, beats: list) -> None:
+        ''' Stores a received sequence in the memory selected by code '''
+        if (code in (SQ_TO_RAM_CHAR, SQ_TO_BOTH_CHAR)):
+            self._state.set_sequence(RAM, (metadata, beats))
+        if (code in (SQ_TO_EEPROM_CHAR, SQ_TO_BOTH_CHAR)):
+            self._commit_eeprom_pages(len(beats))
+            self._state.set_sequence(EEPROM, (metadata, beats))
+
+    def _read_metadata(self) -> list:
+        ''' Reads the sequence metadata lines sent by the host '''
+        return [self._read_line() for _ in range(METADATA_LENGTH)]
+
+    def _receive_sequence(self, code: str) -> None:
+        '''
+        Receives a sequence line by line. EEPROM uploads are paced by
+        a ready code before each beat.
+        '''
+        self._send(READY_CODE)
+        metadata = self._read_metadata()
+
+        if (code != SQ_TO_EEPROM_CHAR):
+            beats = [
+                self._read_line()
+                for _ in range(int(metadata[METADATA_BEATS_INDEX]))
+            ]
+            self._store_sequence(code, metadata, beats)
+            self._send(END_TRANSFER)
+            return
+
+        # EEPROM pages are committed as they fill
+        beats = []
+        for _ in range(int(metadata[METADATA_BEATS_INDEX])):
+            self._send(READY_CODE)
+            beats.append(self._read_line())
+            if (len(beats) % self._eeprom_page_beats == 0):
+                self._commit_eeprom_pages(self._eeprom_page_beats)
+
+        self._commit_eeprom_pages(len(beats) % self._eeprom_page_beats)
+        self._state.set_sequence(EEPROM, (metadata, beats))
+        self._send(END_TRANSFER)
+
+    def _receive_frame(self, code: str) -> None:
+        ''' Receives a sequence sent as a single length-prefixed frame '''
+        self._send(READY_CODE)
+
+        header = self._read_bytes(struct.calcsize(FRAME_HEADER_FORMAT))
+        start, location, size = struct.unpack(FRAME_HEADER_FORMAT, header)
+        if (start != FRAME_START):
+            return
+
+        payload = self._read_bytes(size).decode(DATA_ENCODING_TYPE)
+        lines = payload.split(NEWLINE)[:-1]
+        metadata = lines[:METADATA_LENGTH]
+        beats = lines[METADATA_LENGTH:]
+
+        self._store_sequence(
+            location.decode(DATA_ENCODING_TYPE),
+            metadata,
+            beats,
+        )
+        self._send(END_TRANSFER)
+
+    def _read_operations(self) -> list[tuple[str, str]] | None:
+        '''
+        Reads transaction operation frames sent by the host, until the
+        commit frame.
+
+        Returns:
+            (list): Command code and payload of each operation, or None if
+            a frame was damaged
+
+        Raises:
+            TransferAborted: If the host stops sending
+        '''
+        operations = []
+        while True:
+            header = self._read_bytes(struct.calcsize(FRAME_HEADER_FORMAT))
+            start, code, size = struct.unpack(FRAME_HEADER_FORMAT, header)
+            code = code.decode(DATA_ENCODING_TYPE, errors="ignore")
+            payload = self._read_bytes(size).decode(
+                DATA_ENCODING_TYPE,
+                errors="ignore",
+            )
+            if (start != FRAME_START):
+                return None
+            if (code == END_TRANSFER):
+                return operations
+            if (code not in TRANSACTION_OPERATIONS):
+                return None
+
+            # Timing windows are checked before any operation runs
+            windows = payload.split(NEWLINE)[:-1]
+            if (code == TW_TO_EEPROM_CHAR) and (
+                    (len(windows) != TIMING_WINDOW_LENGTH)
+                    or (not all(window.isdigit() for window in windows))):
+                return None
+            operations.append((code, payload))
+
+    def _run_transaction(self, code: str) -> None:
+        '''
+        Receives several operations, and runs them once all have been
+        received, acknowledging each.
+        '''
+        self._send(READY_CODE)
+
+        operations = self._read_operations()
+        if (operations is None):
+            self._discard_input()
+            self._send(NAK_PREFIX)
+            return
+
+        for count, (operation, payload) in enumerate(operations, 1):
+            lines = payload.split(NEWLINE)[:-1]
+            if (operation == TW_TO_EEPROM_CHAR):
+                self._commit_eeprom_pages(1)
+                self._state.set_timing_windows(
+                    tuple(int(line) for line in lines)
+                )
+            elif (operation == REQUEST_TIMING_WINDOWS_CODE):
+                windows = self._state.get_timing_windows()
+                self._send(*(str(window) for window in windows))
+            else:
+                self._store_sequence(
+                    operation,
+                    lines[:METADATA_LENGTH],
+                    lines[METADATA_LENGTH:],
+                )
+            self._send(f"{ACKNOWLEDGE_PREFIX}{count}")
+
+        self._send(END_TRANSFER)
+
+    def _discard_input(self) -> None:
+        ''' Discards bytes received until the host stops sending '''
+        try:
+            while True:
+                self._read_bytes(1, BLOCK_IDLE_TIMEOUT)
+        except TransferAborted:
+            return
+
+    def _read_block(
+            self,
+            timeout: float,
+    ) -> tuple[str, int, int, bytes] | None:
+        '''
+        Reads the next block sent by the host, skipping bytes until
+        the start of a block.
+
+        Parameters:
+            timeout (float): Maximum time to wait for the block to start
+
+        Returns:
+            (tuple): Location code, block index, block count and payload,
+            or None if the block was damaged
+
+        Raises:
+            TransferAborted: If the host stops sending
+        '''
+        while (self._read_bytes(1, timeout)[0] != FRAME_START):
+            timeout = BLOCK_IDLE_TIMEOUT
+
+        header = self._read_bytes(
+            struct.calcsize(BLOCK_HEADER_FORMAT),
+            BLOCK_IDLE_TIMEOUT,
+        )
+        location, index, count, size = struct.unpack(
+            BLOCK_HEADER_FORMAT,
+            header,
+        )
+        if (size > BLOCK_PAYLOAD_SIZE) or (index >= count):
+            return None
+
+        payload = self._read_bytes(size, BLOCK_IDLE_TIMEOUT)
+        checksum = self._read_bytes(
+            struct.calcsize(BLOCK_CHECKSUM_FORMAT),
+            BLOCK_IDLE_TIMEOUT,
+        )
+        expected = binascii.crc_hqx(header + payload, CRC_INITIAL_VALUE)
+        if (struct.unpack(BLOCK_CHECKSUM_FORMAT, checksum)[0] != expected):
+            return None
+
+        return (location.decode(DATA_ENCODING_TYPE), index, count, payload)
+
+    def _receive_blocks(self, code: str) -> None:
+        ''' Receives a sequence sent as checksummed blocks '''
+        self._send(READY_CODE)
+
+        location, payload = self._read_blocks()
+
+        # Lower case locations hold packed beats, after the number of lanes
+        if (location.islower()):
+            *metadata, lanes, packed = payload.split(
+                NEWLINE.encode(DATA_ENCODING_TYPE),
+                METADATA_LENGTH + 1,
+            )
+            metadata = [param.decode(DATA_ENCODING_TYPE) for param in metadata]
+            lanes, *compression = lanes.decode(DATA_ENCODING_TYPE).split(
+                PACKED_SEPARATOR,
+            )
+            if (compression == [RLE_CODE]):
+                packed = rle_decompress(packed)
+            beats = unpack_beats(
+                int(lanes),
+                int(metadata[METADATA_BEATS_INDEX]),
+                packed,
+            )
+            location = location.upper()
+        else:
+            lines = payload.decode(DATA_ENCODING_TYPE).split(NEWLINE)[:-1]
+            metadata = lines[:METADATA_LENGTH]
+            beats = lines[METADATA_LENGTH:]
+
+        self._store_sequence(location, metadata, beats)
+        self._send(END_TRANSFER)
+
+    def _read_blocks(self) -> tuple[str, bytes]:
+        '''
+        Reads a block transfer. Once the host stops sending, damaged and
+        missing blocks are requested again.
+
+        Returns:
+            (tuple): Location code, and the reassembled payload
+        '''
+        blocks = {}
+        count = None
+        location = None
+        naks = 0
+        timeout = RECEIVE_TIMEOUT
+        while (count is None) or (len(blocks) < count):
+            try:
+                block = self._read_block(timeout)
+            except TransferAborted:
+                # Abandoned if the host never sends, otherwise the host
+                # finished sending, so request anything not received.
+                if (timeout == RECEIVE_TIMEOUT) or (naks == MAX_NAKS):
+                    raise
+                naks += 1
+                timeout = RECEIVE_TIMEOUT
+                missing = [] if (count is None) else [
+                    str(index) for index in range(count)
+                    if (index not in blocks)
+                ]
+                self._send(f"{NAK_PREFIX}{NAK_SEPARATOR.join(missing)}")
+                continue
+
+            timeout = BLOCK_IDLE_TIMEOUT
+            if (block is None):
+                continue
+            location, index, count, payload = block
+            blocks[index] = payload
+
+        return (
+            location,
+            b"".join(blocks[index] for index in range(count)),
+        )
+
+    def _send_hashes(self, code: str) -> None:
+        '''
+        Sends a hash of each metadata parameter and each bar of the
+        sequence stored in the requested memory.
+        '''
+        load_code = self._read_bytes(1).decode(DATA_ENCODING_TYPE).upper()
+        location = RAM if (load_code == LOAD_SQ_FROM_RAM_CODE) else EEPROM
+        sequence = self._state.get_sequence(location)
+        if (sequence is None):
+            self._send(END_TRANSFER)
+            return
+
+        metadata, beats = sequence
+        bars = [
+            beats[start:start + BAR_BEATS]
+            for start in range(0, len(beats), BAR_BEATS)
+        ]
+        self._send(
+            *(format(hash_lines([param]), HASH_FORMAT) for param in metadata),
+            BUFFER,
+            *(format(hash_lines(bar), HASH_FORMAT) for bar in bars),
+            END_TRANSFER,
+        )
+
+    def _receive_delta(self, code: str) -> None:
+        '''
+        Receives changed parameters and bars as a block transfer, and
+        applies them to the stored sequence.
+        '''
+        self._send(READY_CODE)
+        location, payload = self._read_blocks()
+        lines = payload.decode(DATA_ENCODING_TYPE).split(NEWLINE)[:-1]
+
+        # Split changes into parameters, and the beats of each bar
+        parameters = {}
+        bars = {}
+        bar = None
+        for line in lines:
+            if (line.startswith(DELTA_PARAMETER_PREFIX)):
+                index, value = line[1:].split(DELTA_PARAMETER_SEPARATOR, 1)
+                parameters[int(index)] = value
+            elif (line.startswith(DELTA_BAR_PREFIX)):
+                bar = int(line[1:])
+                bars[bar] = []
+            else:
+                bars[bar].append(line)
+
+        for memory in UPLOAD_LOCATIONS[location]:
+            metadata, beats = self._state.get_sequence(memory)
+            metadata = list(metadata)
+            for index, value in parameters.items():
+                metadata[index] = value
+
+            # Resize to the new number of beats, then replace changed bars
+            total = int(metadata[METADATA_BEATS_INDEX])
+            beats = (beats + [EMPTY_STRING] * total)[:total]
+            for bar, bar_beats in bars.items():
+                start = bar * BAR_BEATS
+                beats[start:start + len(bar_beats)] = bar_beats
+
+            if (memory == EEPROM):
+                self._commit_eeprom_pages(
+                    sum(len(bar_beats) for bar_beats in bars.values())
+                )
+            self._state.set_sequence(memory, (metadata, beats))
+
+        self._send(END_TRANSFER)
+
+    def _receive_windowed(self, code: str) -> None:
+        '''
+        Receives a sequence for EEPROM, acknowledging each page once
+        committed with the cumulative number of beats written.
+        '''
+        self._send(READY_CODE)
+        self._send(str(self._eeprom_page_beats))
+        self._eeprom_session = [self._read_metadata(), []]
+        self._receive_windowed_beats()
+
+    def _resume_windowed(self, code: str) -> None:
+        '''
+        Resumes an abandoned windowed EEPROM upload, reporting the number
+        of beats already committed.
+        '''
+        if (self._eeprom_session is None):
+            self._send(NAK_PREFIX)
+            return
+
+        committed = len(self._eeprom_session[1])
+        self._send(f"{ACKNOWLEDGE_PREFIX}{committed}")
+        self._receive_windowed_beats()
+
+    def _receive_windowed_beats(self) -> None:
+        '''
+        Receives the remaining beats of the windowed EEPROM upload.
+        If the host stalls, the partial page is discarded.
+        '''
+        metadata, beats = self._eeprom_session
+        total = int(metadata[METADATA_BEATS_INDEX])
+        while (len(beats) < total):
+            size = min(self._eeprom_page_beats, total - len(beats))
+            page = []
+            while (len(page) < size):
+                try:
+                    page.append(self._read_line(SESSION_IDLE_TIMEOUT))
+                except TransferAborted:
+                    with self._condition:
+                        self._received.clear()
+                    raise
+
+            self._commit_eeprom_pages(size)
+            beats.extend(page)
+            self._send(f"{ACKNOWLEDGE_PREFIX}{len(beats)}")
+
+        self._eeprom_session = None
+        self._state.set_sequence(EEPROM, (metadata, beats))
+        self._send(END_TRANSFER)
+
+    def _receive_timing_windows(self, code: str) -> None:
+        ''' Receives timing windows, and stores them in EEPROM '''
+        self._send(READY_CODE)
+        windows = tuple(
+            int(self._read_line()) for _ in range(TIMING_WINDOW_LENGTH)
+        )
+        self._commit_eeprom_pages(1)
+        self._state.set_timing_windows(windows)
+        self._send(END_TRANSFER)
+
+    def _send_timing_windows(self, code: str) -> None:
+        ''' Sends the stored timing windows '''
+        windows = self._state.get_timing_windows()
+        self._send(*(str(window) for window in windows), END_TRANSFER)
+
+    def _send_sequence(self, code: str) -> None:
+        ''' Sends the sequence stored in RAM or EEPROM '''
+        location = RAM if (code == LOAD_SQ_FROM_RAM_CODE) else EEPROM
+        sequence = self._state.get_sequence(location)
+        if (sequence is None):
+            self._send(BUFFER, END_TRANSFER)
+            return
+
+        metadata, beats = sequence
+        lines = [f"{flag}{metadata[index]}" for index, flag in METADATA_FLAGS]
+        self._send(*lines, BUFFER, *beats, END_TRANSFER)
+
+    def _send_packed_sequence(self, code: str) -> None:
+        '''
+        Sends the sequence stored in RAM or EEPROM with packed beats,
+        or NAK_PREFIX if its beats cannot be packed.
+        '''
+        location = RAM if (code == LOAD_SQ_FROM_RAM_CODE.lower()) else EEPROM
+        sequence = self._state.get_sequence(location)
+        packed = None if (sequence is None) else pack_beats(sequence[1])
+        if (packed is None):
+            self._send(NAK_PREFIX)
+            return
+
+        metadata, beats = sequence
+        lanes, data = packed
+        header = f"{lanes}{PACKED_SEPARATOR}{len(beats)}"
+
+        # Compress beats whenever that makes them smaller
+        compressed = rle_compress(data)
+        if (len(compressed) < len(data)):
+            header = f"{header}{PACKED_SEPARATOR}{len(compressed)}"
+            data = compressed
+
+        lines = [f"{flag}{metadata[index]}" for index, flag in METADATA_FLAGS]
+        self._send(*lines, BUFFER, header)
+        self._send_bytes(data)
+        self._send(END_TRANSFER)
+
+    def _send_baud_rates(self, code: str) -> None:
+        ''' Sends the baud rates the device supports '''
+        rates = (str(rate) for rate in SUPPORTED_BAUD_RATES)
+        self._send(*rates, END_TRANSFER)
+
+    def _set_baud_rate(self, code: str) -> None:
+        ''' Acknowledges a baud rate change at the old rate, then switches '''
+        rate = int(self._read_line())
+        if (rate not in SUPPORTED_BAUD_RATES):
+            return
+        self._send(READY_CODE)
+        self._baud_rate = rate
+
+    def _ping(self, code: str) -> None:
+        ''' Responds to a ping '''
+        self._send(READY_CODE)
+
+    def _identify(self, code: str) -> None:
+        ''' Sends the firmware version '''
+        self._send(f"{IDENTIFY_PREFIX}{FIRMWARE_VERSION}")
+
+    def _send_receive_buffer(self, code: str) -> None:
+        ''' Sends the size of the receive buffer (in bytes) '''
+        size = self._receive_buffer
+        if (size is UNLIMITED_RECEIVE_BUFFER):
+            size = READ_CHUNK_SIZE
+        self._send(str(size))
+
+
+def hash_lines(lines: list[str]) -> int:
+    ''' Returns the CRC-32 of lines, each newline terminated '''
+    data = EMPTY_STRING.join(f"{line}{NEWLINE}" for line in lines)
+    return binascii.crc32(data.encode(DATA_ENCODING_TYPE))
+
+
+def pack_beats(beats: list[str]) -> tuple[int, bytes] | None:
+    '''
+    Packs beats into a bit stream, with one bit per lane.
+
+    Returns:
+        (tuple): Number of lanes, and the packed beats, or None if the
+        beats cannot be packed
+    '''
+    if (len(beats) == 0):
+        return None
+
+    lanes = len(beats[0])
+    if (not 0 < lanes <= MAX_PACKED_LANES):
+        return None
+
+    for beat in beats:
+        if (len(beat) != lanes) or (beat.strip(LANE_STATES) != EMPTY_STRING):
+            return None
+
+    size = -(-(lanes * len(beats)) // BITS_PER_BYTE_PACKED)
+    bits = EMPTY_STRING.join(beats).ljust(
+        size * BITS_PER_BYTE_PACKED,
+        LANE_STATES[0],
+    )
+    return (lanes, int(bits, BINARY_BASE).to_bytes(size, "big"))
+
+
+def unpack_beats(lanes: int, count: int, data: bytes) -> list[str]:
+    ''' Unpacks count beats of lanes bits each '''
+    bits = EMPTY_STRING.join(format(byte, "08b") for byte in data)
+    return [
+        bits[index * lanes:(index + 1) * lanes]
+        for index in range(count)
+    ]
+
+
+def rle_compress(data: bytes) -> bytes:
+    ''' Compresses data with PackBits run-length encoding '''
+    compressed = bytearray()
+    index = 0
+    while (index < len(data)):
+        run = 1
+        while (
+            (index + run < len(data))
+            and (run < RLE_MAX_REPEAT)
+            and (data[index + run] == data[index])
+        ):
+            run += 1
+
+        if (run >= RLE_MIN_REPEAT):
+            compressed.extend((RLE_REPEAT_BASE - run, data[index]))
+            index += run
+            continue
+
+        start = index
+        while (index < len(data)) and (index - start < RLE_MAX_LITERAL):
+            upcoming = data[index:index + RLE_MIN_REPEAT]
+            if (len(upcoming) == RLE_MIN_REPEAT) and (
+                upcoming.count(upcoming[0]) == RLE_MIN_REPEAT
+            ):
+                break
+            index += 1
+
+        compressed.append(index - start - 1)
+        compressed.extend(data[start:index])
+
+    return bytes(compressed)
+
+
+def rle_decompress(data: bytes) -> bytes:
+    ''' Decompresses PackBits run-length encoded data '''
+    decompressed = bytearray()
+    index = 0
+    while (index < len(data)):
+        header = data[index]
+        index += 1
+        if (header < RLE_MAX_LITERAL):
+            decompressed.extend(data[index:index + header + 1])
+            index += header + 1
+        elif (header > RLE_MAX_LITERAL):
+            decompressed.extend(
+                data[index:index + 1] * (RLE_REPEAT_BASE - header)
+            )
+            index += 1
+    return bytes(decompressed)
+
+
+def main() -> None:
+    ''' Runs an emulated device until interrupted '''
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument("--baud-rate", type=int, default=BAUD_RATE)
+    parser.add_argument("--no-baud-emulation", action="store_true")
+    parser.add_argument(
+        "--eeprom-write-delay",
+        type=float,
+        default=DEFAULT_EEPROM_WRITE_DELAY,
+    )
+    parser.add_argument(
+        "--eeprom-page-beats",
+        type=int,
+        default=DEFAULT_EEPROM_PAGE_BEATS,
+    )
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=DEFAULT_ERROR_RATE,
+    )
+    parser.add_argument("--receive-buffer", type=int)
+    parser.add_argument(
+        "--line-delay",
+        type=float,
+        default=DEFAULT_LINE_DELAY,
+    )
+    args = parser.parse_args()
+
+    device = VirtualDevice(
+        latency=args.latency,
+        baud_rate=args.baud_rate,
+        emulate_baud=(not args.no_baud_emulation),
+        eeprom_write_delay=args.eeprom_write_delay,
+        eeprom_page_beats=args.eeprom_page_beats,
+        extensions=(not args.legacy),
+        error_rate=args.error_rate,
+        receive_buffer=args.receive_buffer,
+        line_delay=args.line_delay,
+    )
+    with device:
+        print(f"Emulated device listening on {device.get_port()}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,2729 @@
+# Import Required Modules
+import binascii
+import contextlib
+import functools
+import os
+import serial
+import stat
+import struct
+import tempfile
+import time
+
+# Import session recorder, cancellation, and diagnostic log
+from GUI.serial_recorder import SerialRecorder
+from GUI.cancellation import CancellationToken
+from GUI.protocol_log import PROTOCOL_LOG
+
+# Used for type hinting
+from typing import Any, Callable, Iterator
+
+# String Constants
+EMPTY_STRING = ""
+NEWLINE = "\n"
+
+# Sequence file constants
+BUFFER = "---"
+BAR_DIVIDER = ","
+FILE_END = ";"
+
+# File handling Modes
+WRITE_MODE = 'w'
+NEW_FILE_MODE = 0o666  # Permissions open() gives new files, before umask
+
+# Temporary files, written next to the file they replace
+TEMP_FILE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+TEMP_NAME_BYTES = 4
+TEMP_SUFFIX = ".tmp"
+
+# Serial communication indicator characters
+SQ_TO_RAM_CHAR = 'S'
+SQ_TO_EEPROM_CHAR = 'E'
+SQ_TO_BOTH_CHAR = 'B'
+TW_TO_EEPROM_CHAR = 'T'
+LOAD_SQ_FROM_RAM_CODE = 'R'
+LOAD_SQ_FROM_EEPROM_CODE = 'N'
+REQUEST_TIMING_WINDOWS_CODE = 'W'
+END_TRANSFER = 'X'
+FRAMED_TRANSFER_CHAR = 'F'
+BLOCK_TRANSFER_CHAR = 'K'
+WINDOWED_EEPROM_CHAR = 'V'
+QUERY_BAUD_RATES_CODE = 'Q'
+SET_BAUD_RATE_CODE = 'U'
+PING_CODE = 'P'
+RESUME_EEPROM_CODE = 'Y'
+REQUEST_HASHES_CODE = 'H'
+DELTA_TRANSFER_CHAR = 'D'
+QUERY_RECEIVE_BUFFER_CODE = 'C'
+IDENTIFY_CODE = 'I'
+TRANSACTION_CODE = 'G'
+
+# New comm protocol
+READY_CODE = "RDY"
+NULL_CHAR = '\x00'
+
+# Serial communication baud rate, and encoding type.
+# Connections are always opened at BAUD_RATE, then negotiated upwards.
+BAUD_RATE = 9600
+DATA_ENCODING_TYPE = "ascii"
+
+# Baud rates the host is able to negotiate
+HOST_BAUD_RATES = (
+    9600,
+    19200,
+    38400,
+    57600,
+    115200,
+)
+
+# Serial communication and read/write timeout (in seconds).
+# Function reading/writing will return an empty string after
+# the timeout, this is to prevent blocking.
+READ_TIMEOUT = 0.1
+WRITE_TIMEOUT = 0.1
+
+# Ports enforce WRITE_TIMEOUT on each write as a whole, so bulk writes
+# are split into slices sent well within it at the current baud rate.
+# Each byte takes WIRE_BITS_PER_BYTE bits on the wire (8N1 framing).
+WIRE_BITS_PER_BYTE = 10
+WRITE_TIMEOUT_MARGIN = 0.5
+
+# Baud rate negotiation timeouts (in seconds). Devices revert to BAUD_RATE
+# if the new rate is not verified within BAUD_REVERT_WAIT of switching.
+NEGOTIATION_TIMEOUT = 0.5
+BAUD_SETTLE_WAIT = 0.05
+BAUD_REVERT_WAIT = 1
+
+# Process Exit Codes
+STATUS_TIMEOUT = -1
+STATUS_SUCCESS = 0
+STATUS_DEVICE_NOT_CONNECTED = 1
+STATUS_RECEIVED_EEPROM_TSQ = 4
+STATUS_RECEIVED_RAM_TSQ = 5
+STATUS_UNKNOWN_ERROR = 8
+
+# Maximum time (in seconds) to wait
+# on process before exiting thread
+MAX_WAIT_TIME = 5
+
+TINY_WAIT = 0.002  # 2ms
+DECENT_WAIT = 0.1  # 100 ms
+
+# Line uploads to RAM have no flow control, so beats are sent in chunks
+# that fit the device receive buffer, paced by the time the device takes
+# to handle each beat. Devices may report their receive buffer size (in
+# bytes) when sent QUERY_RECEIVE_BUFFER_CODE, otherwise a typical
+# micro-controller buffer size is assumed. The time per beat starts at
+# TINY_WAIT, backs off when an upload fails (the buffer overran), and
+# follows the time the device took per beat otherwise.
+DEFAULT_RECEIVE_BUFFER = 64
+RECEIVE_BUFFER_TIMEOUT = 0.5
+INITIAL_BEAT_TIME = TINY_WAIT
+MAX_BEAT_TIME = DECENT_WAIT
+PACING_BACKOFF = 2
+PACING_SPEEDUP = 0.75
+
+# Sequence upload modes. Block uploads send the sequence as checksummed
+# blocks, and only resend damaged blocks. Framed uploads send the entire
+# sequence as a single length-prefixed frame, windowed uploads keep
+# several beats in flight while the device commits EEPROM pages, and
+# line uploads send the sequence one line at a time.
+UPLOAD_MODE_LINE = "line"
+UPLOAD_MODE_FRAMED = "framed"
+UPLOAD_MODE_BLOCKS = "blocks"
+UPLOAD_MODE_WINDOWED = "windowed"
+DEFAULT_UPLOAD_MODE = UPLOAD_MODE_BLOCKS
+DEFAULT_EEPROM_UPLOAD_MODE = UPLOAD_MODE_WINDOWED
+
+# Mode to fall back to, when the device does not support an upload mode
+FALLBACK_UPLOAD_MODES = {
+    UPLOAD_MODE_BLOCKS: UPLOAD_MODE_FRAMED,
+    UPLOAD_MODE_FRAMED: UPLOAD_MODE_LINE,
+}
+
+# Number of EEPROM pages the host may keep in flight during
+# windowed uploads, before waiting for an acknowledgement.
+EEPROM_WINDOW_PAGES = 2
+
+# Framed transfer layout:
+#   STX | location code (1 byte) | payload length (2 bytes, big endian) |
+#   payload (newline terminated metadata, followed by beat lines)
+FRAME_START = 0x02  # ASCII "Start of Text"
+FRAME_HEADER_FORMAT = ">BcH"
+MAX_FRAME_PAYLOAD = 0xFFFF
+
+# Block transfer layout:
+#   STX | location code (1 byte) | block index (1 byte) |
+#   block count (1 byte) | payload length (2 bytes, big endian) |
+#   payload | CRC-16/CCITT of everything after STX (2 bytes, big endian)
+# The payload is sliced from the same metadata and beat stream as a frame.
+BLOCK_HEADER_FORMAT = ">cBBH"  # Follows STX
+BLOCK_CHECKSUM_FORMAT = ">H"
+BLOCK_PAYLOAD_SIZE = 64
+MAX_BLOCKS = 0xFF
+CRC_INITIAL_VALUE = 0xFFFF
+
+# Once the device stops receiving blocks, it either ends the transfer,
+# or requests damaged and missing blocks as "NAK<index>,<index>,...".
+# A NAK without indices requests every block.
+NAK_PREFIX = "NAK"
+NAK_SEPARATOR = ","
+MAX_RETRANSMITS = 3
+
+# Delta uploads. Sent "H" followed by the load code of the memory in
+# lower case (so legacy devices never mistake it for a download request),
+# the device replies with a hash of each stored metadata parameter,
+# BUFFER, a hash of each bar of stored beats, then END_TRANSFER. Hashes
+# are hexadecimal CRC-32 values of the newline terminated lines, as sent
+# (wide enough that a changed bar is not mistaken for the stored one).
+# Changes are then sent as a block transfer, following the delta code:
+#   "P<index>:<value>" for each changed parameter
+#   "B<bar>" for each changed bar, followed by that bar's beat lines
+HASH_TIMEOUT = 0.5
+BAR_BEATS = 4
+METADATA_BEATS_INDEX = 5
+DELTA_PARAMETER_PREFIX = "P"
+DELTA_PARAMETER_SEPARATOR = ":"
+DELTA_BAR_PREFIX = "B"
+HEX_BASE = 16
+HASH_LINE_SIZE = 9  # 8 hexadecimal digits, and a newline
+
+# Memories each upload code writes to, as the codes used to read them
+DELTA_LOAD_CODES = {
+    SQ_TO_RAM_CHAR: (LOAD_SQ_FROM_RAM_CODE,),
+    SQ_TO_EEPROM_CHAR: (LOAD_SQ_FROM_EEPROM_CODE,),
+    SQ_TO_BOTH_CHAR: (LOAD_SQ_FROM_RAM_CODE, LOAD_SQ_FROM_EEPROM_CODE),
+}
+
+# Packed beats. Beats made only of lane states ('0' or '1') are sent
+# as a bit stream, one bit per lane, most significant bit first, padded
+# to a whole byte. Packed block uploads use the lower case location code,
+# and their payload is the metadata lines, a line holding the number of
+# lanes ("<lanes>", or "<lanes>:R" if run-length compressed), then the
+# packed beats.
+# Packed downloads are requested with the lower case load code. The device
+# replies with the metadata lines, BUFFER, "<lanes>:<beats>" (followed by
+# ":<size>" if run-length compressed to size bytes), the packed beats, and
+# END_TRANSFER. Devices that cannot pack reply NAK_PREFIX.
+LANE_STATES = "01"
+MAX_PACKED_LANES = 8
+BITS_PER_BYTE = 8
+BINARY_BASE = 2
+PACKED_SEPARATOR = ":"
+PACKED_TIMEOUT = 0.5
+
+# Packed beats are run-length compressed (PackBits) whenever that makes
+# them smaller. Each run starts with a header byte: 0 to 127 is followed
+# by that many plus one literal bytes, 129 to 255 by a single byte that is
+# repeated 257 minus the header times.
+RLE_CODE = "R"
+RLE_MAX_LITERAL = 128
+RLE_MAX_REPEAT = 128
+RLE_MIN_REPEAT = 3
+RLE_REPEAT_BASE = 257
+
+# Windowed transfer acknowledgements are sent by the device as
+# "A<count>", where count is the cumulative number of beats committed.
+ACKNOWLEDGE_PREFIX = "A"
+
+# Devices abandon a stalled windowed upload, but keep the pages already
+# committed. A resume request is answered with "A<count>", so the host
+# can continue from that beat, or NAK_PREFIX if there is nothing to resume.
+RESUME_TIMEOUT = 0.5
+MAX_RESUME_ATTEMPTS = 2
+
+# Devices answer IDENTIFY_CODE with IDENTIFY_PREFIX followed by their
+# firmware version (e.g. "TPMANIA 2.0.0"). Legacy firmware never answers,
+# but is recognised by its reply to a timing windows request.
+IDENTIFY_PREFIX = "TPMANIA "
+IDENTIFY_TIMEOUT = 0.5
+LEGACY_FIRMWARE_VERSION = "legacy"
+
+# Transactions batch several operations behind one handshake. Once the
+# device answers TRANSACTION_CODE with READY_CODE, each operation is sent
+# as a frame (see FRAME_HEADER_FORMAT) holding its command code:
+#   S, E or B: sequence, laid out as a framed transfer payload
+#   T: newline terminated timing window values
+#   W: empty, the device sends its timing windows back
+# and an empty END_TRANSFER frame commits them. The device then runs the
+# operations in order, sending "A<count>" after each (timing windows
+# requested are sent before it), and END_TRANSFER once all have run.
+# Damaged transactions are discarded, and answered with NAK_PREFIX.
+UPLOAD_CODES = (SQ_TO_RAM_CHAR, SQ_TO_EEPROM_CHAR, SQ_TO_BOTH_CHAR)
+
+# Phases of a protocol command, timed by TransferTimings. Framed and block
+# uploads send metadata and beats in a single payload, timed as beats.
+PHASE_COMMAND = "command"
+PHASE_READY_WAIT = "ready_wait"
+PHASE_METADATA = "metadata"
+PHASE_BEATS = "beats"
+PHASE_VALUES = "values"
+PHASE_END_WAIT = "end_wait"
+PHASE_RECEIVE = "receive"
+PHASE_FILE_WRITE = "file_write"
+PHASE_NEGOTIATION = "negotiation"
+PHASE_HASHES = "hashes"
+PHASE_RESUME = "resume"
+PHASE_OPERATIONS = "operations"
+
+# Phase timed while waiting on each response code
+RESPONSE_PHASES = {
+    READY_CODE: PHASE_READY_WAIT,
+    END_TRANSFER: PHASE_END_WAIT,
+}
+
+
+class TransferTimings:
+    '''
+    Time spent in each phase of a protocol command, measured with
+    time.perf_counter(), alongside the command's exit status.
+
+    Phases never overlap. Time spent in a phase entered from within
+    another is only counted towards the inner phase, and phases entered
+    more than once accumulate.
+
+    Parameters:
+        command (str): Name of the command being timed
+    '''
+    def __init__(self, command: str) -> None:
+        ''' Starts timing the command '''
+        self._command = command
+        self._status = None
+        self._phases = {}
+        self._start = time.perf_counter()
+        self._total = 0.0
+
+        # Phases entered, innermost last, and when time was last counted
+        self._stack = []
+        self._counted = self._start
+        self._finished = False
+
+    def get_command(self) -> str:
+        ''' Returns the name of the command timed '''
+        return self._command
+
+    def get_status(self) -> Any:
+        ''' Returns the command's exit status, or None if it failed '''
+        return self._status
+
+    def get_phases(self) -> dict[str, float]:
+        ''' Returns the time spent in each phase (in seconds) '''
+        return dict(self._phases)
+
+    def get_total(self) -> float:
+        ''' Returns the time the whole command took (in seconds) '''
+        return self._total
+
+    def is_finished(self) -> bool:
+        ''' Returns True once the command has finished '''
+        return self._finished
+
+    def finish(self, status: Any) -> None:
+        ''' Records the exit status, and stops timing the command '''
+        self._status = status
+        self._total = time.perf_counter() - self._start
+        self._finished = True
+
+    def as_dict(self) -> dict:
+        '''
+        Returns the timings as a dictionary. Time not spent in any phase
+        is reported as "other".
+        '''
+        phases = self.get_phases()
+        return {
+            "command": self._command,
+            "status": self._status,
+            "total": self._total,
+            "phases": phases,
+            "other": max(self._total - sum(phases.values()), 0.0),
+        }
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        ''' Times the code run within the context as phase name '''
+        self._count()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._count()
+            self._stack.pop()
+
+    def _count(self) -> None:
+        ''' Counts time since it was last counted, to the current phase '''
+        now = time.perf_counter()
+        if (self._stack):
+            name = self._stack[-1]
+            self._phases[name] = (
+                self._phases.get(name, 0.0) + now - self._counted
+            )
+        self._counted = now
+
+
+def timed_command(command: Callable[..., Any]) -> Callable[..., Any]:
+    '''
+    Decorates a DeviceProtocol command, so each call is timed by a new
+    TransferTimings. Commands returning a tuple have their status first.
+    Commands run by another timed command count towards its timings.
+    '''
+    @functools.wraps(command)
+    def run(protocol: "DeviceProtocol", *args: Any, **kwargs: Any) -> Any:
+        timings = protocol.get_timings()
+        if (timings is not None) and (not timings.is_finished()):
+            return command(protocol, *args, **kwargs)
+
+        timings = TransferTimings(command.__name__)
+        protocol.set_timings(timings)
+
+        status = None
+        try:
+            result = command(protocol, *args, **kwargs)
+            status = result[0] if isinstance(result, tuple) else result
+            return result
+        finally:
+            timings.finish(status)
+
+    return run
+
+
+class DeviceProtocol:
+    '''
+    A class implementing the serial communication protocol spoken by the
+    micro-controller, over an open serial connection.
+
+    It has no dependency on the GUI, and every transfer returns an exit
+    status code.
+    '''
+    def __init__(self, connection: serial.Serial) -> None:
+        ''' Initialises the protocol over an open serial connection '''
+        self._connection = connection
+        self._response_code = STATUS_SUCCESS
+
+        # New connections attempt faster uploads first
+        self._upload_mode = DEFAULT_UPLOAD_MODE
+        self._eeprom_upload_mode = DEFAULT_EEPROM_UPLOAD_MODE
+        self._delta_uploads = True
+        self._packed_beats = True
+        self._packed_downloads = True
+        self._transactions = True
+
+        # Interrupted windowed EEPROM upload (if any), as
+        # (parameters, beats, window), kept so it can be resumed.
+        self._eeprom_session = None
+
+        # Paces line uploads, created on the first line upload
+        self._pacer = None
+
+        # Phase timings of the latest command
+        self._timings = None
+
+        # Token cancelling the running command (if any)
+        self._cancel_token = None
+
+    @classmethod
+    def open(
+            cls,
+            port: str,
+            log_path: str | None = None,
+    ) -> "DeviceProtocol":
+        '''
+        Opens a serial connection on the given port at BAUD_RATE, and
+        negotiates the fastest baud rate supported by both sides.
+
+        Parameters:
+            port (str): Serial port name (e.g. COM3)
+            log_path (str): Path to record the session to, or None to
+                not record it
+
+        Returns:
+            (DeviceProtocol): Protocol over the opened connection
+        '''
+        connection = serial.Serial(
+            port,
+            BAUD_RATE,
+            timeout=READ_TIMEOUT,
+            write_timeout=WRITE_TIMEOUT,
+        )
+        if (log_path is not None):
+            connection = SerialRecorder(connection, log_path)
+        protocol = cls(connection)
+        try:
+            protocol.negotiate_baud_rate()
+        except Exception:
+            connection.close()
+            raise
+        return protocol
+
+    def get_connection(self) -> serial.Serial:
+        ''' Returns the serial connection to the micro-controller '''
+        return self._connection
+
+    def get_response_code(self) -> int:
+        ''' Returns the most recent response code '''
+        return self._response_code
+
+    def get_upload_mode(self) -> str:
+        ''' Returns the mode used to upload sequences to the device '''
+        return self._upload_mode
+
+    def get_eeprom_upload_mode(self) -> str:
+        ''' Returns the mode used to upload sequences to device EEPROM '''
+        return self._eeprom_upload_mode
+
+    def get_delta_uploads(self) -> bool:
+        ''' Returns True if uploads only send changes to the device '''
+        return self._delta_uploads
+
+    def set_delta_uploads(self, enabled: bool) -> None:
+        ''' Sets whether uploads only send changes to the device '''
+        self._delta_uploads = enabled
+
+    def get_packed_beats(self) -> bool:
+        ''' Returns True if beats are sent to the device packed '''
+        return self._packed_beats
+
+    def set_packed_beats(self, enabled: bool) -> None:
+        ''' Sets whether beats are sent to the device packed '''
+        self._packed_beats = enabled
+
+    def get_transactions(self) -> bool:
+        ''' Returns True if operations are batched into transactions '''
+        return self._transactions
+
+    def set_transactions(self, enabled: bool) -> None:
+        ''' Sets whether operations are batched into transactions '''
+        self._transactions = enabled
+
+    def get_packed_downloads(self) -> bool:
+        ''' Returns True if beats are requested from the device packed '''
+        return self._packed_downloads
+
+    def set_packed_downloads(self, enabled: bool) -> None:
+        ''' Sets whether beats are requested from the device packed '''
+        self._packed_downloads = enabled
+
+    def get_eeprom_session(self) -> tuple[list, list[str], int] | None:
+        '''
+        Returns the interrupted EEPROM upload as (parameters, beats, window),
+        or None if there is no upload to resume.
+        '''
+        return self._eeprom_session
+
+    def set_eeprom_session(
+            self,
+            session: tuple[list, list[str], int] | None,
+    ) -> None:
+        ''' Sets the interrupted EEPROM upload '''
+        self._eeprom_session = session
+
+    def get_pacer(self) -> "AdaptivePacer":
+        '''
+        Returns the pacer used for line uploads to RAM. The first call asks
+        the device for its receive buffer size.
+        '''
+        if (self._pacer is None):
+            self._pacer = AdaptivePacer(self.query_receive_buffer())
+        return self._pacer
+
+    def get_timings(self) -> TransferTimings | None:
+        '''
+        Returns the phase timings of the latest sequence transfer,
+        download, or timing windows command (if any).
+        '''
+        return self._timings
+
+    def set_timings(self, timings: TransferTimings | None) -> None:
+        ''' Sets the phase timings of the latest command '''
+        self._timings = timings
+
+    def get_cancel_token(self) -> CancellationToken | None:
+        ''' Returns the token cancelling the running command (if any) '''
+        return self._cancel_token
+
+    def set_cancel_token(self, token: CancellationToken | None) -> None:
+        '''
+        Sets the token cancelling commands. Once cancelled, commands raise
+        TransferCancelled at their next read, write or wait, and any
+        blocking read is interrupted.
+        '''
+        self._cancel_token = token
+        if (token is not None):
+            token.add_callback(self.interrupt)
+
+    def interrupt(self) -> None:
+        ''' Interrupts a blocking read, if the connection supports it '''
+        cancel_read = getattr(self.get_connection(), "cancel_read", None)
+        if (cancel_read is not None):
+            cancel_read()
+
+    def check_cancelled(self) -> None:
+        '''
+        Raises:
+            TransferCancelled: If the running command has been cancelled
+        '''
+        if (self._cancel_token is not None):
+            self._cancel_token.raise_if_cancelled()
+
+    def sleep(self, seconds: float) -> None:
+        '''
+        Sleeps for the given time, waking early if the running command is
+        cancelled.
+
+        Raises:
+            TransferCancelled: If the running command is cancelled
+        '''
+        if (self._cancel_token is None):
+            time.sleep(seconds)
+        else:
+            self._cancel_token.sleep(seconds)
+
+    def phase(self, name: str) -> contextlib.AbstractContextManager:
+        '''
+        Returns a context manager timing the code run within it as a phase
+        of the latest command, or doing nothing if it is not timed.
+        '''
+        if (self._timings is None):
+            return contextlib.nullcontext()
+        return self._timings.phase(name)
+
+    def set_response_code(self, response: int) -> None:
+        ''' Set most recent response code '''
+        self._response_code = response
+
+    def set_upload_mode(self, mode: str) -> None:
+        ''' Sets the mode used to upload sequences to the device '''
+        self._upload_mode = mode
+
+    def set_eeprom_upload_mode(self, mode: str) -> None:
+        ''' Sets the mode used to upload sequences to device EEPROM '''
+        self._eeprom_upload_mode = mode
+
+    def disable_extensions(self) -> None:
+        '''
+        Stops using every command legacy firmware lacks, so its uploads
+        and downloads never wait on a probe again.
+        '''
+        self.set_upload_mode(UPLOAD_MODE_LINE)
+        self.set_eeprom_upload_mode(UPLOAD_MODE_LINE)
+        self.set_delta_uploads(False)
+        self.set_transactions(False)
+        self.set_packed_downloads(False)
+
+    def close(self) -> None:
+        ''' Closes the serial connection '''
+        self.get_connection().close()
+
+    def write(self, data: str) -> None:
+        '''
+        Encodes and writes data to the serial connection, see
+        write_bytes().
+        '''
+        self.check_cancelled()
+        self.write_bytes(data.encode(DATA_ENCODING_TYPE))
+
+    def write_bytes(self, data: bytes) -> None:
+        '''
+        Writes data to the serial connection in slices, each sent well
+        within WRITE_TIMEOUT at the current baud rate, so bulk writes
+        never time out part way through.
+
+        Raises:
+            TransferCancelled: If the running command is cancelled
+        '''
+        connection = self.get_connection()
+        size = get_write_slice_size(connection.baudrate)
+        for start in range(0, len(data), size):
+            self.check_cancelled()
+            connection.write(data[start:start + size])
+
+    def serial_readline(self) -> str:
+        ''' Reads a line from the configured serial connection '''
+        line = (
+            self.get_connection()
+            .readline()
+            .decode(DATA_ENCODING_TYPE, errors="ignore")
+            .strip()
+            .lstrip(NULL_CHAR)
+            .rstrip(NULL_CHAR)
+        )
+        return line
+
+    def serial_readline_before(self, deadline: float) -> str:
+        '''
+        Reads a line from the configured serial connection, blocking until
+        a full line arrives or the deadline passes. Returns the instant
+        the line arrives, rather than polling.
+
+        Parameters:
+            deadline (float): time.monotonic() value to stop waiting at
+
+        Returns:
+            (str): Line read, or an empty string if the deadline passed
+
+        Raises:
+            TransferCancelled: If the running command is cancelled
+        '''
+        self.check_cancelled()
+        remaining = deadline - time.monotonic()
+        if (remaining <= 0):
+            return EMPTY_STRING
+
+        connection = self.get_connection()
+        connection.timeout = remaining
+        try:
+            line = self.serial_readline()
+        finally:
+            connection.timeout = READ_TIMEOUT
+
+        # Reads interrupted by cancellation return early
+        self.check_cancelled()
+        return line
+
+    def wait_for_response(
+            self,
+            code: str,
+            timeout: float = MAX_WAIT_TIME,
+    ) -> int:
+        '''
+        Wait for response code from device.
+
+        Parameters:
+            code (str): Code indicating the memory location
+            timeout (float): Maximum time to wait for the code (in seconds)
+
+        Returns:
+            (int): Exit status of process
+        '''
+        with self.phase(RESPONSE_PHASES.get(code, PHASE_RECEIVE)):
+            return self.read_response(code, timeout)
+
+    def read_response(self, code: str, timeout: float) -> int:
+        '''
+        Reads lines from the device until one matches code.
+
+        Parameters:
+            code (str): Code to wait for
+            timeout (float): Maximum time to wait for the code (in seconds)
+
+        Returns:
+            (int): Exit status of process
+        '''
+        deadline = time.monotonic() + timeout
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+
+            # If no data read before the deadline
+            if (line == EMPTY_STRING):
+                continue
+
+            PROTOCOL_LOG.debug("Received", line=line, expected=code)
+
+            if (line == code):
+                # No more data, code character reached
+                self.set_response_code(STATUS_SUCCESS)
+                return STATUS_SUCCESS
+
+        self.set_response_code(STATUS_TIMEOUT)
+        return STATUS_TIMEOUT
+
+    def negotiate_baud_rate(self) -> int:
+        '''
+        Asks the device which baud rates it supports, and switches both
+        the device and host to the fastest rate they have in common.
+
+        The new rate is verified with a ping, if verification fails the
+        host reverts to BAUD_RATE, and the device reverts on its own.
+
+        Returns:
+            (int): Baud rate in use once negotiation has finished
+        '''
+        connection = self.get_connection()
+
+        # Request list of supported rates, devices without negotiation
+        # support never respond, and remain at the default rate.
+        self.write(QUERY_BAUD_RATES_CODE)
+        supported = []
+        deadline = time.monotonic() + NEGOTIATION_TIMEOUT
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+            if (line == END_TRANSFER):
+                break
+            if (line.isdigit()):
+                supported.append(int(line))
+
+        rate = choose_baud_rate(supported)
+        if (rate == connection.baudrate):
+            return connection.baudrate
+
+        # Request switch, device acknowledges at the current rate
+        # before changing its own rate.
+        self.write(f"{SET_BAUD_RATE_CODE}{rate}{NEWLINE}")
+        self.wait_for_response(READY_CODE, NEGOTIATION_TIMEOUT)
+        if (self.get_response_code() == STATUS_TIMEOUT):
+            return connection.baudrate
+
+        connection.flush()
+        connection.baudrate = rate
+        self.sleep(BAUD_SETTLE_WAIT)
+        connection.reset_input_buffer()
+
+        # Verify both sides communicate at new rate
+        self.write(PING_CODE)
+        self.wait_for_response(READY_CODE, NEGOTIATION_TIMEOUT)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            PROTOCOL_LOG.info("Baud rate negotiated", rate=rate)
+            return rate
+
+        # Verification failed, wait for device to revert and follow it
+        PROTOCOL_LOG.warning("Baud rate failed verification", rate=rate)
+        connection.baudrate = BAUD_RATE
+        self.sleep(BAUD_REVERT_WAIT)
+        connection.reset_input_buffer()
+        return connection.baudrate
+
+    @timed_command
+    def transfer_sequence(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int:
+        '''
+        Transfers a sequence to the device.
+
+        If the device already holds a similar sequence, only the changed
+        parameters and bars are sent. Otherwise the sequence is sent as
+        checksummed blocks or a single frame when the device supports it,
+        EEPROM only uploads are sent with windowed flow control, and
+        metadata and beats are sent line by line as a last resort.
+
+        Parameters:
+            code (str): Code indicating the memory location (S, E or B)
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process
+        '''
+        flow_control_active = (code == SQ_TO_EEPROM_CHAR)
+
+        # Send only changes, when the device supports it
+        if (self.get_delta_uploads()):
+            status = self.transfer_sequence_delta(code, parameters, beats)
+            if (status is not None):
+                return status
+
+        # Attempt windowed EEPROM upload, falling back to line by line
+        # uploads if the device does not support windowed transfers.
+        if (flow_control_active):
+            if (self.get_eeprom_upload_mode() == UPLOAD_MODE_WINDOWED):
+                status = self.transfer_sequence_windowed(parameters, beats)
+                if (status is not None):
+                    return status
+                self.set_eeprom_upload_mode(UPLOAD_MODE_LINE)
+
+        # Attempt block and framed uploads, falling back to the next mode
+        # whenever the device does not support the current one.
+        else:
+            while (self.get_upload_mode() != UPLOAD_MODE_LINE):
+                if (self.get_upload_mode() == UPLOAD_MODE_BLOCKS):
+                    status = self.transfer_sequence_blocks(
+                        code,
+                        parameters,
+                        beats,
+                    )
+                else:
+                    status = self.transfer_sequence_frame(
+                        code,
+                        parameters,
+                        beats,
+                    )
+
+                if (status is not None):
+                    return status
+                # Legacy firmware falls straight back to line uploads
+                self.set_upload_mode(FALLBACK_UPLOAD_MODES.get(
+                    self.get_upload_mode(),
+                    UPLOAD_MODE_LINE,
+                ))
+
+        # The receive buffer size must be known before the transfer starts
+        if (not flow_control_active):
+            with self.phase(PHASE_NEGOTIATION):
+                self.get_pacer()
+
+        # Transmit code char to micro-controller to
+        # communicate that sequence file is being sent
+        with self.phase(PHASE_COMMAND):
+            self.write(code)
+        PROTOCOL_LOG.debug("Sent command", code=code)
+
+        start = time.monotonic()
+        self.wait_for_response(READY_CODE)
+        if (self.get_response_code() == STATUS_TIMEOUT):
+            return STATUS_TIMEOUT
+        handshake_time = time.monotonic() - start
+
+        # Transmit sequence metadata line by line.
+        # Each parameter is newline terminated.
+        with self.phase(PHASE_METADATA):
+            for param in parameters:
+                PROTOCOL_LOG.debug("Sent parameter", value=param)
+                self.write(f"{param}{NEWLINE}")
+
+            self.sleep(DECENT_WAIT)  # This helps
+
+        # RAM modes have no flow control, and are paced by the device
+        # receive buffer instead.
+        if (not flow_control_active):
+            return self.send_paced_beats(beats, handshake_time)
+
+        # --- Transmit sequence beats ---
+        for i, line in enumerate(beats):
+
+            # EEPROM mode, wait for ready signal
+            self.wait_for_response(READY_CODE)
+            if (self.get_response_code() == STATUS_TIMEOUT):
+                return STATUS_TIMEOUT
+
+            # Transmit beat
+            with self.phase(PHASE_BEATS):
+                self.write(line)
+            PROTOCOL_LOG.debug("Sent beat", index=i + 1, beat=line)
+
+        # Read responses back from micro-controller and print to terminal
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            return STATUS_SUCCESS
+
+        return STATUS_TIMEOUT
+
+    def send_paced_beats(
+            self,
+            beats: list[str],
+            handshake_time: float,
+    ) -> int:
+        '''
+        Sends beats in chunks that fit the device receive buffer, waiting
+        between chunks for the device to handle them.
+
+        Parameters:
+            beats (list[str]): Newline terminated beat lines
+            handshake_time (float): Time the device took to answer the
+                upload code, the round trip that isn't spent on beats
+
+        Returns:
+            (int): Exit status of process
+        '''
+        pacer = self.get_pacer()
+        chunks = pacer.split(beats)
+        start = time.monotonic()
+        with self.phase(PHASE_BEATS):
+            for index, chunk in enumerate(chunks):
+                if (index != 0):
+                    self.sleep(pacer.get_delay(len(chunks[index - 1])))
+
+                self.write(EMPTY_STRING.join(chunk))
+                PROTOCOL_LOG.debug("Sent beats", count=len(chunk))
+
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            pacer.record_success(
+                time.monotonic() - start - handshake_time,
+                len(beats),
+            )
+            return STATUS_SUCCESS
+
+        pacer.record_failure()
+        return STATUS_TIMEOUT
+
+    def query_receive_buffer(self) -> int:
+        '''
+        Asks the device for the size of its receive buffer.
+
+        Returns:
+            (int): Receive buffer size (in bytes), or DEFAULT_RECEIVE_BUFFER
+            if the device did not report one
+        '''
+        self.write(QUERY_RECEIVE_BUFFER_CODE)
+        size = self.read_device_integer(RECEIVE_BUFFER_TIMEOUT)
+        if (size is None) or (size <= 0):
+            return DEFAULT_RECEIVE_BUFFER
+
+        PROTOCOL_LOG.info("Device receive buffer", size=size)
+        return size
+
+    def probe_extension(self, code: str) -> bool | None:
+        '''
+        Sends the code of an optional command, and waits briefly for the
+        device to answer ready. If it does not, the device is asked to
+        identify itself, telling a device lacking the command apart from
+        one that is not answering at all (e.g. not on the Main Menu).
+
+        Parameters:
+            code (str): Code of the optional command
+
+        Returns:
+            (bool): True if the device is ready for the command, False if
+            it lacks the command, or None if the device did not answer
+        '''
+        with self.phase(PHASE_COMMAND):
+            self.write(code)
+        self.wait_for_response(READY_CODE, NEGOTIATION_TIMEOUT)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            return True
+
+        if (not self.lacks_extension(code)):
+            return None
+        return False
+
+    def lacks_extension(self, code: str) -> bool:
+        '''
+        Asks a device that did not answer an optional command to identify
+        itself. Legacy firmware has every optional command disabled.
+
+        Parameters:
+            code (str): Code of the optional command
+
+        Returns:
+            (bool): True if the device answered, so it lacks the command,
+            or False if the device is not answering at all
+        '''
+        identity = self.identify()
+        if (identity is None):
+            PROTOCOL_LOG.warning("No answer to probe", code=code)
+            return False
+
+        PROTOCOL_LOG.info("Command not supported", code=code)
+        if (identity == LEGACY_FIRMWARE_VERSION):
+            self.disable_extensions()
+        return True
+
+    def transfer_sequence_frame(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int | None:
+        '''
+        Transmits the sequence metadata and beats to the device as a single
+        length-prefixed frame, which the device acknowledges once.
+
+        Parameters:
+            code (str): Code indicating the memory location
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process, or None if the device does not
+            support framed transfers
+        '''
+        # Build frame before starting the transfer, so the device is
+        # never left waiting on the host.
+        frame = build_sequence_frame(code, parameters, beats)
+
+        # Transmit framed transfer code, devices without framed
+        # transfer support never respond with ready.
+        supported = self.probe_extension(FRAMED_TRANSFER_CHAR)
+        if (supported is None):
+            return STATUS_TIMEOUT
+        if (not supported):
+            return None
+
+        # Transmit entire sequence, without waiting between slices
+        with self.phase(PHASE_BEATS):
+            self.write_bytes(frame)
+        PROTOCOL_LOG.debug("Sent frame", size=len(frame), beats=len(beats))
+
+        # Device acknowledges frame once it has been stored
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            return STATUS_SUCCESS
+
+        return STATUS_TIMEOUT
+
+    def transfer_sequence_blocks(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int | None:
+        '''
+        Transmits the sequence metadata and beats to the device as
+        checksummed blocks. The device reports damaged or missing blocks
+        once it stops receiving, and only those blocks are resent.
+        Beats are packed when enabled, and every beat is made of lane states.
+
+        Parameters:
+            code (str): Code indicating the memory location
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process, or None if the device does not
+            support block transfers
+        '''
+        blocks = self.build_upload_blocks(code, parameters, beats)
+
+        # Transmit block transfer code, devices without block
+        # transfer support never respond with ready.
+        supported = self.probe_extension(BLOCK_TRANSFER_CHAR)
+        if (supported is None):
+            return STATUS_TIMEOUT
+        if (not supported):
+            return None
+
+        return self.send_blocks(blocks)
+
+    def build_upload_blocks(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> list[bytes]:
+        '''
+        Builds the blocks of a full block upload, with beats packed when
+        enabled and every beat is made of lane states.
+
+        Parameters:
+            code (str): Code indicating the memory location (S, E or B)
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (list[bytes]): Encoded blocks, in order
+        '''
+        packed = None
+        if (self.get_packed_beats()):
+            packed = pack_beats(beats)
+
+        if (packed is None):
+            return build_sequence_blocks(code, parameters, beats)
+        return build_packed_blocks(code, parameters, *packed)
+
+    def send_blocks(self, blocks: list[bytes]) -> int:
+        '''
+        Sends checksummed blocks to the device, resending any it reports
+        as damaged or missing.
+
+        Parameters:
+            blocks (list[bytes]): Encoded blocks, in order
+
+        Returns:
+            (int): Exit status of process
+        '''
+        pending = range(len(blocks))
+        for _ in range(MAX_RETRANSMITS + 1):
+            with self.phase(PHASE_BEATS):
+                self.write_bytes(
+                    b"".join(blocks[index] for index in pending)
+                )
+            PROTOCOL_LOG.debug("Sent blocks", blocks=list(pending))
+
+            with self.phase(PHASE_END_WAIT):
+                status, pending = self.wait_for_block_status(len(blocks))
+            if (status != STATUS_SUCCESS) or (len(pending) == 0):
+                return status
+
+        return STATUS_TIMEOUT
+
+    def transfer_sequence_delta(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int | None:
+        '''
+        Sends only the parameters and bars which differ from the sequence
+        already stored on the device, as a block transfer. Skipped when
+        the full upload is no larger than the hashes exchanged, or than
+        the changes.
+
+        Parameters:
+            code (str): Code indicating the memory location (S, E or B)
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process, or None if a full upload should
+            be sent instead (delta uploads are disabled if the device
+            lacks them)
+        '''
+        # Changes are sent as blocks, which the device must support
+        if (self.get_upload_mode() != UPLOAD_MODE_BLOCKS):
+            return None
+
+        # Compare against the full upload as it would be sent (packed
+        # and compressed), not as text.
+        full_size = blocks_size(
+            self.build_upload_blocks(code, parameters, beats)
+        )
+        load_codes = DELTA_LOAD_CODES[code]
+        exchange_size = len(load_codes) * hash_exchange_size(
+            len(parameters),
+            len(beats),
+        )
+        if (exchange_size >= full_size):
+            PROTOCOL_LOG.debug(
+                "Full upload smaller than hashes",
+                full_size=full_size,
+                exchange_size=exchange_size,
+            )
+            return None
+
+        # Request hashes of each memory being written to. Both memories
+        # must hold the same sequence to update them together.
+        stored = []
+        for load_code in load_codes:
+            with self.phase(PHASE_HASHES):
+                hashes = self.request_sequence_hashes(load_code)
+            if (hashes is None):
+                return None
+            stored.append(hashes)
+
+        if (any(hashes != stored[0] for hashes in stored)):
+            return None
+
+        payload = build_delta_payload(parameters, beats, *stored[0])
+        if (payload is None):
+            return None
+
+        if (len(payload) == 0):
+            PROTOCOL_LOG.info("Sequence already stored on device")
+            return STATUS_SUCCESS
+
+        blocks = build_blocks(code, payload)
+        if (blocks_size(blocks) >= full_size):
+            return None
+
+        supported = self.probe_extension(DELTA_TRANSFER_CHAR)
+        if (supported is None):
+            return STATUS_TIMEOUT
+        if (not supported):
+            self.set_delta_uploads(False)
+            return None
+
+        PROTOCOL_LOG.debug("Sending delta", size=len(payload))
+        return self.send_blocks(blocks)
+
+    def request_sequence_hashes(
+            self,
+            code: str,
+    ) -> tuple[list[int], list[int]] | None:
+        '''
+        Requests hashes of the sequence stored in device RAM or EEPROM.
+        Disables delta uploads if the device does not respond, but does
+        answer identification.
+
+        Parameters:
+            code (str): Code indicating the memory location (R or N)
+
+        Returns:
+            (tuple): Hash of each metadata parameter, and of each bar of
+            beats (both empty if nothing is stored), or None if the
+            device did not respond
+        '''
+        self.write(f"{REQUEST_HASHES_CODE}{code.lower()}")
+
+        hashes = ([], [])
+        section = 0
+        deadline = time.monotonic() + HASH_TIMEOUT
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+
+            # Data arrived, restart the idle timeout
+            deadline = time.monotonic() + HASH_TIMEOUT
+
+            if (line == END_TRANSFER):
+                return hashes
+
+            if (line == BUFFER):
+                section = 1
+                continue
+
+            try:
+                hashes[section].append(int(line, HEX_BASE))
+            except ValueError:
+                PROTOCOL_LOG.warning("Expected hash", line=line)
+                return None
+
+        if (self.lacks_extension(REQUEST_HASHES_CODE)):
+            self.set_delta_uploads(False)
+        return None
+
+    def wait_for_block_status(self, count: int) -> tuple[int, list[int]]:
+        '''
+        Waits for the device to end a block transfer, or to request
+        blocks be resent.
+
+        Parameters:
+            count (int): Number of blocks in the transfer
+
+        Returns:
+            (tuple): Exit status of process, and the indices of blocks
+            to resend (empty if the transfer completed)
+        '''
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+
+            if (line == END_TRANSFER):
+                return (STATUS_SUCCESS, [])
+
+            pending = parse_nak(line, count)
+            if (pending is not None):
+                PROTOCOL_LOG.warning("Device requested blocks", blocks=pending)
+                return (STATUS_SUCCESS, pending)
+
+            PROTOCOL_LOG.debug("Waiting for block status", line=line)
+
+        return (STATUS_TIMEOUT, [])
+
+    def transfer_sequence_windowed(
+            self,
+            parameters: list,
+            beats: list[str],
+    ) -> int | None:
+        '''
+        Transmits the sequence to device EEPROM using windowed flow control.
+
+        After the ready code, the device reports its EEPROM page size in
+        beats. The host then keeps up to EEPROM_WINDOW_PAGES pages of beats
+        in flight, and the device acknowledges each page once committed
+        with the cumulative number of beats written.
+
+        If the upload stalls, it is resumed from the last beat the device
+        committed. An upload of the same sequence that timed out previously
+        is resumed rather than restarted.
+
+        Parameters:
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Exit status of process, or None if the device does not
+            support windowed transfers
+        '''
+        # Resume interrupted upload of the same sequence, if the device
+        # still holds it.
+        committed = None
+        session = self.get_eeprom_session()
+        if (session is not None) and (session[:2] == (parameters, beats)):
+            window = session[2]
+            with self.phase(PHASE_RESUME):
+                committed = self.resume_eeprom_upload()
+        self.set_eeprom_session(None)
+
+        if (committed is None):
+            supported = self.probe_extension(WINDOWED_EEPROM_CHAR)
+            if (supported is None):
+                return STATUS_TIMEOUT
+            if (not supported):
+                return None
+
+            # Device reports the number of beats per EEPROM page
+            with self.phase(PHASE_READY_WAIT):
+                page_beats = self.read_device_integer()
+            if (page_beats is None) or (page_beats <= 0):
+                return STATUS_TIMEOUT
+            window = page_beats * EEPROM_WINDOW_PAGES
+
+            # Transmit all metadata parameters in a single write
+            with self.phase(PHASE_METADATA):
+                self.write(
+                    EMPTY_STRING.join(
+                        f"{param}{NEWLINE}" for param in parameters
+                    )
+                )
+            committed = 0
+
+        for attempt in range(MAX_RESUME_ATTEMPTS + 1):
+            if (attempt > 0):
+                with self.phase(PHASE_RESUME):
+                    committed = self.resume_eeprom_upload()
+                if (committed is None):
+                    break
+
+            with self.phase(PHASE_BEATS):
+                status = self.send_windowed_beats(beats, committed, window)
+            if (status != STATUS_TIMEOUT):
+                return status
+
+        # Keep the session, so the next upload of this sequence resumes it
+        self.set_eeprom_session((parameters, beats, window))
+        return STATUS_TIMEOUT
+
+    def send_windowed_beats(
+            self,
+            beats: list[str],
+            committed: int,
+            window: int,
+    ) -> int:
+        '''
+        Sends beats from the first beat not yet committed, keeping up to
+        window beats in flight, until the device ends the transfer.
+
+        Parameters:
+            beats (list[str]): Newline terminated beat lines
+            committed (int): Beats the device has already committed
+            window (int): Maximum number of unacknowledged beats
+
+        Returns:
+            (int): Exit status of process
+        '''
+        # Keep the window full, and wait for page acknowledgements
+        sent = committed
+        acknowledged = committed
+        while (acknowledged < len(beats)):
+            if (sent < len(beats)) and (sent - acknowledged < window):
+                limit = min(len(beats), acknowledged + window)
+                self.write(EMPTY_STRING.join(beats[sent:limit]))
+                PROTOCOL_LOG.debug("Sent beats", first=sent + 1, last=limit)
+                sent = limit
+                continue
+
+            count = self.wait_for_acknowledgement(acknowledged)
+            if (count is None):
+                return STATUS_TIMEOUT
+            acknowledged = count
+
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            return STATUS_SUCCESS
+
+        return STATUS_TIMEOUT
+
+    def resume_eeprom_upload(self) -> int | None:
+        '''
+        Asks the device to resume an interrupted windowed EEPROM upload.
+
+        Returns:
+            (int): Number of beats the device has committed, or None if
+            the device has no upload to resume
+        '''
+        self.write(RESUME_EEPROM_CODE)
+
+        deadline = time.monotonic() + RESUME_TIMEOUT
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+
+            if (line.startswith(NAK_PREFIX)):
+                return None
+
+            count = parse_acknowledgement(line)
+            if (count is not None):
+                PROTOCOL_LOG.info("Resuming EEPROM upload", beat=count)
+                return count
+
+        return None
+
+    def read_device_integer(
+            self,
+            timeout: float = MAX_WAIT_TIME,
+    ) -> int | None:
+        '''
+        Reads a single integer value sent by the device.
+
+        Parameters:
+            timeout (float): Maximum time to wait for the value (in seconds)
+
+        Returns:
+            (int): Value read, or None if nothing valid arrived in time
+        '''
+        deadline = time.monotonic() + timeout
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+            try:
+                return int(line)
+            except ValueError:
+                PROTOCOL_LOG.warning("Expected integer", line=line)
+                return None
+        return None
+
+    def wait_for_acknowledgement(self, acknowledged: int) -> int | None:
+        '''
+        Waits for the device to acknowledge more beats than have
+        already been acknowledged.
+
+        Parameters:
+            acknowledged (int): Beats acknowledged so far
+
+        Returns:
+            (int): Cumulative number of beats the device has committed,
+            or None if no acknowledgement arrived in time
+        '''
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+
+            count = parse_acknowledgement(line)
+            if (count is not None) and (count > acknowledged):
+                return count
+            PROTOCOL_LOG.debug("Waiting for acknowledgement", line=line)
+
+        return None
+
+    @timed_command
+    def transfer_windows(self, windows: tuple) -> int:
+        '''
+        Transfers timing window values to the micro-controller.
+
+        Parameters:
+            windows (tuple): Timing window values in milliseconds
+
+        Returns:
+            (int): Exit status of process
+        '''
+        # Transmit code char to micro-controller to
+        # communicate that timing windows are being sent
+        with self.phase(PHASE_COMMAND):
+            self.write(TW_TO_EEPROM_CHAR)
+
+        # Check device ready
+        self.wait_for_response(READY_CODE)
+        if (self.get_response_code() == STATUS_TIMEOUT):
+            return STATUS_TIMEOUT
+
+        # Transmit all timing window values, all are newline terminated
+        with self.phase(PHASE_VALUES):
+            for param in windows:
+                PROTOCOL_LOG.debug("Sent timing window", value=param)
+                self.write(f"{param}{NEWLINE}")
+
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_SUCCESS):
+            return STATUS_SUCCESS
+
+        return STATUS_TIMEOUT
+
+    def transaction(self) -> "DeviceTransaction":
+        ''' Returns a new transaction, to batch several operations '''
+        return DeviceTransaction(self)
+
+    @timed_command
+    def run_transaction(
+            self,
+            operations: list[tuple[str, tuple]],
+    ) -> tuple[int, list[tuple[int, tuple | None]]]:
+        '''
+        Runs several operations behind a single handshake, see
+        TRANSACTION_CODE. Devices without transaction support run
+        each operation as a separate command instead, and devices not
+        answering at all time out without running any.
+
+        Parameters:
+            operations (list): Command code and arguments of each
+                operation, in order
+
+        Returns:
+            (tuple): Exit status of process, and the exit status and
+            timing windows read (None if not read) of each operation
+            run. Operations after a failed operation are not run.
+        '''
+        if (not self.get_transactions()):
+            return self.run_operations(operations)
+
+        # Build frames before starting the transfer, so the device is
+        # never left waiting on the host.
+        frames = [
+            build_operation_frame(code, *args) for code, args in operations
+        ]
+        frames.append(build_operation_frame(END_TRANSFER))
+
+        # Devices without transaction support never respond with ready
+        supported = self.probe_extension(TRANSACTION_CODE)
+        if (supported is None):
+            return (STATUS_TIMEOUT, [])
+        if (not supported):
+            self.set_transactions(False)
+            return self.run_operations(operations)
+
+        with self.phase(PHASE_OPERATIONS):
+            self.write_bytes(b"".join(frames))
+        PROTOCOL_LOG.debug("Sent transaction", operations=len(operations))
+
+        with self.phase(PHASE_END_WAIT):
+            return self.read_transaction_results(operations)
+
+    def read_transaction_results(
+            self,
+            operations: list[tuple[str, tuple]],
+    ) -> tuple[int, list[tuple[int, tuple | None]]]:
+        '''
+        Reads the result of each operation of a committed transaction,
+        until the end of transfer.
+
+        Parameters:
+            operations (list): Command code and arguments of each
+                operation, in order
+
+        Returns:
+            (tuple): Exit status of process, and the exit status and
+            timing windows read of each operation acknowledged
+        '''
+        results = []
+        values = []
+
+        # Operations may take a while to run (e.g. EEPROM writes), so
+        # the device is given MAX_WAIT_TIME between each response.
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+            deadline = time.monotonic() + MAX_WAIT_TIME
+
+            if (line.startswith(NAK_PREFIX)):
+                PROTOCOL_LOG.warning("Transaction rejected", line=line)
+                self.set_response_code(STATUS_UNKNOWN_ERROR)
+                return (STATUS_UNKNOWN_ERROR, results)
+
+            if (line == END_TRANSFER):
+                status = STATUS_SUCCESS
+                if (len(results) != len(operations)):
+                    status = STATUS_UNKNOWN_ERROR
+                self.set_response_code(status)
+                return (status, results)
+
+            count = parse_acknowledgement(line)
+            if (count is None):
+                if (line.isdigit()):
+                    values.append(int(line))
+                else:
+                    PROTOCOL_LOG.warning("Unexpected response", line=line)
+                continue
+
+            # Acknowledged operations have run, holding any values sent
+            if (count != len(results) + 1) or (count > len(operations)):
+                PROTOCOL_LOG.warning("Unexpected acknowledgement", line=line)
+                continue
+            code, _ = operations[len(results)]
+            if (code != REQUEST_TIMING_WINDOWS_CODE):
+                results.append((STATUS_SUCCESS, None))
+            elif (len(values) != 0):
+                results.append((STATUS_SUCCESS, tuple(values)))
+            else:
+                results.append((STATUS_UNKNOWN_ERROR, None))
+            values = []
+
+        self.set_response_code(STATUS_TIMEOUT)
+        return (STATUS_TIMEOUT, results)
+
+    def run_operations(
+            self,
+            operations: list[tuple[str, tuple]],
+    ) -> tuple[int, list[tuple[int, tuple | None]]]:
+        '''
+        Runs each operation of a transaction as a separate command, for
+        devices without transaction support.
+
+        Parameters:
+            operations (list): Command code and arguments of each
+                operation, in order
+
+        Returns:
+            (tuple): Exit status of process, and the exit status and
+            timing windows read of each operation run
+        '''
+        results = []
+        for code, args in operations:
+            if (code == TW_TO_EEPROM_CHAR):
+                result = (self.transfer_windows(*args), None)
+            elif (code == REQUEST_TIMING_WINDOWS_CODE):
+                result = self.request_timing_windows()
+            else:
+                result = (self.transfer_sequence(code, *args), None)
+
+            results.append(result)
+            if (result[0] != STATUS_SUCCESS):
+                return (result[0], results)
+
+        return (STATUS_SUCCESS, results)
+
+    def identify(self, timeout: float = IDENTIFY_TIMEOUT) -> str | None:
+        '''
+        Asks the device to identify itself.
+
+        Parameters:
+            timeout (float): Maximum time to wait for each answer (in seconds)
+
+        Returns:
+            (str): Firmware version of the device, LEGACY_FIRMWARE_VERSION
+            if it runs legacy firmware, or None if it is not a tpmania device
+        '''
+        self.write(IDENTIFY_CODE)
+        line = self.serial_readline_before(time.monotonic() + timeout)
+        if (line.startswith(IDENTIFY_PREFIX)):
+            return line[len(IDENTIFY_PREFIX):].strip()
+        if (line != EMPTY_STRING):
+            PROTOCOL_LOG.warning("Unexpected identity", line=line)
+            return None
+
+        # Legacy firmware replies to a timing windows request with
+        # integer values, followed by the end of transfer.
+        self.write(REQUEST_TIMING_WINDOWS_CODE)
+        values = 0
+        deadline = time.monotonic() + timeout
+        while (time.monotonic() < deadline):
+            line = self.serial_readline_before(deadline)
+            if (line == EMPTY_STRING):
+                continue
+            if (line == END_TRANSFER):
+                return LEGACY_FIRMWARE_VERSION if values else None
+            if (not line.isdigit()):
+                return None
+            values += 1
+
+        return None
+
+    @timed_command
+    def request_timing_windows(self) -> tuple[int, tuple | None]:
+        '''
+        Requests the current timing window settings from the micro-controller.
+
+        Returns:
+            (tuple): Exit status of process, and the timing windows read
+            (None if no windows were read)
+        '''
+        # Transmit code to micro-controller to communicate host
+        # is requesting timing windows
+        with self.phase(PHASE_COMMAND):
+            self.write(REQUEST_TIMING_WINDOWS_CODE)
+
+        with self.phase(PHASE_RECEIVE):
+            return self.read_timing_windows()
+
+    def read_timing_windows(self) -> tuple[int, tuple | None]:
+        '''
+        Reads timing window values sent by the micro-controller, until the
+        end of transfer.
+
+        Returns:
+            (tuple): Exit status of process, and the timing windows read
+            (None if no windows were read)
+        '''
+        # Read responses back from micro-controller, and records values.
+        timing_windows = []
+
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        while (time.monotonic() < deadline):
+            # Read line from serial port
+            line = self.serial_readline_before(deadline)
+
+            # Exit if connection timesout
+            if (line == EMPTY_STRING):
+                continue
+
+            # Append each value to timing windows list
+            if (line != END_TRANSFER):
+                PROTOCOL_LOG.debug("Received timing window", line=line)
+                timing_windows.append(int(line))
+
+            # End of Transfer reached
+            else:
+                PROTOCOL_LOG.debug(
+                    "Received timing windows",
+                    windows=timing_windows,
+                )
+                if (len(timing_windows) != 0):
+                    return (STATUS_SUCCESS, tuple(timing_windows))
+
+                # Error with reading
+                return (STATUS_UNKNOWN_ERROR, None)
+
+        return (STATUS_TIMEOUT, None)
+
+    @timed_command
+    def get_file_from_device(self, code: str, path: str) -> int:
+        '''
+        Retrieves a sequence file stored on the micro-controllers
+        RAM or EEPROM, and saves it locally.
+
+        The function sends a command code to the device, then drains the
+        response into memory as fast as it arrives, until the transfer
+        terminates. The response is then parsed once, with special markers
+        (BUFFER, BAR_DIVIDER, FILE_END) inserted as needed.
+
+        The resulting file is formatted in the expected .tsq sequence file
+        format, enabling it to be resent to the device in the future, and
+        is written in a single atomic write.
+
+        Beats are requested packed first, when enabled.
+
+        Parameters:
+            code (str): Code indicating the memory location
+            path (str): Path to save the sequence file to
+
+        Returns:
+            (int): Exit status of process
+        '''
+        status, contents = self.read_sequence(code)
+        if (contents is None):
+            return status
+
+        with self.phase(PHASE_FILE_WRITE):
+            write_file_atomically(path, contents)
+        return status
+
+    def read_sequence(self, code: str) -> tuple[int, str | None]:
+        '''
+        Retrieves a sequence stored on the micro-controllers RAM or
+        EEPROM, formatted as a .tsq sequence file.
+
+        Parameters:
+            code (str): Code indicating the memory location
+
+        Returns:
+            (tuple): Exit status of process, and the sequence file
+            contents (None if no sequence was received)
+        '''
+        if (self.get_packed_downloads()):
+            result = self.read_packed_sequence(code)
+            if (result is not None):
+                return result
+
+        # Transmit code to micro-controller to communicate
+        # which sequence the host is requesting.
+        with self.phase(PHASE_COMMAND):
+            self.write(code)
+        PROTOCOL_LOG.debug("Sent command", code=code)
+
+        with self.phase(PHASE_RECEIVE):
+            lines = self.read_lines_until(END_TRANSFER)
+        if (lines is None):
+            return (STATUS_TIMEOUT, None)
+
+        # Metadata is sent before the buffer, and beats after it
+        if (BUFFER not in lines):
+            PROTOCOL_LOG.warning("No buffer received", lines=lines)
+            return (STATUS_UNKNOWN_ERROR, None)
+        buffer_index = lines.index(BUFFER)
+
+        contents = format_sequence_file(
+            lines[:buffer_index],
+            lines[buffer_index + 1:],
+        )
+        return (file_from_device_exit_status(code), contents)
+
+    def read_lines_until(self, code: str) -> list[str] | None:
+        '''
+        Drains the serial connection into memory, reading whatever bytes
+        have arrived at once, until a line matching code is received.
+        Waits at most MAX_WAIT_TIME without receiving data.
+
+        Parameters:
+            code (str): Line marking the end of the response
+
+        Returns:
+            (list[str]): Non-empty lines received before code, or None if
+            the device stopped sending first
+
+        Raises:
+            TransferCancelled: If the running command is cancelled
+        '''
+        connection = self.get_connection()
+        received = bytearray()
+        lines = []
+        deadline = time.monotonic() + MAX_WAIT_TIME
+        try:
+            while True:
+                self.check_cancelled()
+                remaining = deadline - time.monotonic()
+                if (remaining <= 0):
+                    return None
+
+                connection.timeout = remaining
+                data = connection.read(max(1, connection.in_waiting))
+                self.check_cancelled()
+                if (len(data) == 0):
+                    continue
+
+                # Data arrived, restart the idle timeout
+                deadline = time.monotonic() + MAX_WAIT_TIME
+                received.extend(data)
+
+                # Parse every complete line received so far
+                *complete, remainder = received.split(b"\n")
+                received = bytearray(remainder)
+                for line in complete:
+                    line = (
+                        line.decode(DATA_ENCODING_TYPE, errors="ignore")
+                        .strip()
+                        .strip(NULL_CHAR)
+                    )
+                    if (line == code):
+                        return lines
+                    if (line != EMPTY_STRING):
+                        lines.append(line)
+        finally:
+            connection.timeout = READ_TIMEOUT
+
+    def read_packed_sequence(
+            self,
+            code: str,
+    ) -> tuple[int, str | None] | None:
+        '''
+        Retrieves a sequence stored on the micro-controller with packed
+        beats, formatted as a .tsq sequence file. Disables packed
+        downloads if the device does not respond, but does answer
+        identification.
+
+        Parameters:
+            code (str): Code indicating the memory location (R or N)
+
+        Returns:
+            (tuple): Exit status of process, and the sequence file contents
+            (None if no sequence was received), or None if the sequence
+            should be requested unpacked
+        '''
+        with self.phase(PHASE_COMMAND):
+            self.write(code.lower())
+
+        with self.phase(PHASE_RECEIVE):
+            return self.receive_packed_sequence(code)
+
+    def receive_packed_sequence(
+            self,
+            code: str,
+    ) -> tuple[int, str | None] | None:
+        '''
+        Receives a sequence with packed beats, requested by
+        read_packed_sequence.
+
+        Parameters:
+            code (str): Code indicating the memory location (R or N)
+
+        Returns:
+            (tuple): Exit status of process, and the sequence file contents
+            (None if no sequence was received), or None if the sequence
+            should be requested unpacked
+        '''
+        # Read metadata lines, up to the packed beats header after BUFFER
+        lines = []
+        timeout = PACKED_TIMEOUT
+        while (BUFFER not in lines[:-1]):
+            line = self.serial_readline_before(time.monotonic() + timeout)
+            if (line == EMPTY_STRING):
+                if (len(lines) == 0):
+                    if (not self.lacks_extension(code.lower())):
+                        return (STATUS_TIMEOUT, None)
+                    self.set_packed_downloads(False)
+                    return None
+                return (STATUS_TIMEOUT, None)
+
+            if (line == NAK_PREFIX):
+                return None
+
+            # Device supports packed downloads, allow for slower links
+            timeout = MAX_WAIT_TIME
+            lines.append(line)
+
+        metadata = lines[:-2]
+        try:
+            lanes, count, *compressed = (
+                int(value) for value in line.split(PACKED_SEPARATOR)
+            )
+        except ValueError:
+            PROTOCOL_LOG.warning("Expected packed header", line=line)
+            return (STATUS_UNKNOWN_ERROR, None)
+
+        # Compressed beats are preceded by their compressed size
+        size = packed_size(lanes, count)
+        data = self.read_bytes_before(
+            compressed[0] if compressed else size,
+            time.monotonic() + MAX_WAIT_TIME,
+        )
+        if (data is None):
+            return (STATUS_TIMEOUT, None)
+        if (compressed):
+            data = rle_decompress(data)
+        if (len(data) != size):
+            return (STATUS_UNKNOWN_ERROR, None)
+
+        self.wait_for_response(END_TRANSFER)
+        if (self.get_response_code() == STATUS_TIMEOUT):
+            return (STATUS_TIMEOUT, None)
+
+        beats = unpack_beats(lanes, count, data)
+        contents = format_sequence_file(metadata, beats)
+        return (file_from_device_exit_status(code), contents)
+
+    def read_bytes_before(self, size: int, deadline: float) -> bytes | None:
+        '''
+        Reads exactly size bytes from the serial connection.
+
+        Parameters:
+            size (int): Number of bytes to read
+            deadline (float): time.monotonic() value to stop waiting at
+
+        Returns:
+            (bytes): Bytes read, or None if the deadline passed first
+
+        Raises:
+            TransferCancelled: If the running command is cancelled
+        '''
+        connection = self.get_connection()
+        data = b""
+        try:
+            while (len(data) < size):
+                self.check_cancelled()
+                remaining = deadline - time.monotonic()
+                if (remaining <= 0):
+                    return None
+                connection.timeout = remaining
+                data += connection.read(size - len(data))
+        finally:
+            connection.timeout = READ_TIMEOUT
+        return data
+
+
+class AdaptivePacer:
+    '''
+    Paces line uploads that have no flow control, so the device receive
+    buffer never overruns.
+
+    Beats are split into chunks that fit the receive buffer. After each
+    chunk, the host waits for the time the device is expected to take
+    handling it. That time per beat is learned from previous uploads.
+
+    Parameters:
+        capacity (int): Size of the device receive buffer (in bytes)
+    '''
+    def __init__(self, capacity: int = DEFAULT_RECEIVE_BUFFER) -> None:
+        ''' Initialises the pacer at INITIAL_BEAT_TIME per beat '''
+        self._capacity = capacity
+        self._beat_time = INITIAL_BEAT_TIME
+
+        # Fastest time per beat known to overrun the device
+        self._overrun_beat_time = 0.0
+
+    def get_capacity(self) -> int:
+        ''' Returns the size of the device receive buffer (in bytes) '''
+        return self._capacity
+
+    def get_beat_time(self) -> float:
+        ''' Returns the time the device is expected to take per beat '''
+        return self._beat_time
+
+    def get_delay(self, beats: int) -> float:
+        ''' Returns the time to wait after sending a chunk of beats '''
+        return beats * self._beat_time
+
+    def split(self, beats: list[str]) -> list[list[str]]:
+        '''
+        Splits beats into chunks that fit the device receive buffer.
+        A beat longer than the buffer is sent on its own.
+
+        Parameters:
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (list[list[str]]): Chunks of beats, in transmission order
+        '''
+        chunks = []
+        chunk = []
+        size = 0
+        for beat in beats:
+            if (chunk) and (size + len(beat) > self._capacity):
+                chunks.append(chunk)
+                chunk = []
+                size = 0
+            chunk.append(beat)
+            size += len(beat)
+
+        if (chunk):
+            chunks.append(chunk)
+        return chunks
+
+    def record_success(self, elapsed: float, beats: int) -> None:
+        '''
+        Learns from an upload that completed.
+
+        Parameters:
+            elapsed (float): Time from sending the first beat until the
+                device ended the transfer (excluding the round trip)
+            beats (int): Number of beats sent
+        '''
+        if (beats == 0):
+            return
+
+        # Device (or the wire) was slower than the pacing, follow it
+        # before the buffer overruns. Otherwise, the pacing held the
+        # device back, so try sending a little faster next time, but
+        # never as fast as a time per beat that overran it before.
+        measured = max(elapsed, 0.0) / beats
+        if (measured > self._beat_time):
+            self._beat_time = min(measured, MAX_BEAT_TIME)
+        elif (self._beat_time * PACING_SPEEDUP > self._overrun_beat_time):
+            self._beat_time *= PACING_SPEEDUP
+
+    def record_failure(self) -> None:
+        ''' Backs off after an upload failed, likely from an overrun '''
+        self._overrun_beat_time = max(
+            self._overrun_beat_time,
+            self._beat_time,
+        )
+        self._beat_time = min(
+            max(self._beat_time, INITIAL_BEAT_TIME) * PACING_BACKOFF,
+            MAX_BEAT_TIME,
+        )
+
+
+class DeviceTransaction:
+    '''
+    Batches several device operations, so they are sent behind a single
+    handshake when committed, see DeviceProtocol.run_transaction().
+
+    Parameters:
+        protocol (DeviceProtocol): Protocol of the device
+    '''
+    def __init__(self, protocol: DeviceProtocol) -> None:
+        ''' Starts an empty transaction '''
+        self._protocol = protocol
+        self._operations = []
+
+    def get_operations(self) -> list[tuple[str, tuple]]:
+        ''' Returns the command code and arguments of each operation '''
+        return list(self._operations)
+
+    def save_sequence(
+            self,
+            code: str,
+            parameters: list,
+            beats: list[str],
+    ) -> int:
+        '''
+        Queues saving a sequence to the device.
+
+        Parameters:
+            code (str): Code indicating the memory location (S, E or B)
+            parameters (list): Sequence metadata, in transmission order
+            beats (list[str]): Newline terminated beat lines
+
+        Returns:
+            (int): Index of the operation's result
+        '''
+        if (code not in UPLOAD_CODES):
+            raise ValueError(f"Invalid memory location code: {code}")
+        return self._add(code, (parameters, beats))
+
+    def save_timing_windows(self, windows: tuple) -> int:
+        '''
+        Queues saving timing windows to the device.
+
+        Parameters:
+            windows (tuple): Timing window values in milliseconds
+
+        Returns:
+            (int): Index of the operation's result
+        '''
+        return self._add(TW_TO_EEPROM_CHAR, (windows,))
+
+    def read_timing_windows(self) -> int:
+        '''
+        Queues reading the timing windows back from the device.
+
+        Returns:
+            (int): Index of the operation's result
+        '''
+        return self._add(REQUEST_TIMING_WINDOWS_CODE, ())
+
+    def commit(self) -> tuple[int, list[tuple[int, tuple | None]]]:
+        '''
+        Runs every operation queued, see DeviceProtocol.run_transaction().
+
+        Returns:
+            (tuple): Exit status of process, and the result of each
+            operation run
+        '''
+        return self._protocol.run_transaction(self.get_operations())
+
+    def _add(self, code: str, args: tuple) -> int:
+        ''' Queues an operation, returning its index '''
+        self._operations.append((code, args))
+        return len(self._operations) - 1
+
+
+def file_from_device_exit_status(code: str) -> int:
+    '''
+    Returns the exit code when getting a file from the device,
+    upon successfully receiving data.
+
+    Parameters:
+        code (str): Code indicating the memory location
+
+    Returns:
+        (int): Exit status of process
+    '''
+    if (code == LOAD_SQ_FROM_EEPROM_CODE):
+        return STATUS_RECEIVED_EEPROM_TSQ
+    elif (code == LOAD_SQ_FROM_RAM_CODE):
+        return STATUS_RECEIVED_RAM_TSQ
+    else:
+        PROTOCOL_LOG.error("Unexpected memory location code", code=code)
+        return STATUS_UNKNOWN_ERROR
+
+
+def build_sequence_frame(
+        code: str,
+        parameters: list,
+        beats: list[str],
+) -> bytes:
+    '''
+    Builds a single length-prefixed frame containing the sequence metadata
+    and beats, so an entire sequence can be written to the device at once.
+
+    Parameters:
+        code (str): Code indicating the memory location (S, E or B)
+        parameters (list): Sequence metadata, in transmission order
+        beats (list[str]): Newline terminated beat lines
+
+    Returns:
+        (bytes): Encoded frame, header included
+    '''
+    metadata = EMPTY_STRING.join(f"{param}{NEWLINE}" for param in parameters)
+    payload = (
+        f"{metadata}{EMPTY_STRING.join(beats)}"
+        .encode(DATA_ENCODING_TYPE)
+    )
+
+    if (len(payload) > MAX_FRAME_PAYLOAD):
+        raise ValueError("Sequence too large to transmit as a single frame")
+
+    header = struct.pack(
+        FRAME_HEADER_FORMAT,
+        FRAME_START,
+        code.encode(DATA_ENCODING_TYPE),
+        len(payload),
+    )
+    return header + payload
+
+
+def build_operation_frame(code: str, *args: Any) -> bytes:
+    '''
+    Builds the frame of a transaction operation, see TRANSACTION_CODE.
+
+    Parameters:
+        code (str): Command code of the operation
+        args (Any): Arguments of the operation
+
+    Returns:
+        (bytes): Encoded frame, header included
+    '''
+    if (code in UPLOAD_CODES):
+        return build_sequence_frame(code, *args)
+
+    payload = EMPTY_STRING
+    if (code == TW_TO_EEPROM_CHAR):
+        (windows,) = args
+        payload = EMPTY_STRING.join(f"{value}{NEWLINE}" for value in windows)
+
+    header = struct.pack(
+        FRAME_HEADER_FORMAT,
+        FRAME_START,
+        code.encode(DATA_ENCODING_TYPE),
+        len(payload),
+    )
+    return header + payload.encode(DATA_ENCODING_TYPE)
+
+
+def build_sequence_blocks(
+        code: str,
+        parameters: list,
+        beats: list[str],
+) -> list[bytes]:
+    '''
+    Splits the sequence metadata and beats into checksummed blocks,
+    so damaged blocks can be resent on their own.
+
+    Parameters:
+        code (str): Code indicating the memory location (S, E or B)
+        parameters (list): Sequence metadata, in transmission order
+        beats (list[str]): Newline terminated beat lines
+
+    Returns:
+        (list[bytes]): Encoded blocks, in order
+    '''
+    metadata = EMPTY_STRING.join(f"{param}{NEWLINE}" for param in parameters)
+    payload = (
+        f"{metadata}{EMPTY_STRING.join(beats)}"
+        .encode(DATA_ENCODING_TYPE)
+    )
+    return build_blocks(code, payload)
+
+
+def build_blocks(code: str, payload: bytes) -> list[bytes]:
+    '''
+    Splits a payload into checksummed blocks.
+
+    Parameters:
+        code (str): Code indicating the memory location (S, E or B)
+        payload (bytes): Data to transmit
+
+    Returns:
+        (list[bytes]): Encoded blocks, in order
+    '''
+    chunks = [
+        payload[start:start + BLOCK_PAYLOAD_SIZE]
+        for start in range(0, len(payload), BLOCK_PAYLOAD_SIZE)
+    ]
+    if (len(chunks) > MAX_BLOCKS):
+        raise ValueError("Sequence too large to transmit as blocks")
+
+    blocks = []
+    for index, chunk in enumerate(chunks):
+        body = struct.pack(
+            BLOCK_HEADER_FORMAT,
+            code.encode(DATA_ENCODING_TYPE),
+            index,
+            len(chunks),
+            len(chunk),
+        ) + chunk
+        checksum = binascii.crc_hqx(body, CRC_INITIAL_VALUE)
+        blocks.append(
+            bytes([FRAME_START])
+            + body
+            + struct.pack(BLOCK_CHECKSUM_FORMAT, checksum)
+        )
+    return blocks
+
+
+def build_packed_blocks(
+        code: str,
+        parameters: list,
+        lanes: int,
+        packed: bytes,
+) -> list[bytes]:
+    '''
+    Splits the sequence metadata and packed beats into checksummed blocks,
+    compressing the beats if that makes them smaller.
+
+    Parameters:
+        code (str): Code indicating the memory location (S, E or B)
+        parameters (list): Sequence metadata, in transmission order
+        lanes (int): Number of lanes in each beat
+        packed (bytes): Packed beats
+
+    Returns:
+        (list[bytes]): Encoded blocks, in order
+    '''
+    metadata = EMPTY_STRING.join(f"{param}{NEWLINE}" for param in parameters)
+    header = f"{lanes}"
+
+    compressed = rle_compress(packed)
+    if (len(compressed) < len(packed)):
+        header = f"{lanes}{PACKED_SEPARATOR}{RLE_CODE}"
+        packed = compressed
+
+    payload = f"{metadata}{header}{NEWLINE}".encode(DATA_ENCODING_TYPE)
+    return build_blocks(code.lower(), payload + packed)
+
+
+def pack_beats(beats: list[str]) -> tuple[int, bytes] | None:
+    '''
+    Packs beats into a bit stream, with one bit per lane.
+
+    Parameters:
+        beats (list[str]): Newline terminated beat lines
+
+    Returns:
+        (tuple): Number of lanes, and the packed beats, or None if the
+        beats cannot be packed
+
+    Example:
+        ['1000\n', '0110\n'] -> (4, b'\x86')
+    '''
+    lines = [line.rstrip(NEWLINE) for line in beats]
+    if (len(lines) == 0):
+        return None
+
+    lanes = len(lines[0])
+    if (not 0 < lanes <= MAX_PACKED_LANES):
+        return None
+
+    for line in lines:
+        if (len(line) != lanes) or (line.strip(LANE_STATES) != EMPTY_STRING):
+            return None
+
+    bits = EMPTY_STRING.join(lines)
+    size = packed_size(lanes, len(lines))
+    bits = bits.ljust(size * BITS_PER_BYTE, LANE_STATES[0])
+    return (lanes, int(bits, BINARY_BASE).to_bytes(size, "big"))
+
+
+def unpack_beats(lanes: int, count: int, data: bytes) -> list[str]:
+    '''
+    Unpacks beats packed by pack_beats.
+
+    Parameters:
+        lanes (int): Number of lanes in each beat
+        count (int): Number of beats
+        data (bytes): Packed beats
+
+    Returns:
+        (list[str]): Beat lines, without newlines
+    '''
+    bits = EMPTY_STRING.join(format(byte, "08b") for byte in data)
+    return [
+        bits[index * lanes:(index + 1) * lanes]
+        for index in range(count)
+    ]
+
+
+def packed_size(lanes: int, count: int) -> int:
+    ''' Returns the number of bytes count packed beats occupy '''
+    return -(-(lanes * count) // BITS_PER_BYTE)
+
+
+def rle_compress(data: bytes) -> bytes:
+    '''
+    Compresses data with PackBits run-length encoding.
+
+    Parameters:
+        data (bytes): Data to compress
+
+    Returns:
+        (bytes): Compressed data
+
+    Example:
+        b'\x00\x00\x00\x00\x86' -> b'\xfd\x00\x00\x86'
+    '''
+    compressed = bytearray()
+    index = 0
+    while (index < len(data)):
+
+        # Measure run of repeated bytes
+        run = 1
+        while (
+            (index + run < len(data))
+            and (run < RLE_MAX_REPEAT)
+            and (data[index + run] == data[index])
+        ):
+            run += 1
+
+        if (run >= RLE_MIN_REPEAT):
+            compressed.append(RLE_REPEAT_BASE - run)
+            compressed.append(data[index])
+            index += run
+            continue
+
+        # Collect literal bytes, up to the next run worth encoding
+        start = index
+        while (index < len(data)) and (index - start < RLE_MAX_LITERAL):
+            upcoming = data[index:index + RLE_MIN_REPEAT]
+            if (len(upcoming) == RLE_MIN_REPEAT) and (
+                upcoming.count(upcoming[0]) == RLE_MIN_REPEAT
+            ):
+                break
+            index += 1
+
+        compressed.append(index - start - 1)
+        compressed.extend(data[start:index])
+
+    return bytes(compressed)
+
+
+def rle_decompress(data: bytes) -> bytes:
+    '''
+    Decompresses data compressed by rle_compress.
+
+    Parameters:
+        data (bytes): Compressed data
+
+    Returns:
+        (bytes): Original data
+    '''
+    decompressed = bytearray()
+    index = 0
+    while (index < len(data)):
+        header = data[index]
+        index += 1
+
+        if (header < RLE_MAX_LITERAL):
+            decompressed.extend(data[index:index + header + 1])
+            index += header + 1
+        elif (header > RLE_MAX_LITERAL):
+            decompressed.extend(
+                data[index:index + 1] * (RLE_REPEAT_BASE - header)
+            )
+            index += 1
+
+    return bytes(decompressed)
+
+
+def format_sequence_file(metadata: list[str], beats: list[str]) -> str:
+    '''
+    Formats a sequence read from the device as a .tsq sequence file,
+    with a bar divider after every fourth beat.
+
+    Parameters:
+        metadata (list[str]): Metadata lines, as sent by the device
+        beats (list[str]): Beat lines, without newlines
+
+    Returns:
+        (str): Sequence file contents
+    '''
+    lines = list(metadata)
+    lines.append(BUFFER)
+    for index, beat in enumerate(beats):
+        if (index != 0) and (index % BAR_BEATS == 0):
+            lines.append(BAR_DIVIDER)
+        lines.append(beat)
+    lines.append(FILE_END)
+    return EMPTY_STRING.join(f"{line}{NEWLINE}" for line in lines)
+
+
+def get_write_slice_size(baud_rate: int) -> int:
+    '''
+    Returns the number of bytes a port sends well within WRITE_TIMEOUT.
+
+    Parameters:
+        baud_rate (int): Baud rate of the port
+
+    Returns:
+        (int): Size of each slice of a bulk write (in bytes)
+    '''
+    byte_time = WIRE_BITS_PER_BYTE / baud_rate
+    size = WRITE_TIMEOUT * WRITE_TIMEOUT_MARGIN / byte_time
+    return max(1, int(size))
+
+
+def write_file_atomically(path: str, contents: str) -> None:
+    '''
+    Writes contents to a file in a single write. The file is written
+    next to path then moved into place, so an interrupted write never
+    leaves a partial file behind. It keeps the permissions of the file
+    it replaces, or those open() would have given a new file.
+
+    Parameters:
+        path (str): Path of the file to write
+        contents (str): File contents
+    '''
+    descriptor, temp_path = create_temporary_file(path)
+    try:
+        with os.fdopen(descriptor, WRITE_MODE) as file:
+            file.write(contents)
+        mode = get_file_mode(path)
+        if (mode is not None):
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def create_temporary_file(path: str) -> tuple[int, str]:
+    '''
+    Creates a new, uniquely named file next to path. It is created with
+    NEW_FILE_MODE, so the OS applies the umask as it would for open().
+
+    Parameters:
+        path (str): Path of the file being written
+
+    Returns:
+        (tuple): File descriptor open for writing, and path of the file
+
+    Raises:
+        FileExistsError: If no unique name was found
+    '''
+    directory, name = os.path.split(os.path.abspath(path))
+    for _ in range(tempfile.TMP_MAX):
+        suffix = os.urandom(TEMP_NAME_BYTES).hex()
+        temp_path = os.path.join(directory, f".{name}.{suffix}{TEMP_SUFFIX}")
+        try:
+            descriptor = os.open(temp_path, TEMP_FILE_FLAGS, NEW_FILE_MODE)
+        except FileExistsError:
+            continue
+        return (descriptor, temp_path)
+
+    raise FileExistsError(f"No unique temporary file name for {path}")
+
+
+def get_file_mode(path: str) -> int | None:
+    ''' Returns the permissions of the file at path, or None if none '''
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
+def hash_lines(lines: list[str]) -> int:
+    '''
+    Hashes newline terminated lines, the same way the device does.
+
+    Parameters:
+        lines (list[str]): Newline terminated lines
+
+    Returns:
+        (int): CRC-32 of the lines
+    '''
+    return binascii.crc32(EMPTY_STRING.join(lines).encode(DATA_ENCODING_TYPE))
+
+
+def hash_exchange_size(parameters: int, beats: int) -> int:
+    '''
+    Returns the number of bytes exchanged to request the hashes of one
+    memory, holding a sequence of the given size.
+
+    Parameters:
+        parameters (int): Number of metadata parameters
+        beats (int): Number of beats
+    '''
+    bars = -(-beats // BAR_BEATS)
+    return (
+        len(f"{REQUEST_HASHES_CODE}{LOAD_SQ_FROM_RAM_CODE}")
+        + (parameters + bars) * HASH_LINE_SIZE
+        + len(f"{BUFFER}{NEWLINE}{END_TRANSFER}{NEWLINE}")
+    )
+
+
+def blocks_size(blocks: list[bytes]) -> int:
+    ''' Returns the number of bytes sent to transfer blocks '''
+    return sum(len(block) for block in blocks)
+
+
+def build_delta_payload(
+        parameters: list,
+        beats: list[str],
+        stored_parameters: list[int],
+        stored_bars: list[int],
+) -> bytes | None:
+    '''
+    Builds the changes needed to turn the sequence stored on the device
+    into the given sequence.
+
+    Parameters:
+        parameters (list): Sequence metadata, in transmission order
+        beats (list[str]): Newline terminated beat lines
+        stored_parameters (list[int]): Hash of each stored parameter
+        stored_bars (list[int]): Hash of each stored bar
+
+    Returns:
+        (bytes): Encoded changes (empty if nothing changed), or None if
+        the stored sequence has different parameters
+    '''
+    if (len(stored_parameters) != len(parameters)):
+        return None
+
+    changes = []
+    for index, param in enumerate(parameters):
+        if (hash_lines([f"{param}{NEWLINE}"]) != stored_parameters[index]):
+            changes.append(
+                f"{DELTA_PARAMETER_PREFIX}{index}"
+                f"{DELTA_PARAMETER_SEPARATOR}{param}{NEWLINE}"
+            )
+
+    for bar, start in enumerate(range(0, len(beats), BAR_BEATS)):
+        lines = beats[start:start + BAR_BEATS]
+        unchanged = (
+            (bar < len(stored_bars))
+            and (hash_lines(lines) == stored_bars[bar])
+        )
+        if (unchanged):
+            continue
+        changes.append(f"{DELTA_BAR_PREFIX}{bar}{NEWLINE}")
+        changes.extend(lines)
+
+    return EMPTY_STRING.join(changes).encode(DATA_ENCODING_TYPE)
+
+
+def parse_nak(line: str, count: int) -> list[int] | None:
+    '''
+    Parses a request from the device to resend blocks.
+
+    Parameters:
+        line (str): Line read from the device
+        count (int): Number of blocks in the transfer
+
+    Returns:
+        (list[int]): Indices of blocks to resend, or None if the line
+        is not a valid request
+
+    Example:
+        'NAK1,4' -> [1, 4]
+        'NAK' -> [0, 1, ..., count - 1]
+    '''
+    if (not line.startswith(NAK_PREFIX)):
+        return None
+
+    indices = line[len(NAK_PREFIX):]
+    if (indices == EMPTY_STRING):
+        return list(range(count))
+
+    pending = []
+    for index in indices.split(NAK_SEPARATOR):
+        if (not index.isdigit()) or (int(index) >= count):
+            return None
+        pending.append(int(index))
+    return pending
+
+
+def parse_acknowledgement(line: str) -> int | None:
+    '''
+    Parses a windowed transfer acknowledgement sent by the device.
+
+    Parameters:
+        line (str): Line read from the device
+
+    Returns:
+        (int): Cumulative number of beats committed, or None if the line
+        is not an acknowledgement
+
+    Example:
+        'A32' -> 32
+    '''
+    if (not line.startswith(ACKNOWLEDGE_PREFIX)):
+        return None
+
+    count = line[len(ACKNOWLEDGE_PREFIX):]
+    if (not count.isdigit()):
+        return None
+    return int(count)
+
+
+def timing_windows_in_order(windows: tuple) -> bool:
+    '''
+    Checks that the timing windows are ordered in increasing order.
+
+    Parameters:
+        windows (tuple): Timing window values in milliseconds
+
+    Returns:
+        (bool): True if each window is longer than the one before it
+    '''
+    for i, timing in enumerate(windows):
+        if (i == 0):
+            prev_time = timing
+            continue
+        elif (timing <= prev_time):
+            return False
+
+        prev_time = timing
+    return True
+
+
+def choose_baud_rate(device_rates: list[int]) -> int:
+    '''
+    Chooses the fastest baud rate supported by both the host and device.
+
+    Parameters:
+        device_rates (list[int]): Baud rates reported by the device
+
+    Returns:
+        (int): Fastest common baud rate, or BAUD_RATE if none
+    '''
+    common = set(HOST_BAUD_RATES).intersection(device_rates)
+    if (len(common) == 0):
+        return BAUD_RATE
+    return max(common)
@@ -0,0 +1,179 @@
+'''
+Snapshots of what a device holds (its RAM sequence, EEPROM sequence and
+timing windows), read in a single session, and a cache of them so
+repeated views of a device are not re-read over the serial link.
+'''
+# Import device protocol, and port details
+from GUI.device_protocol import DeviceProtocol, timed_command
+from GUI.device_discovery import get_serial_number
+
+# Used for type hinting
+from typing import Any
+
+# Serial communication indicator characters, each reading one part
+LOAD_SQ_FROM_RAM_CODE = 'R'
+LOAD_SQ_FROM_EEPROM_CODE = 'N'
+REQUEST_TIMING_WINDOWS_CODE = 'W'
+
+# Every part of a snapshot, in the order they are read
+SNAPSHOT_PARTS = (
+    LOAD_SQ_FROM_RAM_CODE,
+    LOAD_SQ_FROM_EEPROM_CODE,
+    REQUEST_TIMING_WINDOWS_CODE,
+)
+
+# Phase timing the identification of a device
+PHASE_IDENTIFY = "identify"
+
+# Process Exit Codes
+STATUS_SUCCESS = 0
+STATUS_RECEIVED_EEPROM_TSQ = 4
+STATUS_RECEIVED_RAM_TSQ = 5
+
+# Exit status of each part, when read successfully
+PART_SUCCESS_STATUSES = {
+    LOAD_SQ_FROM_RAM_CODE: STATUS_RECEIVED_RAM_TSQ,
+    LOAD_SQ_FROM_EEPROM_CODE: STATUS_RECEIVED_EEPROM_TSQ,
+    REQUEST_TIMING_WINDOWS_CODE: STATUS_SUCCESS,
+}
+
+
+class DeviceSnapshot:
+    '''
+    The contents of a device, as read by the host. Parts are stored by the
+    code that reads them, and parts not read yet are missing.
+
+    Parameters:
+        port (str): Serial port the device is connected to
+        identity (tuple): Identity of the device, see identify_device()
+    '''
+    def __init__(self, port: str, identity: tuple) -> None:
+        ''' Initialises a snapshot with no parts read '''
+        self._port = port
+        self._identity = identity
+        self._parts = {}
+
+    def get_port(self) -> str:
+        ''' Returns the serial port the device is connected to '''
+        return self._port
+
+    def get_identity(self) -> tuple:
+        ''' Returns the identity of the device, see identify_device() '''
+        return self._identity
+
+    def has_part(self, code: str) -> bool:
+        ''' Returns True if the part read by code has been read '''
+        return (code in self._parts)
+
+    def get_part(self, code: str) -> Any:
+        ''' Returns the part read by code, or None if not read '''
+        return self._parts.get(code)
+
+    def set_part(self, code: str, value: Any) -> None:
+        ''' Stores the part read by code '''
+        self._parts[code] = value
+
+    def discard_part(self, code: str) -> None:
+        ''' Discards the part read by code, so it is read again '''
+        self._parts.pop(code, None)
+
+    def get_missing_parts(self, codes: tuple = SNAPSHOT_PARTS) -> list[str]:
+        ''' Returns the codes of the parts given that have not been read '''
+        return [code for code in codes if (not self.has_part(code))]
+
+    def get_ram_sequence(self) -> str | None:
+        ''' Returns the RAM sequence, as .tsq sequence file contents '''
+        return self.get_part(LOAD_SQ_FROM_RAM_CODE)
+
+    def get_eeprom_sequence(self) -> str | None:
+        ''' Returns the EEPROM sequence, as .tsq sequence file contents '''
+        return self.get_part(LOAD_SQ_FROM_EEPROM_CODE)
+
+    def get_timing_windows(self) -> tuple | None:
+        ''' Returns the timing window values in milliseconds '''
+        return self.get_part(REQUEST_TIMING_WINDOWS_CODE)
+
+
+class SnapshotCache:
+    '''
+    Snapshots of each device, keyed by port and device identity. Entries
+    must be invalidated whenever the host writes to a device, and when
+    the port is opened or closed, as another device may be plugged in.
+    '''
+    def __init__(self) -> None:
+        ''' Initialises an empty cache '''
+        self._snapshots = {}
+
+    def get(self, port: str, identity: tuple) -> DeviceSnapshot:
+        '''
+        Returns the snapshot of a device, creating an empty one if the
+        device has not been read since it was last written.
+        '''
+        key = (port, identity)
+        if (key not in self._snapshots):
+            self._snapshots[key] = DeviceSnapshot(port, identity)
+        return self._snapshots[key]
+
+    def invalidate(self, port: str | None) -> None:
+        ''' Discards the snapshots of the device on port '''
+        for key in list(self._snapshots):
+            if (key[0] == port):
+                del self._snapshots[key]
+
+    def clear(self) -> None:
+        ''' Discards every snapshot '''
+        self._snapshots.clear()
+
+
+@timed_command
+def identify_device(
+        protocol: DeviceProtocol,
+        port: str,
+) -> tuple[int, tuple[str | None, str | None]]:
+    '''
+    Identifies the device snapshots are cached for.
+
+    Parameters:
+        protocol (DeviceProtocol): Protocol of the device
+        port (str): Serial port the device is connected to
+
+    Returns:
+        (tuple): Exit status of process, and the identity of the device:
+        the firmware version it reports, and the serial number of its USB
+        adapter (None if either is unknown)
+    '''
+    with protocol.phase(PHASE_IDENTIFY):
+        identity = (protocol.identify(), get_serial_number(port))
+    return (STATUS_SUCCESS, identity)
+
+
+@timed_command
+def read_snapshot(
+        protocol: DeviceProtocol,
+        snapshot: DeviceSnapshot,
+        codes: tuple = SNAPSHOT_PARTS,
+) -> int:
+    '''
+    Reads the parts of a snapshot that are missing from the device, one
+    after another over the open connection.
+
+    Parameters:
+        protocol (DeviceProtocol): Protocol of the device
+        snapshot (DeviceSnapshot): Snapshot to store the parts read in
+        codes (tuple): Codes of the parts to read, if missing
+
+    Returns:
+        (int): Exit status of process, the status of the first part that
+        failed (parts read before it are kept)
+    '''
+    for code in snapshot.get_missing_parts(codes):
+        if (code == REQUEST_TIMING_WINDOWS_CODE):
+            status, value = protocol.request_timing_windows()
+        else:
+            status, value = protocol.read_sequence(code)
+
+        if (status != PART_SUCCESS_STATUSES[code]):
+            return status
+        snapshot.set_part(code, value)
+
+    return STATUS_SUCCESS
@@ -0,0 +1,202 @@
+'''
+Runs device commands on many devices at once, one worker thread per
+device, so updating a room of cabinets takes a single transfer time.
+'''
+# Import Required Modules
+import concurrent.futures
+
+# Import device protocol, and cancellation
+from GUI.device_protocol import DeviceProtocol
+from GUI.cancellation import CancellationToken
+
+# Used for type hinting
+from typing import Any, Callable
+
+# Progress reported for each device, before its result
+STATE_CONNECTING = "connecting"
+STATE_UPLOADING = "uploading"
+
+# Process Exit Codes
+STATUS_SUCCESS = 0
+STATUS_VERIFICATION_FAILED = 16
+
+
+def run_on_ports(
+        ports: list[str],
+        command: Callable[[DeviceProtocol], Any],
+        protocols: dict[str, DeviceProtocol] | None = None,
+        progress: Callable[[str, Any], None] | None = None,
+        cancel_token: CancellationToken | None = None,
+) -> dict[str, Any]:
+    '''
+    Runs a command on several devices concurrently.
+
+    Ports without an open protocol are opened (negotiating their baud
+    rate), and closed again once the command has finished.
+
+    Parameters:
+        ports (list[str]): Serial port names
+        command (Callable): Called with the protocol of each port
+        protocols (dict): Protocols already open, by port name
+        progress (Callable): Called from the worker threads with each
+            port and its progress: STATE_CONNECTING, STATE_UPLOADING,
+            then its result
+        cancel_token (CancellationToken): Token cancelling every command,
+            which then results in TransferCancelled
+
+    Returns:
+        (dict): Result of the command on each port, or the exception
+        raised if the command failed
+    '''
+    if (protocols is None):
+        protocols = {}
+
+    def report(port: str, state: Any) -> None:
+        if (progress is not None):
+            progress(port, state)
+
+    def run(port: str) -> Any:
+        protocol = protocols.get(port)
+        opened = (protocol is None)
+        try:
+            if (cancel_token is not None):
+                cancel_token.raise_if_cancelled()
+            if (opened):
+                report(port, STATE_CONNECTING)
+                protocol = DeviceProtocol.open(port)
+
+            report(port, STATE_UPLOADING)
+            protocol.set_cancel_token(cancel_token)
+            result = command(protocol)
+        except Exception as error:
+            result = error
+        finally:
+            if (opened) and (protocol is not None):
+                protocol.close()
+
+        report(port, result)
+        return result
+
+    if (len(ports) == 0):
+        return {}
+
+    with concurrent.futures.ThreadPoolExecutor(len(ports)) as executor:
+        results = list(executor.map(run, ports))
+    return dict(zip(ports, results))
+
+
+def upload_to_ports(
+        ports: list[str],
+        code: str,
+        parameters: list,
+        beats: list[str],
+        protocols: dict[str, DeviceProtocol] | None = None,
+        progress: Callable[[str, Any], None] | None = None,
+        cancel_token: CancellationToken | None = None,
+) -> dict[str, Any]:
+    '''
+    Uploads a sequence to several devices concurrently.
+
+    Parameters:
+        ports (list[str]): Serial port names
+        code (str): Code indicating the memory location (S, E or B)
+        parameters (list): Sequence metadata, in transmission order
+        beats (list[str]): Newline terminated beat lines
+        protocols (dict): Protocols already open, by port name
+        progress (Callable): Called with each port and its progress
+        cancel_token (CancellationToken): Token cancelling every upload
+
+    Returns:
+        (dict): Exit status of the upload to each port, or the exception
+        raised if the upload failed
+    '''
+    def upload(protocol: DeviceProtocol) -> int:
+        return protocol.transfer_sequence(code, parameters, beats)
+
+    return run_on_ports(ports, upload, protocols, progress, cancel_token)
+
+
+def push_timing_windows(
+        ports: list[str],
+        windows: tuple,
+        protocols: dict[str, DeviceProtocol] | None = None,
+        progress: Callable[[str, Any], None] | None = None,
+        cancel_token: CancellationToken | None = None,
+) -> dict[str, Any]:
+    '''
+    Saves timing windows to several devices concurrently, then verifies
+    each device by reading its timing windows back.
+
+    Parameters:
+        ports (list[str]): Serial port names
+        windows (tuple): Timing window values in milliseconds
+        protocols (dict): Protocols already open, by port name
+        progress (Callable): Called with each port and its progress
+        cancel_token (CancellationToken): Token cancelling every upload
+
+    Returns:
+        (dict): Exit status and timing windows read back from each port,
+        see transfer_and_verify_windows(), or the exception raised
+    '''
+    def push(protocol: DeviceProtocol) -> tuple[int, tuple | None]:
+        return transfer_and_verify_windows(protocol, windows)
+
+    return run_on_ports(ports, push, protocols, progress, cancel_token)
+
+
+def transfer_and_verify_windows(
+        protocol: DeviceProtocol,
+        windows: tuple,
+) -> tuple[int, tuple | None]:
+    '''
+    Saves timing windows to a device, and reads them back, in a single
+    transaction.
+
+    Parameters:
+        protocol (DeviceProtocol): Protocol of the device
+        windows (tuple): Timing window values in milliseconds
+
+    Returns:
+        (tuple): Exit status of process (STATUS_VERIFICATION_FAILED if the
+        windows read back differ), and the timing windows read back
+        (None if no windows were read)
+    '''
+    transaction = protocol.transaction()
+    transaction.save_timing_windows(windows)
+    read = transaction.read_timing_windows()
+
+    status, results = transaction.commit()
+    read_back = None
+    if (read < len(results)):
+        read_back = results[read][1]
+    if (status != STATUS_SUCCESS):
+        return (status, read_back)
+
+    if (read_back != tuple(windows)):
+        return (STATUS_VERIFICATION_FAILED, read_back)
+    return (STATUS_SUCCESS, read_back)
+
+
+def find_divergences(
+        windows: tuple,
+        results: dict[str, Any],
+) -> dict[str, tuple | None]:
+    '''
+    Finds the devices whose timing windows differ from those pushed.
+
+    Parameters:
+        windows (tuple): Timing window values pushed
+        results (dict): Results of push_timing_windows()
+
+    Returns:
+        (dict): Timing windows read back from each divergent device (None
+        if they could not be read), by port
+    '''
+    divergences = {}
+    for port, result in results.items():
+        read_back = None
+        if (isinstance(result, tuple)):
+            read_back = result[1]
+        if (read_back != tuple(windows)):
+            divergences[port] = read_back
+    return divergences
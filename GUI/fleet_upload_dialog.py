@@ -0,0 +1,207 @@
+# Import Pyside6 Modules
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QProgressBar,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt
+
+# Import device discovery, and upload progress states
+from GUI.device_discovery import DiscoveredDevice
+from GUI.fleet_upload import STATE_CONNECTING, STATE_UPLOADING
+from GUI.cancellation import TransferCancelled
+
+# Used for type hinting
+from typing import Any, Callable
+
+# Media Directories
+ASSETS_DIR = "assets"
+WINDOW_ICON_PATH = f"{ASSETS_DIR}/setup.ico"
+
+# Assorted Constants
+FLEET_UPLOAD_TITLE = "Save to Devices"
+SAVE_SEQUENCE_TOOLTIP = "Save sequence to the checked devices"
+TABLE_HEADERS = ("Port", "Firmware", "Result")
+PORT_COLUMN = 0
+FIRMWARE_COLUMN = 1
+RESULT_COLUMN = 2
+DIALOG_WIDTH = 360
+DIALOG_HEIGHT = 260
+EMPTY_STRING = ""
+
+# Process Exit Codes
+STATUS_TIMEOUT = -1
+STATUS_SUCCESS = 0
+STATUS_VERIFICATION_FAILED = 16
+
+# Text shown for each upload progress state, and exit status
+PROGRESS_TEXT = {
+    STATE_CONNECTING: "Connecting...",
+    STATE_UPLOADING: "Uploading...",
+    STATUS_SUCCESS: "Saved",
+    STATUS_TIMEOUT: "Timed out",
+}
+QUEUED_TEXT = "Queued"
+FAILED_TEXT = "Failed"
+CANCELLED_TEXT = "Cancelled"
+READ_BACK_TEXT = "Read back"
+
+
+class FleetUploadDialog(QDialog):
+    '''
+    A dialog listing every device found, where the user checks the devices
+    to save to. Once the upload starts, the result of each device is shown
+    in the table, and the overall progress below it.
+
+    Parameters:
+        devices (list[DiscoveredDevice]): Devices that may be selected
+        upload (Callable): Called with the ports checked, when the user
+            starts the upload
+        title (str): Window title
+        tooltip (str): Tool tip of the save button
+    '''
+    def __init__(
+            self,
+            devices: list[DiscoveredDevice],
+            upload: Callable[[list[str]], None],
+            title: str = FLEET_UPLOAD_TITLE,
+            tooltip: str = SAVE_SEQUENCE_TOOLTIP,
+            parent=None,
+    ) -> None:
+        ''' Builds the device table, with every device checked '''
+        super().__init__(parent)
+        self._upload = upload
+        self._rows = {}
+        self._finished = set()
+
+        self.setWindowTitle(title)
+        self.setWindowIcon(QIcon(WINDOW_ICON_PATH))
+        self.resize(DIALOG_WIDTH, DIALOG_HEIGHT)
+
+        self.table = QTableWidget(len(devices), len(TABLE_HEADERS), self)
+        self.table.setHorizontalHeaderLabels(TABLE_HEADERS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        for row, device in enumerate(devices):
+            port = QTableWidgetItem(device.get_port())
+            port.setFlags(
+                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+            )
+            port.setCheckState(Qt.CheckState.Checked)
+            firmware = QTableWidgetItem(device.get_firmware_version())
+            firmware.setFlags(Qt.ItemFlag.ItemIsEnabled)
+            result = QTableWidgetItem(EMPTY_STRING)
+            result.setFlags(Qt.ItemFlag.ItemIsEnabled)
+
+            self.table.setItem(row, PORT_COLUMN, port)
+            self.table.setItem(row, FIRMWARE_COLUMN, firmware)
+            self.table.setItem(row, RESULT_COLUMN, result)
+            self._rows[device.get_port()] = row
+
+        self.progress = QProgressBar(self)
+        self.progress.setValue(0)
+
+        self.buttons = QDialogButtonBox(
+            QDialogButtonBox.Save | QDialogButtonBox.Close,
+            parent=self,
+        )
+        self.buttons.button(QDialogButtonBox.Save).setToolTip(tooltip)
+        self.buttons.accepted.connect(self.start_upload)
+        self.buttons.rejected.connect(self.close)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.progress)
+        layout.addWidget(self.buttons)
+
+    def get_checked_ports(self) -> list[str]:
+        ''' Returns the ports of every checked device '''
+        return [
+            port
+            for port, row in self._rows.items()
+            if (
+                self.table.item(row, PORT_COLUMN).checkState()
+                == Qt.CheckState.Checked
+            )
+        ]
+
+    def start_upload(self) -> None:
+        '''
+        Starts uploading to the checked devices, locking the selection
+        until every upload has finished.
+        '''
+        ports = self.get_checked_ports()
+        if (len(ports) == 0):
+            return
+
+        self._finished = set()
+        self.progress.setRange(0, len(ports))
+        self.progress.setValue(0)
+        self.buttons.button(QDialogButtonBox.Save).setEnabled(False)
+        for port, row in self._rows.items():
+            item = self.table.item(row, PORT_COLUMN)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+            self.table.item(row, RESULT_COLUMN).setText(
+                QUEUED_TEXT if (port in ports) else EMPTY_STRING
+            )
+
+        self._upload(ports)
+
+    def set_device_progress(self, port: str, state: Any) -> None:
+        '''
+        Shows the progress of the upload to a device, counting it
+        towards the overall progress once it has a result.
+
+        Parameters:
+            port (str): Serial port name
+            state (Any): Progress state, result, or exception raised
+        '''
+        row = self._rows.get(port)
+        if (row is None):
+            return
+
+        self.table.item(row, RESULT_COLUMN).setText(progress_text(state))
+        if (state not in (STATE_CONNECTING, STATE_UPLOADING)):
+            self._finished.add(port)
+            self.progress.setValue(len(self._finished))
+
+    def show_results(self, results: dict[str, Any]) -> None:
+        '''
+        Shows the result of every upload, and allows the checked
+        devices to be changed for another upload.
+
+        Parameters:
+            results (dict): Exit status or exception, by port
+        '''
+        for port, result in results.items():
+            self.set_device_progress(port, result)
+
+        self.buttons.button(QDialogButtonBox.Save).setEnabled(True)
+        for row in self._rows.values():
+            self.table.item(row, PORT_COLUMN).setFlags(
+                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+            )
+
+
+def progress_text(state: Any) -> str:
+    '''
+    Returns the text shown for an upload progress state, exit status,
+    exit status and values read back, or exception raised.
+    '''
+    if (isinstance(state, TransferCancelled)):
+        return CANCELLED_TEXT
+    if (isinstance(state, Exception)):
+        return f"{FAILED_TEXT}: {type(state).__name__}"
+
+    # Verified uploads also hold the values read back
+    if (isinstance(state, tuple)):
+        status, read_back = state
+        if (status == STATUS_VERIFICATION_FAILED):
+            return f"{READ_BACK_TEXT} {read_back}"
+        state = status
+
+    return PROGRESS_TEXT.get(state, f"{FAILED_TEXT} ({state})")
@@ -0,0 +1,182 @@
+'''
+A low-overhead diagnostic log for the device protocol, kept in memory.
+
+Records are stored unformatted in a fixed-size ring buffer, so logging
+from transfer loops costs a level comparison and an append, and nothing
+is written anywhere until the log is dumped on demand. Appending to a
+bounded deque is atomic, so worker threads log without taking a lock.
+'''
+# Import Required Modules
+import collections
+import sys
+import threading
+import time
+
+# Used for type hinting
+from typing import Any, TextIO
+
+# Log levels, records below the log's level are discarded
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+}
+DEFAULT_LEVEL = INFO
+
+# Number of records kept, older records are overwritten
+LOG_CAPACITY = 4096
+
+# String Constants
+EMPTY_STRING = ""
+NEWLINE = "\n"
+FIELD_SEPARATOR = " "
+
+# File handling Modes
+WRITE_MODE = 'w'
+
+
+class ProtocolLog:
+    '''
+    Stores structured log records in a ring buffer. Each record holds the
+    time it was logged, its level, the thread logging it, an event
+    description, and named fields, which are only formatted when dumped.
+
+    Parameters:
+        capacity (int): Number of records kept
+        level (int): Minimum level of the records kept
+    '''
+    def __init__(
+            self,
+            capacity: int = LOG_CAPACITY,
+            level: int = DEFAULT_LEVEL,
+    ) -> None:
+        ''' Initialises an empty log '''
+        self._records = collections.deque(maxlen=capacity)
+        self._level = level
+
+    def get_level(self) -> int:
+        ''' Returns the minimum level of the records kept '''
+        return self._level
+
+    def set_level(self, level: int) -> None:
+        ''' Sets the minimum level of the records kept '''
+        self._level = level
+
+    def is_enabled(self, level: int) -> bool:
+        '''
+        Returns True if records of the given level are kept. Loops can
+        check this before preparing costly fields.
+        '''
+        return (level >= self._level)
+
+    def log(self, level: int, event: str, **fields: Any) -> None:
+        '''
+        Adds a record to the log, if its level is enabled.
+
+        Parameters:
+            level (int): Level of the record
+            event (str): Description of what happened
+            fields (Any): Values describing the event, formatted with
+                repr() when dumped
+        '''
+        if (level < self._level):
+            return
+        self._records.append((
+            time.monotonic(),
+            level,
+            threading.current_thread().name,
+            event,
+            fields,
+        ))
+
+    def debug(self, event: str, **fields: Any) -> None:
+        ''' Adds a DEBUG record, see log() '''
+        self.log(DEBUG, event, **fields)
+
+    def info(self, event: str, **fields: Any) -> None:
+        ''' Adds an INFO record, see log() '''
+        self.log(INFO, event, **fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        ''' Adds a WARNING record, see log() '''
+        self.log(WARNING, event, **fields)
+
+    def error(self, event: str, **fields: Any) -> None:
+        ''' Adds an ERROR record, see log() '''
+        self.log(ERROR, event, **fields)
+
+    def get_records(self) -> list[tuple]:
+        '''
+        Returns every record kept, oldest first, as tuples of time
+        (time.monotonic()), level, thread name, event, and fields.
+        '''
+        return list(self._records.copy())
+
+    def clear(self) -> None:
+        ''' Discards every record '''
+        self._records.clear()
+
+    def dump(self, file: TextIO | None = None) -> int:
+        '''
+        Writes every record kept to a file, one line per record.
+
+        Parameters:
+            file (TextIO): File to write to, or None for stderr
+
+        Returns:
+            (int): Number of records written
+        '''
+        if (file is None):
+            file = sys.stderr
+
+        records = self.get_records()
+        file.write(EMPTY_STRING.join(
+            format_record(record) + NEWLINE for record in records
+        ))
+        file.flush()
+        return len(records)
+
+    def dump_to_path(self, path: str) -> int:
+        '''
+        Writes every record kept to the file at path, see dump().
+        '''
+        with open(path, WRITE_MODE) as file:
+            return self.dump(file)
+
+
+def format_record(record: tuple) -> str:
+    '''
+    Formats a log record as a line of text, its time, level, thread and
+    event followed by each field as name=value.
+    '''
+    logged, level, thread, event, fields = record
+    parts = [
+        f"{logged:.6f}",
+        LEVEL_NAMES.get(level, str(level)),
+        f"[{thread}]",
+        event,
+    ]
+    parts.extend(f"{name}={value!r}" for name, value in fields.items())
+    return FIELD_SEPARATOR.join(parts)
+
+
+def parse_level(name: str) -> int:
+    '''
+    Returns the log level with the given name (e.g. "debug").
+
+    Raises:
+        ValueError: If no level has that name
+    '''
+    for level, level_name in LEVEL_NAMES.items():
+        if (level_name == name.upper()):
+            return level
+    raise ValueError(f"Unknown log level: {name}")
+
+
+# Log shared by every protocol instance
+PROTOCOL_LOG = ProtocolLog()
@@ -0,0 +1,394 @@
+'''
+Records every byte written to and read from a serial connection into a
+compact binary session log, and replays session logs through the protocol
+code without hardware.
+
+Print a recorded session with:
+    python -m GUI.serial_recorder <session log>
+'''
+# Import Required Modules
+import argparse
+import struct
+import time
+import serial
+
+# Used for type hinting
+from typing import Callable
+
+# Session log layout:
+#   Header: SESSION_LOG_MAGIC | version (1 byte) | baud rate (4 bytes)
+#   Records: event (1 byte) | microseconds since the previous record
+#   (4 bytes) | data length (2 bytes) | data
+# All values are big endian. Data longer than MAX_RECORD_DATA is split
+# over several records, the rest of which are recorded 0 microseconds
+# after the first.
+SESSION_LOG_MAGIC = b"TPSL"
+SESSION_LOG_VERSION = 1
+SESSION_LOG_EXTENSION = ".tpsl"
+HEADER_FORMAT = ">BI"
+RECORD_FORMAT = ">cIH"
+MAX_RECORD_DATA = 0xFFFF
+MAX_RECORD_DELAY = 0xFFFFFFFF
+MICROSECONDS_PER_SECOND = 1_000_000
+
+# Session log events. Baud rate changes hold the new rate (4 bytes).
+EVENT_WRITE = b'W'
+EVENT_READ = b'R'
+EVENT_BAUD_RATE = b'B'
+BAUD_RATE_FORMAT = ">I"
+
+# Names printed for each event
+EVENT_NAMES = {
+    EVENT_WRITE: "write",
+    EVENT_READ: "read",
+    EVENT_BAUD_RATE: "baud",
+}
+
+# File handling Modes
+WRITE_BINARY_MODE = "wb"
+READ_BINARY_MODE = "rb"
+
+# Serial communication read timeout (in seconds), see GUI/device_protocol.py
+READ_TIMEOUT = 0.1
+
+NEWLINE_BYTE = b"\n"
+
+
+class ReplayMismatch(Exception):
+    ''' Raised when the protocol writes something the session did not '''
+
+
+class SerialRecorder:
+    '''
+    Wraps an open serial connection, recording every byte written and
+    read (with monotonic timestamps) to a session log. Used in place of
+    the connection it wraps.
+
+    Parameters:
+        connection (serial.Serial): Open serial connection to record
+        path (str): Path to write the session log to
+    '''
+    def __init__(self, connection: serial.Serial, path: str) -> None:
+        ''' Opens the session log, and writes its header '''
+        self._connection = connection
+        self._log = open(path, WRITE_BINARY_MODE)
+        self._log.write(SESSION_LOG_MAGIC)
+        self._log.write(
+            struct.pack(
+                HEADER_FORMAT,
+                SESSION_LOG_VERSION,
+                connection.baudrate,
+            )
+        )
+        self._last_record = time.monotonic()
+
+    @property
+    def timeout(self) -> float | None:
+        ''' Read timeout of the wrapped connection (in seconds) '''
+        return self._connection.timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float | None) -> None:
+        self._connection.timeout = timeout
+
+    @property
+    def baudrate(self) -> int:
+        ''' Baud rate of the wrapped connection '''
+        return self._connection.baudrate
+
+    @baudrate.setter
+    def baudrate(self, rate: int) -> None:
+        self._connection.baudrate = rate
+        self._record(EVENT_BAUD_RATE, struct.pack(BAUD_RATE_FORMAT, rate))
+
+    @property
+    def in_waiting(self) -> int:
+        ''' Number of received bytes waiting to be read '''
+        return self._connection.in_waiting
+
+    def write(self, data: bytes) -> int | None:
+        ''' Writes data to the connection, recording it '''
+        self._record(EVENT_WRITE, data)
+        return self._connection.write(data)
+
+    def read(self, size: int = 1) -> bytes:
+        ''' Reads up to size bytes from the connection, recording them '''
+        data = self._connection.read(size)
+        self._record(EVENT_READ, data)
+        return data
+
+    def readline(self) -> bytes:
+        ''' Reads a line from the connection, recording it '''
+        data = self._connection.readline()
+        self._record(EVENT_READ, data)
+        return data
+
+    def flush(self) -> None:
+        ''' Waits until all written data has been sent '''
+        self._connection.flush()
+
+    def reset_input_buffer(self) -> None:
+        ''' Discards received data that has not been read '''
+        self._connection.reset_input_buffer()
+
+    def cancel_read(self) -> None:
+        ''' Interrupts a blocking read, from another thread '''
+        self._connection.cancel_read()
+
+    def close(self) -> None:
+        ''' Closes the connection, and the session log '''
+        try:
+            self._connection.close()
+        finally:
+            self._log.close()
+
+    def _record(self, event: bytes, data: bytes) -> None:
+        '''
+        Appends data to the session log. Reads that timed out without
+        data are not recorded.
+        '''
+        if (not data) or (self._log.closed):
+            return
+
+        now = time.monotonic()
+        delay = round((now - self._last_record) * MICROSECONDS_PER_SECOND)
+        self._last_record = now
+
+        for index in range(0, len(data), MAX_RECORD_DATA):
+            chunk = data[index:index + MAX_RECORD_DATA]
+            self._log.write(
+                struct.pack(
+                    RECORD_FORMAT,
+                    event,
+                    min(delay, MAX_RECORD_DELAY),
+                    len(chunk),
+                )
+            )
+            self._log.write(chunk)
+            delay = 0
+
+
+class ReplaySerial:
+    '''
+    Stands in for a serial connection, replaying a recorded session.
+
+    Writes must match the writes recorded, in order. Bytes the device sent
+    become readable once every write recorded before them has been made.
+    In real time, they also wait for as long after that write as they did
+    when recorded, reproducing the device's latency.
+
+    Parameters:
+        path (str): Path of the session log to replay
+        realtime (bool): Reproduce the recorded device timing
+    '''
+    def __init__(self, path: str, realtime: bool = False) -> None:
+        ''' Loads the session log '''
+        self._baud_rate, self._events = read_session_log(path)
+        self._realtime = realtime
+        self._index = 0
+        self._available = bytearray()
+
+        # Recorded and replayed time of the latest write
+        self._write_time = 0.0
+        self._written_at = time.monotonic()
+
+        self.timeout = READ_TIMEOUT
+
+    @property
+    def baudrate(self) -> int:
+        ''' Baud rate of the replayed connection '''
+        return self._baud_rate
+
+    @baudrate.setter
+    def baudrate(self, rate: int) -> None:
+        self._baud_rate = rate
+
+    @property
+    def in_waiting(self) -> int:
+        ''' Number of replayed bytes waiting to be read '''
+        self._release()
+        return len(self._available)
+
+    def is_finished(self) -> bool:
+        ''' Returns True once every recorded event has been replayed '''
+        self._release()
+        return (self._index == len(self._events)) and (not self._available)
+
+    def write(self, data: bytes) -> int:
+        '''
+        Matches data against the next recorded write.
+
+        Raises:
+            ReplayMismatch: If data differs from the write recorded
+        '''
+        self._release(force=True)
+        self._skip_baud_rate_changes()
+
+        if (self._index == len(self._events)):
+            raise ReplayMismatch(f"Unrecorded write: {bytes(data)!r}")
+
+        timestamp, event, recorded = self._events[self._index]
+        if (event != EVENT_WRITE) or (recorded != data):
+            raise ReplayMismatch(
+                f"Expected {EVENT_NAMES[event]} of {recorded!r}, "
+                f"got write of {bytes(data)!r}"
+            )
+
+        self._index += 1
+        self._write_time = timestamp
+        self._written_at = time.monotonic()
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        ''' Reads up to size replayed bytes, waiting up to the timeout '''
+        self._wait_until(lambda: len(self._available) >= size)
+        return self._take(min(size, len(self._available)))
+
+    def readline(self) -> bytes:
+        ''' Reads a replayed line, waiting up to the timeout '''
+        self._wait_until(lambda: NEWLINE_BYTE in self._available)
+        if (NEWLINE_BYTE in self._available):
+            return self._take(self._available.index(NEWLINE_BYTE) + 1)
+        return self._take(len(self._available))
+
+    def flush(self) -> None:
+        ''' Replayed writes are never buffered '''
+
+    def reset_input_buffer(self) -> None:
+        ''' Discarded bytes were never recorded, so nothing is discarded '''
+
+    def close(self) -> None:
+        ''' Nothing to close '''
+
+    def _take(self, size: int) -> bytes:
+        ''' Removes and returns size bytes from the replayed bytes '''
+        data = bytes(self._available[:size])
+        del self._available[:size]
+        return data
+
+    def _skip_baud_rate_changes(self) -> None:
+        ''' Skips recorded baud rate changes, the protocol makes its own '''
+        while (self._index < len(self._events)):
+            if (self._events[self._index][1] != EVENT_BAUD_RATE):
+                break
+            self._index += 1
+
+    def _read_due(self) -> float | None:
+        '''
+        Returns the time.monotonic() value the next recorded read becomes
+        readable at, or None if a write must be made first.
+        '''
+        self._skip_baud_rate_changes()
+        if (self._index == len(self._events)):
+            return None
+
+        timestamp, event, _ = self._events[self._index]
+        if (event != EVENT_READ):
+            return None
+        if (not self._realtime):
+            return self._written_at
+        return self._written_at + (timestamp - self._write_time)
+
+    def _release(self, force: bool = False) -> None:
+        '''
+        Makes recorded reads that are due readable.
+
+        Parameters:
+            force (bool): Release reads before the next write, due or not
+        '''
+        while True:
+            due = self._read_due()
+            if (due is None):
+                return
+            if (not force) and (due > time.monotonic()):
+                return
+            self._available.extend(self._events[self._index][2])
+            self._index += 1
+
+    def _wait_until(self, ready: Callable[[], bool]) -> None:
+        '''
+        Releases recorded reads until ready() is True, or the timeout
+        passes, as a real connection would block.
+        '''
+        deadline = time.monotonic() + (self.timeout or 0)
+        while True:
+            self._release()
+            if (ready()):
+                return
+
+            now = time.monotonic()
+            due = self._read_due()
+            if (due is None) or (due > deadline):
+                time.sleep(max(deadline - now, 0))
+                return
+            time.sleep(max(due - now, 0))
+
+
+def read_session_log(
+        path: str,
+) -> tuple[int, list[tuple[float, bytes, bytes]]]:
+    '''
+    Reads a session log, joining data that was split over several records.
+
+    Parameters:
+        path (str): Path of the session log
+
+    Returns:
+        (tuple): Initial baud rate, and the recorded events, as tuples of
+        (seconds since the session started, event, data)
+    '''
+    with open(path, READ_BINARY_MODE) as file:
+        data = file.read()
+
+    if (not data.startswith(SESSION_LOG_MAGIC)):
+        raise ValueError(f"{path} is not a session log")
+
+    index = len(SESSION_LOG_MAGIC)
+    version, baud_rate = struct.unpack_from(HEADER_FORMAT, data, index)
+    if (version != SESSION_LOG_VERSION):
+        raise ValueError(f"Unsupported session log version {version}")
+    index += struct.calcsize(HEADER_FORMAT)
+
+    events = []
+    timestamp = 0.0
+    record_size = struct.calcsize(RECORD_FORMAT)
+    while (index + record_size <= len(data)):
+        event, delay, length = struct.unpack_from(RECORD_FORMAT, data, index)
+        index += record_size
+        chunk = data[index:index + length]
+        index += length
+
+        # Split records continue the previous event
+        if (events) and (delay == 0) and (events[-1][1] == event) and (
+                len(events[-1][2]) % MAX_RECORD_DATA == 0):
+            events[-1] = (timestamp, event, events[-1][2] + chunk)
+            continue
+
+        timestamp += delay / MICROSECONDS_PER_SECOND
+        events.append((timestamp, event, chunk))
+
+    return (baud_rate, events)
+
+
+def main() -> None:
+    ''' Prints each event of a recorded session '''
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    baud_rate, events = read_session_log(args.path)
+    print(f"Baud rate: {baud_rate}")
+
+    previous = 0.0
+    for timestamp, event, data in events:
+        if (event == EVENT_BAUD_RATE):
+            data = struct.unpack(BAUD_RATE_FORMAT, data)[0]
+        print(
+            f"{timestamp:10.6f} +{timestamp - previous:9.6f} "
+            f"{EVENT_NAMES[event]:>5} {data!r}"
+        )
+        previous = timestamp
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,459 @@
+# Import Pyside6 Modules
+from PySide6.QtCore import (
+    QObject,
+    Signal,
+)
+
+# Import protocol implementation
+from GUI.device_protocol import (
+    DeviceProtocol,
+    TransferTimings,
+    file_from_device_exit_status,
+    write_file_atomically,
+)
+from GUI.device_discovery import discover_devices
+from GUI.fleet_upload import push_timing_windows, upload_to_ports
+from GUI.serial_recorder import SESSION_LOG_EXTENSION
+from GUI.cancellation import CancellationToken, TransferCancelled
+from GUI.protocol_log import PROTOCOL_LOG
+from GUI.device_snapshot import (
+    DeviceSnapshot,
+    SnapshotCache,
+    identify_device,
+    read_snapshot,
+)
+
+# Import Additional Modules
+import os
+import queue
+import threading
+import time
+
+# Used for type hinting
+from typing import Any, Callable
+
+# Process Exit Codes
+STATUS_SUCCESS = 0
+STATUS_DEVICE_NOT_CONNECTED = 1
+STATUS_CANCELLED = 17
+
+# Device commands that only read from the device, and so leave its
+# cached snapshot valid. Every other command may write to the device.
+READ_ONLY_COMMANDS = (
+    identify_device,
+    read_snapshot,
+    DeviceProtocol.get_file_from_device,
+    DeviceProtocol.request_timing_windows,
+    DeviceProtocol.identify,
+)
+
+# Sentinel queued to stop the service
+STOP_COMMAND = None
+
+# Session logs are named after the port, and the time it was opened
+SESSION_LOG_TIME_FORMAT = "%Y%m%d-%H%M%S"
+
+
+class SerialService(QObject):
+    '''
+    The SerialService class owns the serial connection to the device,
+    and runs queued device commands back to back in its own thread.
+    Unlike GenericWorker tasks, the thread lives for the whole session.
+
+    As only the service thread ever touches the serial connection,
+    commands from multiple button presses can never interleave on
+    the port. Results are delivered to the main GUI thread via signals.
+
+    It inherits from QObject to use signals and slots.
+
+    Parameters:
+        log_directory (str): Directory to record each serial session to,
+            or None to not record sessions
+    '''
+    # Signals for communicating with the main GUI thread.
+    # Results are emitted alongside the callback that should handle them,
+    # after the phase timings of commands that are timed. Commands run on
+    # several devices emit the progress of each device as it changes.
+    result = Signal(object, object)
+    timings = Signal(TransferTimings)
+    device_progress = Signal(str, object)
+    error = Signal(Exception)
+
+    def __init__(self, log_directory: str | None = None) -> None:
+        ''' Initialises an idle service, with no open connection '''
+        super().__init__()
+        self._log_directory = log_directory
+        self._queue = queue.Queue()
+        self._protocol: DeviceProtocol | None = None
+        self._port = None
+        self._busy = False
+
+        # Contents read from each device, and the identity of the device
+        # on the open connection (identified when first read from)
+        self._cache = SnapshotCache()
+        self._identity = None
+        self._identified = False
+
+        # Cancels the running command (or the next one, if it is starting),
+        # replaced once each command has run. Guarded by the lock, along
+        # with the number of commands queued or running.
+        self._lock = threading.Lock()
+        self._cancel_token = CancellationToken()
+        self._pending = 0
+        self._thread = threading.Thread(
+            target=self.run,
+            name="SerialService",
+            daemon=True,
+        )
+
+    def get_protocol(self) -> DeviceProtocol | None:
+        '''
+        Returns the protocol over the open serial connection (if connected),
+        else returns None. Only safe to use from the service thread.
+        '''
+        return self._protocol
+
+    def is_busy(self) -> bool:
+        ''' Returns True if a command is running or waiting to run '''
+        return self._busy or (not self._queue.empty())
+
+    def submit(
+            self,
+            function: Callable[..., Any],
+            *args: Any,
+            callback: Callable[[Any], None],
+    ) -> None:
+        '''
+        Queues a device command. The function is called on the service
+        thread with the DeviceProtocol as its first argument, followed
+        by args. Its return value is passed to callback on the GUI thread.
+
+        If no device is connected, callback receives
+        STATUS_DEVICE_NOT_CONNECTED instead.
+        '''
+        self._put((self._run_device_command, (function, args), callback))
+
+    def open_port(
+            self,
+            port: str,
+            callback: Callable[[Any], None],
+    ) -> None:
+        '''
+        Queues opening a new serial connection on the given port,
+        closing any existing connection first.
+        '''
+        self._put((self._open, (port,), callback))
+
+    def close_port(self, callback: Callable[[Any], None]) -> None:
+        ''' Queues closing the current serial connection (if any) '''
+        self._put((self._close, (), callback))
+
+    def upload_to_ports(
+            self,
+            ports: list[str],
+            code: str,
+            parameters: list,
+            beats: list[str],
+            callback: Callable[[Any], None],
+    ) -> None:
+        '''
+        Queues uploading a sequence to several devices concurrently, one
+        worker per port. The open connection is reused for its own port.
+        Callback receives the result of each upload, by port.
+        '''
+        self._put((
+            self._run_on_ports,
+            (upload_to_ports, ports, code, parameters, beats),
+            callback,
+        ))
+
+    def push_timing_windows(
+            self,
+            ports: list[str],
+            windows: tuple,
+            callback: Callable[[Any], None],
+    ) -> None:
+        '''
+        Queues saving timing windows to several devices concurrently, and
+        reading them back to verify them. Callback receives the exit
+        status and windows read back from each device, by port.
+        '''
+        self._put((
+            self._run_on_ports,
+            (push_timing_windows, ports, windows),
+            callback,
+        ))
+
+    def read_from_device(
+            self,
+            codes: tuple,
+            callback: Callable[[Any], None],
+            refresh: bool = False,
+    ) -> None:
+        '''
+        Queues reading parts of the connected device's contents, in one
+        session. Parts already read are served from the cache, unless
+        refresh is True. Callback receives the exit status and the
+        DeviceSnapshot, or STATUS_DEVICE_NOT_CONNECTED.
+
+        Parameters:
+            codes (tuple): Codes of the parts to read, see
+                GUI.device_snapshot.SNAPSHOT_PARTS
+            callback (Callable): Called with the result on the GUI thread
+            refresh (bool): Re-read the parts given from the device
+        '''
+        self._put((self._read_snapshot, (codes, refresh), callback))
+
+    def save_sequence_file(
+            self,
+            code: str,
+            path: str,
+            callback: Callable[[Any], None],
+    ) -> None:
+        '''
+        Queues saving a sequence stored on the connected device to a file,
+        reading it from the device only if it is not cached. Callback
+        receives the exit status, as for get_file_from_device().
+        '''
+        self._put((self._save_sequence_file, (code, path), callback))
+
+    def discover(self, callback: Callable[[Any], None]) -> None:
+        '''
+        Queues closing the current serial connection (if any), then
+        probing every serial port for tpmania devices. Callback receives
+        the list of DiscoveredDevice found.
+        '''
+        self._put((self._discover, (), callback))
+
+    def cancel(self, discard_queued: bool = False) -> None:
+        '''
+        Cancels the running device command, which stops within
+        milliseconds, freeing the port. Its callback receives
+        STATUS_CANCELLED. If no command is running yet, the next queued
+        command is cancelled instead, and if none is queued nothing is.
+
+        Parameters:
+            discard_queued (bool): Also discard commands waiting to run,
+                without calling their callbacks
+        '''
+        with self._lock:
+            if (discard_queued):
+                try:
+                    while True:
+                        command = self._queue.get_nowait()
+                        if (command is STOP_COMMAND):
+                            self._queue.put(STOP_COMMAND)
+                            break
+                        self._pending -= 1
+                except queue.Empty:
+                    pass
+
+            # Cancelling while idle must not cancel the next command
+            if (self._pending > 0):
+                self._cancel_token.cancel()
+
+    def start(self) -> None:
+        ''' Starts the service thread '''
+        self._thread.start()
+
+    def stop(self) -> None:
+        '''
+        Stops the service once all queued commands have run,
+        closing the serial connection.
+        '''
+        self._put(STOP_COMMAND)
+
+    def wait(self, timeout: float) -> bool:
+        '''
+        Waits for the service thread to exit.
+
+        Parameters:
+            timeout (float): Maximum time to wait (in seconds)
+
+        Returns:
+            (bool): True if the thread exited
+        '''
+        self._thread.join(timeout)
+        return (not self._thread.is_alive())
+
+    def run(self) -> None:
+        ''' Runs queued commands one after another, until stopped '''
+        while True:
+            command = self._queue.get()
+            if (command is STOP_COMMAND):
+                break
+
+            function, args, callback = command
+            self._busy = True
+            try:
+                self.result.emit(callback, function(*args))
+            except Exception as error:
+                self.error.emit(error)
+                PROTOCOL_LOG.error(
+                    "Command failed",
+                    command=function.__name__,
+                    error=error,
+                )
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    self._cancel_token = CancellationToken()
+                self._busy = False
+
+        self._close()
+
+    def _put(self, command: tuple | None) -> None:
+        ''' Queues a command, counting it until it has run '''
+        with self._lock:
+            self._pending += 1
+            self._queue.put(command)
+
+    def _run_device_command(
+            self,
+            function: Callable[..., Any],
+            args: tuple[Any, ...],
+    ) -> Any:
+        '''
+        Runs a device command against the open connection, emitting its
+        phase timings if it was timed.
+        '''
+        if (self._protocol is None):
+            return STATUS_DEVICE_NOT_CONNECTED
+
+        # Even a failed write may have changed the device's contents
+        if (function not in READ_ONLY_COMMANDS):
+            self._cache.invalidate(self._port)
+
+        self._protocol.set_timings(None)
+        self._protocol.set_cancel_token(self._cancel_token)
+        try:
+            value = function(self._protocol, *args)
+        except TransferCancelled:
+            self._discard_input()
+            value = STATUS_CANCELLED
+        finally:
+            self._protocol.set_cancel_token(None)
+
+        timings = self._protocol.get_timings()
+        if (timings is not None):
+            self.timings.emit(timings)
+        return value
+
+    def _open(self, port: str) -> None:
+        ''' Opens a serial connection on port, and negotiates baud rate '''
+        self._close()
+
+        log_path = None
+        if (self._log_directory is not None):
+            name = os.path.basename(port)
+            opened = time.strftime(SESSION_LOG_TIME_FORMAT)
+            log_path = os.path.join(
+                self._log_directory,
+                f"{name}-{opened}{SESSION_LOG_EXTENSION}",
+            )
+
+        # Another device may have been plugged in since the port was open
+        self._cache.invalidate(port)
+        self._protocol = DeviceProtocol.open(port, log_path)
+        self._port = port
+
+    def _read_snapshot(
+            self,
+            codes: tuple,
+            refresh: bool,
+    ) -> tuple[int, DeviceSnapshot] | int:
+        '''
+        Reads the parts of the open device's snapshot that are not cached.
+        The device is identified on the first read after it is opened, as
+        a device command of its own, so it is timed and can be cancelled.
+        '''
+        if (self._protocol is None):
+            return STATUS_DEVICE_NOT_CONNECTED
+
+        if (not self._identified):
+            result = self._run_device_command(identify_device, (self._port,))
+            if (not isinstance(result, tuple)):
+                return result
+            self._identity = result[1]
+            self._identified = True
+
+        snapshot = self._cache.get(self._port, self._identity)
+        if (refresh):
+            for code in codes:
+                snapshot.discard_part(code)
+        if (len(snapshot.get_missing_parts(codes)) == 0):
+            return (STATUS_SUCCESS, snapshot)
+
+        status = self._run_device_command(read_snapshot, (snapshot, codes))
+        return (status, snapshot)
+
+    def _save_sequence_file(self, code: str, path: str) -> int:
+        ''' Saves a sequence read from the open device to a file '''
+        result = self._read_snapshot((code,), False)
+        if (not isinstance(result, tuple)):
+            return result
+
+        status, snapshot = result
+        contents = snapshot.get_part(code)
+        if (contents is None):
+            return status
+
+        write_file_atomically(path, contents)
+        return file_from_device_exit_status(code)
+
+    def _run_on_ports(
+            self,
+            function: Callable[..., dict[str, Any]],
+            ports: list[str],
+            *args: Any,
+    ) -> dict[str, Any]:
+        '''
+        Runs a GUI.fleet_upload function on several devices, reusing the
+        open connection for its own port, and reporting progress.
+        '''
+        # Commands on several devices all write to them
+        for port in ports:
+            self._cache.invalidate(port)
+
+        protocols = {}
+        if (self._protocol is not None):
+            protocols[self._port] = self._protocol
+
+        try:
+            return function(
+                ports,
+                *args,
+                protocols=protocols,
+                progress=self.device_progress.emit,
+                cancel_token=self._cancel_token,
+            )
+        finally:
+            if (self._protocol is not None):
+                self._protocol.set_cancel_token(None)
+                if (self._cancel_token.is_cancelled()):
+                    self._discard_input()
+
+    def _discard_input(self) -> None:
+        '''
+        Discards replies to a cancelled command, so they are not mistaken
+        for replies to the next command.
+        '''
+        try:
+            self._protocol.get_connection().reset_input_buffer()
+        except Exception as error:
+            PROTOCOL_LOG.warning("Input not discarded", error=error)
+
+    def _discover(self) -> list:
+        ''' Closes the serial connection, and probes for devices '''
+        self._close()
+        return discover_devices()
+
+    def _close(self) -> None:
+        ''' Closes the serial connection, if one is open '''
+        if (self._protocol is not None):
+            self._protocol.close()
+            self._cache.invalidate(self._port)
+            self._protocol = None
+            self._port = None
+            self._identity = None
+            self._identified = False
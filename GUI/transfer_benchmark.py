@@ -0,0 +1,343 @@
+'''
+Benchmarks sequence uploads and downloads against an emulated device,
+printing one JSON object per case to stdout.
+
+Run with:
+    python -m GUI.transfer_benchmark [--sizes 16 300] [--repeat N] ...
+'''
+# Import Required Modules
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+import serial
+
+# Used for type hinting
+from typing import Any, Callable
+
+# Import device protocol and emulator
+from GUI.device_protocol import (
+    DeviceProtocol,
+    BAUD_RATE,
+    READ_TIMEOUT,
+    WRITE_TIMEOUT,
+)
+from GUI.device_emulator import (
+    VirtualDevice,
+    DEFAULT_EEPROM_WRITE_DELAY,
+    DEFAULT_LATENCY,
+)
+from GUI.sequence_class import Sequence
+
+# Sequence file constants
+BUFFER = "---"
+BAR_DIVIDER = ","
+FILE_END = ";"
+MAX_BEATS = 300
+FULL_BEATS = 4
+HALF_BEATS = 8
+
+# Serial communication indicator characters
+SQ_TO_RAM_CHAR = 'S'
+SQ_TO_EEPROM_CHAR = 'E'
+SQ_TO_BOTH_CHAR = 'B'
+LOAD_SQ_FROM_RAM_CODE = 'R'
+LOAD_SQ_FROM_EEPROM_CODE = 'N'
+
+# Upload locations, and the codes used to download them again
+SAVE_LOCATIONS = {
+    "RAM": (SQ_TO_RAM_CHAR, (LOAD_SQ_FROM_RAM_CODE,)),
+    "EEPROM": (SQ_TO_EEPROM_CHAR, (LOAD_SQ_FROM_EEPROM_CODE,)),
+    "Both": (
+        SQ_TO_BOTH_CHAR,
+        (LOAD_SQ_FROM_RAM_CODE, LOAD_SQ_FROM_EEPROM_CODE),
+    ),
+}
+
+# Benchmark defaults
+DEFAULT_SIZES = (16, 64, 150, MAX_BEATS)
+DEFAULT_REPEAT = 1
+AUDIO_LENGTH_TEXT = "0:00"
+
+# Lane patterns cycled through by generated beats
+BEAT_PATTERNS = (
+    "1000",
+    "0000",
+    "0100",
+    "0000",
+    "0010",
+    "0001",
+    "0000",
+    "1001",
+)
+
+# Other Constants
+WRITE_MODE = 'w'
+SEQUENCE_EXTENSION = ".tsq"
+
+
+class CountingSerial(serial.Serial):
+    ''' A serial connection that counts bytes sent and received '''
+    def __init__(self, *args, **kwargs) -> None:
+        ''' Opens the connection, with zeroed byte counters '''
+        self.bytes_written = 0
+        self.bytes_read = 0
+        super().__init__(*args, **kwargs)
+
+    def write(self, data: bytes) -> int | None:
+        ''' Writes data, counting bytes sent '''
+        self.bytes_written += len(data)
+        return super().write(data)
+
+    def read(self, size: int = 1) -> bytes:
+        ''' Reads data, counting bytes received '''
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class InstrumentedProtocol(DeviceProtocol):
+    ''' A device protocol that records how long each handshake waited '''
+    def __init__(self, connection: CountingSerial) -> None:
+        ''' Initialises the protocol, with no recorded handshakes '''
+        super().__init__(connection)
+        self.handshakes = []
+
+    def wait_for_response(self, code: str, *args, **kwargs) -> int:
+        ''' Waits for response code from device, recording the wait '''
+        start = time.perf_counter()
+        status = super().wait_for_response(code, *args, **kwargs)
+        self.handshakes.append(time.perf_counter() - start)
+        return status
+
+    def wait_for_acknowledgement(self, acknowledged: int) -> int | None:
+        ''' Waits for an acknowledgement, recording the wait '''
+        start = time.perf_counter()
+        count = super().wait_for_acknowledgement(acknowledged)
+        self.handshakes.append(time.perf_counter() - start)
+        return count
+
+    def reset_counters(self) -> None:
+        ''' Clears recorded handshakes and byte counters '''
+        self.handshakes = []
+        self.get_connection().bytes_written = 0
+        self.get_connection().bytes_read = 0
+
+
+def write_sequence_file(path: str, beats: int, beats_per_bar: int) -> None:
+    '''
+    Writes a .tsq sequence file with generated beats.
+
+    Parameters:
+        path (str): Path to write the sequence file to
+        beats (int): Number of beats the device should receive
+        beats_per_bar (int): FULL_BEATS or HALF_BEATS
+    '''
+    # Half beat files hold two lines for every beat sent
+    lines = beats * beats_per_bar // FULL_BEATS
+    with open(path, WRITE_MODE) as file:
+        file.write(
+            "Name: Benchmark\n"
+            "Artist: tpmania\n"
+            "BPM: 120\n"
+            "Difficulty: Normal\n"
+            "Offset: 0\n"
+            f"{BUFFER}\n"
+        )
+        for line in range(lines):
+            if (line != 0) and (line % beats_per_bar == 0):
+                file.write(f"{BAR_DIVIDER}\n")
+            file.write(f"{BEAT_PATTERNS[line % len(BEAT_PATTERNS)]}\n")
+        file.write(f"{FILE_END}\n")
+
+
+def load_sequence(path: str) -> tuple[list, list[str]]:
+    '''
+    Parses a sequence file the same way the GUI does before uploading.
+
+    Returns:
+        (tuple): Sequence metadata, and the beat lines to transmit
+    '''
+    sequence = Sequence()
+    sequence.set_sequence_path(path)
+    sequence.parse_sequence()
+
+    return (
+        sequence.get_transfer_parameters(AUDIO_LENGTH_TEXT),
+        sequence.get_transfer_beats(),
+    )
+
+
+def measure(
+        protocol: InstrumentedProtocol,
+        transfer: Callable[..., int],
+        *args: Any,
+) -> dict:
+    '''
+    Runs a single transfer, and measures it.
+
+    Returns:
+        (dict): Exit status, wall time (s), bytes on the wire, handshake
+        latencies (s), and time spent in each protocol phase (s)
+    '''
+    protocol.reset_counters()
+    start = time.perf_counter()
+    status = transfer(*args)
+    wall_time = time.perf_counter() - start
+
+    connection = protocol.get_connection()
+    handshakes = protocol.handshakes
+    timings = protocol.get_timings()
+    return {
+        "status": status,
+        "wall_time": wall_time,
+        "bytes": connection.bytes_written + connection.bytes_read,
+        "handshakes": len(handshakes),
+        "handshake_latency_mean": (
+            sum(handshakes) / len(handshakes) if handshakes else 0.0
+        ),
+        "handshake_latency_max": max(handshakes, default=0.0),
+        "phases": timings.get_phases() if timings else {},
+    }
+
+
+def report(case: dict, result: dict, beats: int) -> None:
+    ''' Prints a benchmark result as a single line of JSON '''
+    wall_time = result["wall_time"]
+    result.update({
+        "beats": beats,
+        "beats_per_second": beats / wall_time if wall_time else 0.0,
+        "bytes_per_second": result["bytes"] / wall_time if wall_time else 0.0,
+    })
+    print(json.dumps({**case, **result}), file=sys.__stdout__, flush=True)
+
+
+def run_benchmarks(args: argparse.Namespace) -> None:
+    '''
+    Uploads each generated sequence to every save location, then
+    downloads it back, reporting each transfer.
+    '''
+    device = VirtualDevice(
+        latency=args.latency,
+        emulate_baud=(not args.no_baud_emulation),
+        eeprom_write_delay=args.eeprom_write_delay,
+        extensions=(not args.legacy),
+    )
+
+    with device, tempfile.TemporaryDirectory() as directory:
+        connection = CountingSerial(
+            device.get_port(),
+            BAUD_RATE,
+            timeout=READ_TIMEOUT,
+            write_timeout=WRITE_TIMEOUT,
+        )
+        protocol = InstrumentedProtocol(connection)
+        if (not args.no_negotiation):
+            protocol.negotiate_baud_rate()
+
+        # Repeated uploads of the same sequence would otherwise only
+        # measure a delta upload sending nothing
+        protocol.set_delta_uploads(args.delta)
+
+        download_path = os.path.join(
+            directory,
+            f"download{SEQUENCE_EXTENSION}",
+        )
+        for beats_per_bar in (FULL_BEATS, HALF_BEATS):
+            for size in args.sizes:
+                path = os.path.join(
+                    directory,
+                    f"{beats_per_bar}_{size}{SEQUENCE_EXTENSION}",
+                )
+                write_sequence_file(path, size, beats_per_bar)
+                parameters, beats = load_sequence(path)
+
+                for location, (code, load_codes) in SAVE_LOCATIONS.items():
+                    for _ in range(args.repeat):
+                        result = measure(
+                            protocol,
+                            protocol.transfer_sequence,
+                            code,
+                            parameters,
+                            beats,
+                        )
+
+                        # Modes are read after the upload, so fallbacks
+                        # are reported under the mode actually used
+                        case = {
+                            "beats_per_bar": beats_per_bar,
+                            "size": size,
+                            "location": location,
+                            "baud_rate": connection.baudrate,
+                            "upload_mode": protocol.get_upload_mode(),
+                            "eeprom_upload_mode": (
+                                protocol.get_eeprom_upload_mode()
+                            ),
+                            "delta_uploads": protocol.get_delta_uploads(),
+                        }
+                        report(
+                            {**case, "direction": "upload"},
+                            result,
+                            len(beats),
+                        )
+
+                        for load_code in load_codes:
+                            result = measure(
+                                protocol,
+                                protocol.get_file_from_device,
+                                load_code,
+                                download_path,
+                            )
+                            report(
+                                {
+                                    **case,
+                                    "direction": "download",
+                                    "load_code": load_code,
+                                },
+                                result,
+                                len(beats),
+                            )
+
+        protocol.close()
+
+
+def main() -> None:
+    ''' Parses command line arguments, and runs the benchmarks '''
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help=f"Beats per sequence (at most {MAX_BEATS})",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument(
+        "--eeprom-write-delay",
+        type=float,
+        default=DEFAULT_EEPROM_WRITE_DELAY,
+    )
+    parser.add_argument("--no-baud-emulation", action="store_true")
+    parser.add_argument("--no-negotiation", action="store_true")
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Measure delta uploads, which send only changes",
+    )
+    args = parser.parse_args()
+
+    if (max(args.sizes) > MAX_BEATS) or (min(args.sizes) <= 0):
+        parser.error(f"sizes must be between 1 and {MAX_BEATS}")
+
+    # Protocol debugging prints go to stderr, keeping stdout machine-readable
+    with contextlib.redirect_stdout(sys.stderr):
+        run_benchmarks(args)
+
+
+if (__name__ == "__main__"):
+    main()